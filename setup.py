@@ -31,6 +31,10 @@ setup(
     package_dir={"": "."},
     py_modules=[],
     install_requires=requirements,
+    extras_require={
+        "fast": ["python-calamine>=0.2.0", "lxml>=4.9.0", "orjson>=3.8.0",
+                 "brotli>=1.0.9", "zstandard>=0.18.0"],
+    },
     python_requires=">=3.11",
     entry_points={
         "console_scripts": [
@@ -5,7 +5,6 @@ from rich.console import Console
 from rich.panel import Panel
 
 from ..services.jira_service import JiraService
-from ..services.excel_service import ExcelService
 from ..config.auth import JiraAuth
 
 console = Console()
@@ -69,6 +68,8 @@ def export(filter: str, jql: str, output: str, verbose: bool):
         # Initialize services
         auth = JiraAuth()
         jira_service = JiraService(auth)
+        # pandas/openpyxl load with the Excel service, so only import it once a command runs
+        from ..services.excel_service import ExcelService
         excel_service = ExcelService()
         
         # Get issues
@@ -6,7 +6,6 @@ from rich.panel import Panel
 from rich.table import Table
 
 from ..services.jira_service import JiraService
-from ..services.excel_service import ExcelService
 from ..config.auth import JiraAuth
 
 console = Console()
@@ -55,6 +54,8 @@ def import_cmd(input_file: str, dry_run: bool, verbose: bool):
         # Initialize services
         auth = JiraAuth()
         jira_service = JiraService(auth)
+        # pandas/openpyxl load with the Excel service, so only import it once a command runs
+        from ..services.excel_service import ExcelService
         excel_service = ExcelService()
         
         if dry_run:
@@ -5,7 +5,6 @@ from rich.console import Console
 from rich.panel import Panel
 
 from ..services.jira_service import JiraService
-from ..services.excel_service import ExcelService
 from ..config.auth import JiraAuth
 
 console = Console()
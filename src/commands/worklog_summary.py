@@ -7,11 +7,8 @@ from rich.panel import Panel
 from rich.table import Table
 
 from ..services.jira_service import JiraService
-from ..services.excel_service import ExcelService
 from ..services.hierarchy_service import HierarchyService, HierarchicalGroup
-from ..services.filter_service import FilterService
 from ..config.auth import JiraAuth
-from decimal import Decimal
 
 console = Console()
 
@@ -121,6 +118,8 @@ def worklog_summary(filter_ids: str, jql: str, output: str, input_file: str, dry
         # Initialize services
         auth = JiraAuth()
         jira_service = JiraService(auth)
+        # pandas/openpyxl load with the Excel service, so only import it once a command runs
+        from ..services.excel_service import ExcelService
         excel_service = ExcelService()
         
         if input_file:
@@ -240,8 +239,7 @@ def worklog_summary(filter_ids: str, jql: str, output: str, input_file: str, dry
                         console.print(f"[cyan]Fetching worklogs from {len(filter_id_list)} filters:[/cyan] {', '.join(filter_id_list)}")
                 
                 # Combine multiple filters
-                filter_service = FilterService(jira_service.auth)
-                combined_jql = filter_service.combine_filters_jql(filter_id_list)
+                combined_jql = jira_service.filter_service.combine_filters_jql(filter_id_list)
                 
                 if not combined_jql:
                     console.print("[red]Failed to combine filters.[/red]")
@@ -250,21 +248,19 @@ def worklog_summary(filter_ids: str, jql: str, output: str, input_file: str, dry
                 if verbose and len(filter_id_list) > 1:
                     console.print(f"[dim]Combined JQL: {combined_jql[:100]}...[/dim]" if len(combined_jql) > 100 else f"[dim]Combined JQL: {combined_jql}[/dim]")
                 
-                worklogs = jira_service.get_worklogs_from_jql(
-                    combined_jql,
-                    include_all_issues=not issues_only,
-                    filter_by_current_user=not all_users,
-                    time_range=time_range.lower() if time_range else None
-                )
+                source_jql = combined_jql
             else:
                 if verbose:
                     console.print(f"[cyan]Fetching worklogs from JQL:[/cyan] {jql}")
-                worklogs = jira_service.get_worklogs_from_jql(
-                    jql,
-                    include_all_issues=not issues_only,
-                    filter_by_current_user=not all_users,
-                    time_range=time_range.lower() if time_range else None
-                )
+                source_jql = jql
+            
+            # Issues (for hierarchy grouping) and their worklogs come from one search
+            all_issues, worklogs = jira_service.get_issues_and_worklogs_from_jql(
+                source_jql,
+                include_all_issues=not issues_only,
+                filter_by_current_user=not all_users,
+                time_range=time_range.lower() if time_range else None
+            )
             
             if not worklogs and issues_only:
                 console.print("[yellow]No worklogs found to export.[/yellow]")
@@ -275,19 +271,6 @@ def worklog_summary(filter_ids: str, jql: str, output: str, input_file: str, dry
                     console.print("[dim]Check your JQL query and ensure issues have worklogs.[/dim]")
                 raise click.Abort()
             
-            # Get issues from the same source for hierarchy grouping
-            if filter_ids:
-                # Parse comma-separated filter IDs
-                filter_id_list = [fid.strip() for fid in filter_ids.split(',') if fid.strip()]
-                filter_service = FilterService(jira_service.auth)
-                combined_jql = filter_service.combine_filters_jql(filter_id_list)
-                if combined_jql:
-                    all_issues = jira_service.get_issues_from_jql(combined_jql)
-                else:
-                    all_issues = []
-            else:
-                all_issues = jira_service.get_issues_from_jql(jql) if jql else []
-            
             # Get issues info for worklogs (if not already fetched)
             issue_keys = list(set([wl.issue_key for wl in worklogs]))
             issues_dict = {}
@@ -330,13 +313,13 @@ def worklog_summary(filter_ids: str, jql: str, output: str, input_file: str, dry
                 sorted_groups = None
             
             # Calculate sum of worklogs for current user
-            total_hours = Decimal("0")
+            total_seconds = 0
             issues_with_time = 0
             issues_without_time = 0
             
             for wl in worklogs:
-                if wl.time_spent_hours > 0:
-                    total_hours += wl.time_spent_hours
+                if wl.time_spent_seconds > 0:
+                    total_seconds += wl.time_spent_seconds
                     issues_with_time += 1
                 else:
                     issues_without_time += 1
@@ -347,7 +330,8 @@ def worklog_summary(filter_ids: str, jql: str, output: str, input_file: str, dry
                 issues_dict, 
                 output,
                 hierarchical_groups=sorted_groups if group_by_hierarchy else None,
-                all_issues=all_issues if group_by_hierarchy else None
+                all_issues=all_issues if group_by_hierarchy else None,
+                parent_to_children=HierarchyService.build_parent_to_children(all_issues) if sorted_groups else None
             )
             
             if success:
@@ -357,7 +341,7 @@ def worklog_summary(filter_ids: str, jql: str, output: str, input_file: str, dry
                     f"Total entries: [green]{len(worklogs)}[/green]",
                     f"  • Issues with worklogs: [cyan]{issues_with_time}[/cyan]",
                     f"  • Issues without worklogs (0 time): [yellow]{issues_without_time}[/yellow]",
-                    f"Total time logged: [green]{float(total_hours):.2f} hours[/green]",
+                    f"Total time logged: [green]{total_seconds / 3600:.2f} hours[/green]",
                 ]
                 
                 if time_range:
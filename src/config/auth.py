@@ -7,21 +7,42 @@ import time
 import threading
 from typing import Optional, Dict, Any
 import requests
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
+from urllib3.util.retry import Retry
 from rich.console import Console
 from rich.panel import Panel
 from rich.syntax import Syntax
 
 from .settings import Settings, get_settings
 
+try:
+    import orjson  # Optional: faster JSON decoding of large responses
+except ImportError:
+    orjson = None
+
 console = Console()
 
+# Keep-alive connection pool shared by all requests (and worker threads) of a session
+HTTP_POOL_SIZE = 16
+
+# Transient statuses retried by the adapter (honouring Retry-After) before surfacing
+RETRY_STATUSES = (429, 502, 503, 504)
+
+# Leading whitespace then '<': an HTML (or XML) body rather than JSON
+_HTML_START_RE = re.compile(rb'\s*<')
+
+# Pause all requests once Jira reports fewer remaining calls than this
+RATE_LIMIT_LOW_REMAINING = 5
+
 
 class RateLimiter:
     """Rate limiter to throttle requests per second.
     
     Thread-safe rate limiter that ensures requests don't exceed
-    a specified rate (requests per second).
+    a specified rate (requests per second). It also backs off when Jira
+    signals throttling (429 or a low X-RateLimit-Remaining), pausing
+    every thread that shares it.
     """
     
     def __init__(self, rate: float = 5.0):
@@ -33,6 +54,7 @@ class RateLimiter:
         self.rate = rate
         self.min_interval = 1.0 / rate  # Minimum time between requests
         self.last_request_time = 0.0
+        self.paused_until = 0.0
         self.lock = threading.Lock()
     
     def wait(self):
@@ -42,6 +64,11 @@ class RateLimiter:
         """
         with self.lock:
             current_time = time.time()
+            if current_time < self.paused_until:
+                # Jira asked us to back off
+                time.sleep(self.paused_until - current_time)
+                current_time = time.time()
+            
             elapsed = current_time - self.last_request_time
             
             if elapsed < self.min_interval:
@@ -50,6 +77,35 @@ class RateLimiter:
                 time.sleep(wait_time)
             
             self.last_request_time = time.time()
+    
+    def observe(self, response: requests.Response):
+        """Back off when a response says the client is being rate limited.
+        
+        A 429, or an X-RateLimit-Remaining below RATE_LIMIT_LOW_REMAINING,
+        pauses subsequent wait() calls for the Retry-After delay (1 second
+        for a 429 without one).
+        
+        Args:
+            response: Response received from Jira
+        """
+        remaining = response.headers.get('X-RateLimit-Remaining')
+        throttled = response.status_code == 429
+        if not throttled and remaining is not None:
+            try:
+                throttled = int(remaining) < RATE_LIMIT_LOW_REMAINING
+            except ValueError:
+                pass
+        if not throttled:
+            return
+        
+        try:
+            delay = float(response.headers.get('Retry-After', ''))
+        except ValueError:
+            # Missing or HTTP-date Retry-After
+            delay = 1.0 if response.status_code == 429 else 0.0
+        if delay > 0:
+            with self.lock:
+                self.paused_until = max(self.paused_until, time.time() + delay)
 
 
 def extract_jira_error_payload(response: requests.Response, request_payload: Optional[Dict[str, Any]] = None, request_method: Optional[str] = None, request_url: Optional[str] = None) -> Dict[str, Any]:
@@ -101,7 +157,7 @@ def extract_jira_error_payload(response: requests.Response, request_payload: Opt
     
     # Check content type
     content_type = response.headers.get('Content-Type', '').lower()
-    is_html = 'text/html' in content_type or response.text.strip().startswith('<')
+    is_html = looks_like_html(response)
     
     result['is_html'] = is_html
     
@@ -283,6 +339,39 @@ def get_server_info_without_auth(jira_url: str, api_version: str = 'latest') ->
         return None
 
 
+def looks_like_html(response: requests.Response) -> bool:
+    """Tell whether a response carries HTML rather than JSON.
+    
+    Checks the Content-Type and the first non-blank byte of the body, without
+    decoding the whole body to text.
+    
+    Args:
+        response: requests.Response object
+        
+    Returns:
+        True if the response is HTML
+    """
+    content_type = response.headers.get('Content-Type', '').lower()
+    return 'text/html' in content_type or bool(_HTML_START_RE.match(response.content or b''))
+
+
+def parse_json_response(response: requests.Response) -> Any:
+    """Decode a JSON response body, using orjson when it is installed.
+    
+    Args:
+        response: requests.Response object
+        
+    Returns:
+        Decoded JSON data
+        
+    Raises:
+        ValueError: If the body is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return json.loads(response.content)
+
+
 def safe_parse_response(response: requests.Response) -> Dict[str, Any]:
     """Safely parse response as JSON, handling HTML responses gracefully.
     
@@ -299,7 +388,7 @@ def safe_parse_response(response: requests.Response) -> Dict[str, Any]:
         ValueError: If response cannot be parsed and is not HTML
     """
     content_type = response.headers.get('Content-Type', '').lower()
-    is_html = 'text/html' in content_type or (response.text and response.text.strip().startswith('<'))
+    is_html = looks_like_html(response)
     
     if is_html:
         # Return HTML response info
@@ -314,8 +403,9 @@ def safe_parse_response(response: requests.Response) -> Dict[str, Any]:
     
     # Try to parse as JSON
     try:
-        if response.text:
-            return response.json()
+        if response.content:
+            # Parse the raw bytes (with orjson when installed)
+            return parse_json_response(response)
         else:
             return {'message': 'Empty response', 'status_code': response.status_code}
     except (ValueError, json.JSONDecodeError) as e:
@@ -341,6 +431,9 @@ class JiraAuth:
         self.settings = settings or get_settings()
         self._session: Optional[requests.Session] = None
         self._rate_limiter: Optional[RateLimiter] = None
+        self._base_url: Optional[str] = None
+        # Caps in-flight requests across all worker pools at the connection pool size
+        self._request_slots = threading.BoundedSemaphore(HTTP_POOL_SIZE)
     
     @property
     def session(self) -> requests.Session:
@@ -372,8 +465,22 @@ class JiraAuth:
                         "Or set JIRA_USE_BEARER_TOKEN=true to use Bearer token authentication (no email needed)."
                     )
             
-            # Create session
+            # Create session with a pooled keep-alive adapter; idempotent requests
+            # are retried on connection errors and transient statuses, and the
+            # last response is returned as-is so callers still see the error payload
             self._session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=HTTP_POOL_SIZE,
+                pool_maxsize=HTTP_POOL_SIZE,
+                max_retries=Retry(
+                    total=3,
+                    backoff_factor=0.2,
+                    status_forcelist=RETRY_STATUSES,
+                    raise_on_status=False
+                )
+            )
+            self._session.mount('https://', adapter)
+            self._session.mount('http://', adapter)
             
             # Configure authentication based on method
             if self.settings.jira_use_bearer_token:
@@ -422,19 +529,22 @@ class JiraAuth:
         According to JIRA REST API docs, 'latest' is the symbolic version
         that resolves to the most recent version supported by the JIRA instance.
         This is the recommended default for compatibility with JIRA 8.5.0+.
+        The URL is derived from settings once and reused by every request.
         """
-        base = self.settings.jira_url.rstrip('/')
-        api_version = 'latest'  # Default to 'latest' per JIRA REST API best practices
-        
-        if self.settings.jira_api_version:
-            api_version = self.settings.jira_api_version.strip()
-        elif self.settings.jira_api_path:
-            # Extract version from path
-            api_path = self.settings.jira_api_path.rstrip('/')
-            if '/api/' in api_path:
-                api_version = api_path.split('/api/')[-1]
-        
-        return f"{base}/rest/api/{api_version}"
+        if self._base_url is None:
+            base = self.settings.jira_url.rstrip('/')
+            api_version = 'latest'  # Default to 'latest' per JIRA REST API best practices
+            
+            if self.settings.jira_api_version:
+                api_version = self.settings.jira_api_version.strip()
+            elif self.settings.jira_api_path:
+                # Extract version from path
+                api_path = self.settings.jira_api_path.rstrip('/')
+                if '/api/' in api_path:
+                    api_version = api_path.split('/api/')[-1]
+            
+            self._base_url = f"{base}/rest/api/{api_version}"
+        return self._base_url
     
     def _make_request(self, method: str, endpoint: str, **kwargs) -> requests.Response:
         """Make HTTP request to JIRA API with rate limiting.
@@ -470,11 +580,13 @@ class JiraAuth:
             else:
                 request_payload = data
         
-        response = self.session.request(method, url, **kwargs)
+        with self._request_slots:
+            response = self.session.request(method, url, **kwargs)
+        self.rate_limiter.observe(response)
         
         # Check if response is HTML even on success codes (common JIRA issue)
         content_type = response.headers.get('Content-Type', '').lower()
-        is_html = 'text/html' in content_type or (response.text and response.text.strip().startswith('<'))
+        is_html = looks_like_html(response)
         
         if is_html and response.status_code >= 200 and response.status_code < 300:
             # HTML response on success code - this is unusual but JIRA sometimes does this
@@ -22,6 +22,9 @@ class Settings(BaseSettings):
     jira_api_version: Optional[str] = os.getenv('JIRA_API_VERSION', None)  # e.g., '1.0', '2', '3', 'latest'
     jira_use_bearer_token: bool = os.getenv('JIRA_USE_BEARER_TOKEN', 'false').lower() in ('true', '1', 'yes', 'on')  # Use Bearer token auth instead of Basic Auth
     jira_rate_limit: float = float(os.getenv('JIRA_RATE_LIMIT', '5.0'))  # Requests per second (default: 5.0)
+    jira_epic_link_field_id: Optional[str] = os.getenv('JIRA_EPIC_LINK_FIELD_ID', None)  # e.g., 'customfield_10014' (skips /field discovery)
+    jira_epic_name_field_id: Optional[str] = os.getenv('JIRA_EPIC_NAME_FIELD_ID', None)  # e.g., 'customfield_10011' (skips /field discovery)
+    jira_issue_cache: Optional[str] = os.getenv('JIRA_ISSUE_CACHE', None)  # SQLite file for cached issue payloads (disabled if unset)
     
     model_config = SettingsConfigDict(
         env_file=".env",
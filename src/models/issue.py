@@ -27,6 +27,11 @@ class Issue(BaseModel):
     epic_key: Optional[str] = Field(None, description="Epic key (if this is an Epic)")
     hierarchy_level: int = Field(default=0, description="Hierarchy level: 0=Epic, 1=Story/Task, 2=Subtask")
     
+    @property
+    def issue_type_lower(self) -> str:
+        """Lower-cased issue type (used for hierarchy comparisons)."""
+        return self.issue_type.lower()
+    
     def to_dict(self) -> dict:
         """Convert to dictionary for Excel export."""
         return {
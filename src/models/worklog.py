@@ -5,6 +5,8 @@ from typing import Optional
 from datetime import datetime, date
 from decimal import Decimal
 
+from ..utils.validators import ISSUE_KEY_RE
+
 
 class WorkLog(BaseModel):
     """Work log entry model."""
@@ -38,11 +40,7 @@ class WorkLogEntry(BaseModel):
             raise ValueError("Issue key is required")
         
         # Basic validation: should match pattern PROJ-123
-        if '-' not in v:
-            raise ValueError(f"Invalid issue key format: {v}. Expected format: PROJ-123")
-        
-        parts = v.split('-')
-        if len(parts) != 2 or not parts[0] or not parts[1]:
+        if ISSUE_KEY_RE.match(v) is None:
             raise ValueError(f"Invalid issue key format: {v}. Expected format: PROJ-123")
         
         return v.upper()
@@ -63,7 +61,7 @@ class WorkLogEntry(BaseModel):
     def to_worklog(self) -> WorkLog:
         """Convert to Jira WorkLog model."""
         # Convert hours to seconds
-        time_spent_seconds = int(float(self.time_logged_hours) * 3600)
+        time_spent_seconds = int(self.time_logged_hours * 3600)
         
         # Convert date to datetime (start of day in UTC)
         started = datetime.combine(self.work_date, datetime.min.time())
@@ -1,24 +1,83 @@
 """Excel file operations for Jira work logs."""
 
+import importlib.util
+import io
+import math
+from datetime import date
 from pathlib import Path
-from typing import List, Optional, Tuple, Dict
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 from collections import defaultdict
+import numpy as np
 import pandas as pd
-from openpyxl import load_workbook
-from openpyxl.styles import Font, PatternFill, Alignment
+from openpyxl import Workbook, load_workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font, PatternFill, Alignment, NamedStyle
+from openpyxl.styles.fonts import DEFAULT_FONT
+from openpyxl.utils import get_column_letter
 from openpyxl.utils.dataframe import dataframe_to_rows
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
 from pydantic import ValidationError
 
 from ..models.issue import Issue
 from ..models.worklog import WorkLogEntry, SyncResult, ExistingWorkLog, WorkLogUpdate
 from ..utils.formatters import format_date, parse_time_hours, parse_date
-from ..utils.validators import validate_issue_key, validate_time_hours, validate_date
+from ..utils.validators import ISSUE_KEY_RE
+from ..utils.progress import make_progress
 from decimal import Decimal
 
 console = Console()
 
+# Rows of the Instructions sheet in the issue template: (Column, Description, Required)
+INSTRUCTION_ROWS = [
+    ('Issue Key', 'Jira issue key (read-only)', 'Yes'),
+    ('Summary', 'Issue summary (read-only)', 'No'),
+    ('Type', 'Issue type (read-only)', 'No'),
+    ('Time Logged (hours)', 'Time logged in hours (decimal, e.g., 2.5)', 'Yes'),
+    ('Date', 'Work log date (YYYY-MM-DD format)', 'Yes'),
+    ('Comment', 'Work log comment (optional)', 'No'),
+    ('Status', 'Sync status (auto-populated)', 'No'),
+]
+
+# Rows of the Instructions sheet in the worklog summary: (Column, Description, Editable)
+SUMMARY_INSTRUCTION_ROWS = (
+    ('Worklog ID', 'Jira worklog ID (read-only)', 'No'),
+    ('Issue Key', 'Jira issue key (read-only)', 'No'),
+    ('Summary', 'Issue summary (read-only)', 'No'),
+    ('Type', 'Issue type (read-only)', 'No'),
+    ('Time Logged (hours)', 'Time logged in hours - EDIT THIS (decimal, e.g., 2.5)', 'Yes'),
+    ('Original Time (hours)', 'Original time logged (read-only, gray background)', 'No'),
+    ('Date', 'Work log date (YYYY-MM-DD)', 'Yes'),
+    ('Comment', 'Work log comment - EDIT THIS', 'Yes'),
+    ('Original Comment', 'Original comment (read-only, gray background)', 'No'),
+    ('Author', 'Work log author (read-only)', 'No'),
+    ('Status', 'Sync status (auto-populated)', 'No'),
+)
+
+# Shared style objects (created once, not per cell)
+_HEADER_FILL = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
+_HEADER_FONT = Font(bold=True, color="FFFFFF")
+_HEADER_ALIGNMENT = Alignment(horizontal="center", vertical="center")
+_TOTAL_ALIGNMENT = Alignment(horizontal="right", vertical="center")
+_GRAY_FONT = Font(color="808080")  # Gray for read-only
+_READ_ONLY_FILL = PatternFill(start_color="F0F0F0", end_color="F0F0F0", fill_type="solid")
+
+# Named cell styles of the issue template (registered per workbook, assigned by name)
+_READ_ONLY_STYLE = 'readonly'
+_TIME_STYLE = 'time'
+_DATE_STYLE = 'date'
+
+# calamine needs the optional python-calamine package and pandas >= 2.2
+_PANDAS_VERSION = tuple(int(part) for part in pd.__version__.split('.')[:2])
+_EXCEL_READ_ENGINE = (
+    'calamine'
+    if _PANDAS_VERSION >= (2, 2) and importlib.util.find_spec('python_calamine') is not None
+    else 'openpyxl'
+)
+
+# Sync status fonts
+_GREEN_FONT = Font(color="00AA00")
+_RED_FONT = Font(color="FF0000")
+
 
 class ExcelService:
     """Service for Excel file operations."""
@@ -38,6 +97,44 @@ class ExcelService:
     
     READ_ONLY_COLUMNS = ["Issue Key", "Summary", "Type"]
     
+    # Column widths of the issue template sheets: (column letter, width)
+    _COL_SPECS = (('A', 15), ('B', 50), ('C', 15), ('D', 18), ('E', 15), ('F', 40), ('G', 15))
+    _INSTRUCTION_COL_SPECS = (('A', 25), ('B', 60), ('C', 15))
+    
+    WORKLOG_SUMMARY_COLUMNS = [
+        "Hierarchy Number",
+        "Worklog ID",
+        "Issue Key",
+        "Summary",
+        "Type",
+        "Parent Issue Key",
+        "Parent Issue Type",
+        "Time Logged (hours)",
+        "Original Time (hours)",
+        "Date",
+        "Comment",
+        "Original Comment",
+        "Author",
+        "Status"
+    ]
+    
+    WORKLOG_SUMMARY_WIDTHS = {
+        "Hierarchy Number": 15,
+        "Worklog ID": 15,
+        "Issue Key": 15,
+        "Summary": 50,
+        "Type": 15,
+        "Parent Issue Key": 15,
+        "Parent Issue Type": 18,
+        "Time Logged (hours)": 18,
+        "Original Time (hours)": 20,
+        "Date": 15,
+        "Comment": 40,
+        "Original Comment": 40,
+        "Author": 20,
+        "Status": 15
+    }
+    
     def __init__(self):
         """Initialize Excel service."""
         pass
@@ -57,27 +154,17 @@ class ExcelService:
                 console.print("[yellow]No issues to export.[/yellow]")
                 return False
             
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=console
-            ) as progress:
+            with make_progress() as progress:
                 task = progress.add_task("Creating Excel template...", total=None)
                 
-                # Create DataFrame from issues
-                data = []
+                # Create DataFrame from issues, column-major and already in column order
+                columns = {col: [] for col in self.REQUIRED_COLUMNS}
                 for issue in issues:
-                    data.append(issue.to_dict())
+                    issue_dict = issue.to_dict()
+                    for col, values in columns.items():
+                        values.append(issue_dict.get(col, ""))
                 
-                df = pd.DataFrame(data)
-                
-                # Ensure all required columns exist
-                for col in self.REQUIRED_COLUMNS:
-                    if col not in df.columns:
-                        df[col] = ""
-                
-                # Reorder columns
-                df = df[self.REQUIRED_COLUMNS]
+                df = pd.DataFrame(columns)
                 
                 progress.update(task, description="Writing Excel file...")
                 
@@ -94,81 +181,47 @@ class ExcelService:
                     worksheet = writer.sheets['Work Logs']
                     
                     # Format header row
-                    header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-                    header_font = Font(bold=True, color="FFFFFF")
-                    
                     for cell in worksheet[1]:
-                        cell.fill = header_fill
-                        cell.font = header_font
-                        cell.alignment = Alignment(horizontal="center", vertical="center")
+                        cell.fill = _HEADER_FILL
+                        cell.font = _HEADER_FONT
+                        cell.alignment = _HEADER_ALIGNMENT
                     
                     # Format columns
-                    worksheet.column_dimensions['A'].width = 15  # Issue Key
-                    worksheet.column_dimensions['B'].width = 50  # Summary
-                    worksheet.column_dimensions['C'].width = 15  # Type
-                    worksheet.column_dimensions['D'].width = 18  # Time Logged
-                    worksheet.column_dimensions['E'].width = 15  # Date
-                    worksheet.column_dimensions['F'].width = 40  # Comment
-                    worksheet.column_dimensions['G'].width = 15  # Status
+                    for letter, width in self._COL_SPECS:
+                        worksheet.column_dimensions[letter].width = width
                     
-                    # Add data validation hints (using comments)
-                    for row in range(2, len(df) + 2):
+                    # Add data validation hints (shared named styles, assigned by name)
+                    _add_template_styles(workbook)
+                    key_idx = self.REQUIRED_COLUMNS.index("Issue Key")
+                    time_idx = self.REQUIRED_COLUMNS.index("Time Logged (hours)")
+                    date_idx = self.REQUIRED_COLUMNS.index("Date")
+                    for row_cells in worksheet.iter_rows(min_row=2, max_row=len(df) + 1,
+                                                         max_col=len(self.REQUIRED_COLUMNS)):
                         # Issue Key - read-only indicator
-                        issue_key_cell = worksheet[f'A{row}']
+                        issue_key_cell = row_cells[key_idx]
                         if issue_key_cell.value:
-                            issue_key_cell.font = Font(color="808080")  # Gray for read-only
+                            issue_key_cell.style = _READ_ONLY_STYLE
                         
                         # Time Logged - decimal format hint
-                        time_cell = worksheet[f'D{row}']
-                        time_cell.number_format = '0.00'
+                        row_cells[time_idx].style = _TIME_STYLE
                         
                         # Date - date format hint
-                        date_cell = worksheet[f'E{row}']
-                        date_cell.number_format = 'YYYY-MM-DD'
+                        row_cells[date_idx].style = _DATE_STYLE
                     
-                    # Add instructions sheet
-                    instructions_df = pd.DataFrame({
-                        'Column': [
-                            'Issue Key',
-                            'Summary',
-                            'Type',
-                            'Time Logged (hours)',
-                            'Date',
-                            'Comment',
-                            'Status'
-                        ],
-                        'Description': [
-                            'Jira issue key (read-only)',
-                            'Issue summary (read-only)',
-                            'Issue type (read-only)',
-                            'Time logged in hours (decimal, e.g., 2.5)',
-                            'Work log date (YYYY-MM-DD format)',
-                            'Work log comment (optional)',
-                            'Sync status (auto-populated)'
-                        ],
-                        'Required': [
-                            'Yes',
-                            'No',
-                            'No',
-                            'Yes',
-                            'Yes',
-                            'No',
-                            'No'
-                        ]
-                    })
-                    
-                    instructions_df.to_excel(writer, index=False, sheet_name='Instructions')
+                    # Add instructions sheet (written directly, no DataFrame needed)
+                    inst_worksheet = workbook.create_sheet('Instructions')
+                    inst_worksheet.append(('Column', 'Description', 'Required'))
+                    for instruction in INSTRUCTION_ROWS:
+                        inst_worksheet.append(instruction)
                     
                     # Format instructions sheet
-                    inst_worksheet = writer.sheets['Instructions']
                     for cell in inst_worksheet[1]:
-                        cell.fill = header_fill
-                        cell.font = header_font
-                        cell.alignment = Alignment(horizontal="center", vertical="center")
+                        cell.fill = _HEADER_FILL
+                        cell.font = _HEADER_FONT
+                        cell.alignment = _HEADER_ALIGNMENT
                     
-                    inst_worksheet.column_dimensions['A'].width = 25
-                    inst_worksheet.column_dimensions['B'].width = 60
-                    inst_worksheet.column_dimensions['C'].width = 15
+                    for letter, width in self._INSTRUCTION_COL_SPECS:
+                        inst_worksheet.column_dimensions[letter].width = width
                 
                 progress.update(task, description=f"[green]Excel file created: {output_file}[/green]")
             
@@ -194,15 +247,17 @@ class ExcelService:
             if not input_path.exists():
                 raise FileNotFoundError(f"Excel file not found: {input_file}")
             
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=console
-            ) as progress:
+            with make_progress() as progress:
                 task = progress.add_task("Reading Excel file...", total=None)
                 
-                # Read Excel file
-                df = pd.read_excel(input_path, sheet_name='Work Logs')
+                # Read Excel file (only the columns used for import; Comment is optional)
+                import_columns = {'Issue Key', 'Time Logged (hours)', 'Date', 'Comment'}
+                df = _read_excel(
+                    input_path,
+                    sheet_name='Work Logs',
+                    usecols=lambda col: col in import_columns,
+                    dtype={'Issue Key': 'string', 'Comment': 'string'}
+                )
                 
                 progress.update(task, description="Validating data...")
                 
@@ -211,51 +266,51 @@ class ExcelService:
                 if missing_columns:
                     raise ValueError(f"Missing required columns: {', '.join(missing_columns)}")
                 
-                # Parse and validate rows
-                entries = []
+                # Skip rows with empty required fields
+                required = ['Issue Key', 'Time Logged (hours)', 'Date']
+                df = df.dropna(subset=required)
+                issue_keys = df['Issue Key'].astype('string').str.strip()
+                time_raw = df['Time Logged (hours)'].astype('string').str.strip()
+                date_raw = df['Date'].astype('string').str.strip()
+                df = df[(issue_keys != "") & (time_raw != "") & (date_raw != "")]
+                issue_keys = issue_keys[df.index]
+                
+                # Validate whole columns at once
+                key_ok = issue_keys.str.match(ISSUE_KEY_RE).fillna(False).astype(bool)
+                time_hours = _coerce_hours(df['Time Logged (hours)'])
+                time_ok = time_hours.notna()
+                work_dates = _coerce_dates(df['Date'])
+                date_ok = work_dates.notna()
+                if 'Comment' in df.columns:
+                    comments = df['Comment'].astype('string').str.strip().fillna("")
+                else:
+                    comments = pd.Series("", index=df.index, dtype='string')
+                
+                # Collect errors, reporting only the first failure per row
                 errors = []
+                for idx in df.index[~key_ok]:
+                    errors.append((idx, f"Invalid issue key format: {issue_keys[idx]}"))
+                for idx in df.index[key_ok & ~time_ok]:
+                    errors.append((idx, f"Invalid time format: {time_raw[idx]}"))
+                for idx in df.index[key_ok & time_ok & ~date_ok]:
+                    errors.append((idx, f"Invalid date format: {date_raw[idx]}. Expected YYYY-MM-DD"))
+                errors = [f"Row {idx + 2}: {msg}" for idx, msg in sorted(errors, key=lambda e: e[0])]
+                
+                valid = pd.DataFrame({
+                    'issue_key': issue_keys,
+                    'time_hours': time_hours,
+                    'work_date': work_dates.dt.date,
+                    'comment': comments,
+                })[key_ok & time_ok & date_ok]
                 
-                for idx, row in df.iterrows():
+                # Build entries only for rows that passed validation
+                entries = []
+                for idx, issue_key, hours, work_date, comment in valid.itertuples(name=None):
                     try:
-                        # Get values
-                        issue_key = str(row['Issue Key']).strip() if pd.notna(row['Issue Key']) else ""
-                        time_str = str(row['Time Logged (hours)']).strip() if pd.notna(row['Time Logged (hours)']) else ""
-                        date_str = str(row['Date']).strip() if pd.notna(row['Date']) else ""
-                        comment = str(row['Comment']).strip() if pd.notna(row.get('Comment')) and pd.notna(row['Comment']) else ""
-                        
-                        # Skip rows with empty required fields
-                        if not issue_key or not time_str or not date_str:
-                            continue
-                        
-                        # Validate issue key
-                        if not validate_issue_key(issue_key):
-                            errors.append(f"Row {idx + 2}: Invalid issue key format: {issue_key}")
-                            continue
-                        
-                        # Parse time
-                        try:
-                            time_hours = parse_time_hours(time_str)
-                        except ValueError as e:
-                            errors.append(f"Row {idx + 2}: {str(e)}")
-                            continue
-                        
-                        # Parse date
-                        try:
-                            # Handle different date formats
-                            if isinstance(row['Date'], pd.Timestamp):
-                                work_date = row['Date'].date()
-                            elif isinstance(row['Date'], str):
-                                work_date = parse_date(date_str)
-                            else:
-                                work_date = parse_date(date_str)
-                        except ValueError as e:
-                            errors.append(f"Row {idx + 2}: {str(e)}")
-                            continue
-                        
                         # Create work log entry (using alias 'date' for Excel column compatibility)
                         entry = WorkLogEntry(
                             issue_key=issue_key,
-                            time_logged_hours=time_hours,
+                            time_logged_hours=Decimal(str(hours)),
                             date=work_date,  # Using alias
                             comment=comment if comment else None
                         )
@@ -295,25 +350,35 @@ class ExcelService:
             wb = load_workbook(input_file)
             ws = wb['Work Logs']
             
-            # Create status mapping
-            status_map = {r.issue_key: r for r in results}
+            # Create status mapping (keys normalized once)
+            status_map = {r.issue_key.strip(): r for r in results}
             
-            # Update status column (column G)
-            for row in range(2, ws.max_row + 1):
-                issue_key = ws[f'A{row}'].value
-                if issue_key and str(issue_key).strip() in status_map:
-                    result = status_map[str(issue_key).strip()]
-                    status_cell = ws[f'G{row}']
-                    if result.success:
-                        status_cell.value = "✓ Synced"
-                        status_cell.font = Font(color="00AA00")  # Green
-                    else:
-                        status_cell.value = f"✗ {result.message[:30]}"
-                        status_cell.font = Font(color="FF0000")  # Red
+            # Locate Issue Key / Status columns from the header once (default: A / G)
+            header = [cell.value for cell in next(ws.iter_rows(min_row=1, max_row=1))]
+            key_idx = header.index("Issue Key") if "Issue Key" in header else 0
+            status_idx = header.index("Status") if "Status" in header else 6
+            max_col = max(key_idx, status_idx) + 1
+            
+            # Update status column
+            for row_cells in ws.iter_rows(min_row=2, max_col=max_col):
+                issue_key = row_cells[key_idx].value
+                if not issue_key:
+                    continue
+                result = status_map.get(str(issue_key).strip())
+                if result is None:
+                    continue
+                status_cell = row_cells[status_idx]
+                if result.success:
+                    status_cell.value = "✓ Synced"
+                    status_cell.font = _GREEN_FONT
+                else:
+                    status_cell.value = f"✗ {result.message[:30]}"
+                    status_cell.font = _RED_FONT
             
-            # Save updated file
+            # Save updated file; an editable load keeps the user's sheet layout
+            # (frozen panes, merged cells, validation, column widths, comments)
             output_file = input_file.replace('.xlsx', '_synced.xlsx')
-            wb.save(output_file)
+            _save_workbook(wb, output_file)
             
             console.print(f"[green]✓[/green] Updated Excel file: [cyan]{output_file}[/cyan]")
             return True
@@ -328,7 +393,8 @@ class ExcelService:
         issues_dict: dict, 
         output_file: str,
         hierarchical_groups: Optional[List] = None,
-        all_issues: Optional[List] = None
+        all_issues: Optional[List] = None,
+        parent_to_children: Optional[Dict[str, List[Issue]]] = None
     ) -> bool:
         """Export worklog summary to Excel with original values tracking.
         
@@ -338,6 +404,9 @@ class ExcelService:
             output_file: Output Excel file path
             hierarchical_groups: Optional list of (epic_key, HierarchicalGroup) tuples for grouped export
             all_issues: Optional list of all Issue objects for hierarchy display
+            parent_to_children: Optional prebuilt parent key -> child issues index
+                (see HierarchyService.build_parent_to_children); used as-is instead of
+                deriving children from the groups and all_issues
             
         Returns:
             True if successful, False otherwise
@@ -347,209 +416,84 @@ class ExcelService:
                 console.print("[yellow]No work logs to export.[/yellow]")
                 return False
             
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=console
-            ) as progress:
+            with make_progress() as progress:
                 task = progress.add_task("Creating worklog summary Excel...", total=None)
                 
-                # Create DataFrame from worklogs
-                data = []
+                output_path = Path(output_file)
+                output_path.parent.mkdir(parents=True, exist_ok=True)
+                
+                # Rows are handed to the streaming sheet writer as they are generated
+                summary_rows = _SummarySheetWriter(self.WORKLOG_SUMMARY_COLUMNS, self.WORKLOG_SUMMARY_WIDTHS)
                 
                 if hierarchical_groups:
                     # Export with hierarchical grouping: Epic > Story/Task > Subtask (recursive tree view)
                     from ..services.hierarchy_service import HierarchicalGroup
                     
-                    # Create issue map from all_issues to get parent information
-                    issue_map = {}
-                    if all_issues:
-                        issue_map = {issue.key: issue for issue in all_issues}
+                    # Build complete children map once: map each parent issue key to all its children
+                    # This includes both subtasks and tasks that are children of stories/tasks
+                    if parent_to_children is not None:
+                        children_map = parent_to_children
+                    else:
+                        children_map = {}
+                        children_seen = {}  # parent key -> child keys already added
+                        for _, group in hierarchical_groups:
+                            # Copy subtasks from each group's subtasks_map
+                            for parent_key, children_list in group.subtasks_map.items():
+                                if parent_key not in children_map:
+                                    children_map[parent_key] = list(children_list)
+                                    children_seen[parent_key] = {child.key for child in children_list}
+                                    continue
+                                seen = children_seen[parent_key]
+                                for child in children_list:
+                                    if child.key not in seen:
+                                        seen.add(child.key)
+                                        children_map[parent_key].append(child)
+                        # Also check all_issues for tasks/stories that have children
+                        if all_issues:
+                            for issue in all_issues:
+                                # If issue has a parent_key, it's a child of that parent
+                                if issue.parent_key:
+                                    seen = children_seen.setdefault(issue.parent_key, set())
+                                    if issue.key not in seen:
+                                        seen.add(issue.key)
+                                        children_map.setdefault(issue.parent_key, []).append(issue)
+                    
+                    # Normalize (summary, type) once so every node resolves with a single lookup;
+                    # empty summaries fall back to the issue key
+                    summaries = {
+                        key: (summary if summary and summary.strip() else key, issue_type)
+                        for key, (summary, issue_type) in issues_dict.items()
+                    }
+                    tree_issues = list(all_issues or [])
+                    for _, group in hierarchical_groups:
+                        if group.epic:
+                            tree_issues.append(group.epic)
+                        tree_issues.extend(group.stories_tasks)
+                    for children_list in children_map.values():
+                        tree_issues.extend(children_list)
+                    for issue in tree_issues:
+                        if issue.key not in summaries:
+                            summary = issue.summary
+                            summaries[issue.key] = (summary if summary and summary.strip() else issue.key, issue.issue_type)
+                    
+                    # Index worklogs by issue key for O(1) lookup per node
+                    wl_by_key = defaultdict(list)
+                    for wl in worklogs:
+                        wl_by_key[wl.issue_key].append(wl)
                     
                     epic_counter = 0  # Track Epic numbers (1, 2, 3, ...)
                     
                     for epic_key, group in hierarchical_groups:
-                        # Create subtasks map for this group for recursive traversal
-                        subtasks_map = group.subtasks_map
                         epic_counter += 1
                         epic_number = str(epic_counter)  # Epic number: 1, 2, 3, ...
                         
-                        # Build complete children map: map each parent issue key to all its children
-                        # This includes both subtasks and tasks that are children of stories/tasks
-                        children_map = defaultdict(list)
-                        # Add subtasks from subtasks_map
-                        for parent_key, children_list in subtasks_map.items():
-                            children_map[parent_key].extend(children_list)
-                        # Also check all_issues for tasks/stories that have children
-                        if all_issues:
-                            for issue in all_issues:
-                                # If issue has a parent_key, it's a child of that parent
-                                if issue.parent_key:
-                                    if issue.parent_key not in children_map:
-                                        children_map[issue.parent_key] = []
-                                    if issue not in children_map[issue.parent_key]:
-                                        children_map[issue.parent_key].append(issue)
-                        
-                        def dump_issue_tree_recursive(
-                            issue: Issue, 
-                            depth: int, 
-                            number_prefix: str, 
-                            parent_issue: Optional[Issue] = None, 
-                            child_index: int = 0,
-                            visited: Optional[set] = None,
-                            max_depth: int = 20
-                        ) -> None:
-                            """Recursively dump issue tree to Excel (following recursion best practices).
-                            
-                            Filesystem analogy: recursively traverse directory tree with cycle detection.
-                            
-                            Implementation follows Recursion-of-Thought principles:
-                            1. Base case: Issue has no children → process and return
-                            2. Recursive case: Process issue, then recurse on each child
-                            3. Cycle detection: Track visited issues to prevent infinite loops
-                            4. Depth limiting: Prevent stack overflow for deeply nested structures
-                            
-                            Args:
-                                issue: Issue node to process
-                                depth: Current depth level (0=Epic/root, 1=Story/Task, 2+=Subtask)
-                                number_prefix: Hierarchical number prefix (e.g., "1", "1.1", "1.1.1")
-                                parent_issue: Parent issue node (for parent info extraction)
-                                child_index: Index of this child among siblings (0-based)
-                                visited: Set of visited issue keys (for cycle detection)
-                                max_depth: Maximum recursion depth to prevent stack overflow
-                            
-                            Edge cases handled:
-                            - Empty children list: Base case, just processes the issue
-                            - Null/None issue: Should not occur (caller validates)
-                            - Cycle detection: Skips if issue already visited
-                            - Max depth exceeded: Stops recursion and logs warning
-                            """
-                            nonlocal data, issue_map, issues_dict, worklogs, subtasks_map, epic_number, children_map
-                            
-                            # Base case 1: Cycle detection - prevent infinite loops
-                            if visited is None:
-                                visited = set()
-                            if issue.key in visited:
-                                # Cycle detected - skip this node to prevent infinite recursion
-                                return
-                            visited.add(issue.key)
-                            
-                            # Base case 2: Depth limit - prevent stack overflow
-                            if depth > max_depth:
-                                # Depth limit exceeded - stop recursion to prevent stack overflow
-                                # Note: We could log this, but it's an edge case that shouldn't occur in normal JIRA hierarchies
-                                return
-                            
-                            # Step 1: Build hierarchy number for this node
-                            # - Epics use epic_number (1, 2, 3, ...)
-                            # - Children append their index+1 to parent's number (1.1, 1.2, 1.1.1, ...)
-                            if depth == 0:
-                                hierarchy_number = epic_number  # Root/Epic level
-                            else:
-                                hierarchy_number = f"{number_prefix}.{child_index + 1}" if number_prefix else str(child_index + 1)
-                            
-                            # Step 2: Extract issue information
-                            issue_summary, issue_type = issues_dict.get(issue.key, (issue.summary or issue.key, issue.issue_type))
-                            if not issue_summary or issue_summary.strip() == "":
-                                issue_summary = issue.key  # Fallback to key if summary empty
-                            
-                            # Step 3: Build indentation prefix (2 spaces per depth level, root has no indentation)
-                            # Indentation formula: "  " * max(0, depth - 1) + "└─ " for children
-                            if depth == 0:
-                                indentation = ""  # Root/Epic - no indentation
-                            else:
-                                indentation = "  " * (depth - 1) + "└─ "  # Children - 2 spaces per level
-                            
-                            # Step 4: Determine parent information
-                            parent_key_str = ""
-                            parent_type_str = ""
-                            parent_indicator = ""
-                            
-                            if issue.parent_epic_key and not issue.parent_key:
-                                # Direct child of Epic (Story or Task directly under Epic)
-                                # This includes Tasks that are direct children of Epics
-                                parent_key_str = issue.parent_epic_key
-                                parent_type_str = issue.parent_issue_type or "Epic"
-                                if depth == 1:  # Only show indicator for direct Epic children
-                                    parent_indicator = f" ({parent_type_str})"
-                            elif issue.parent_key and parent_issue:
-                                # Child of Story/Task (e.g., Task under Story, Subtask under Task)
-                                parent_key_str = parent_issue.key
-                                parent_type_str = issue.parent_issue_type or parent_issue.issue_type
-                            elif issue.parent_epic_key:
-                                # Has Epic link but also has parent - parent is more specific
-                                if parent_issue:
-                                    parent_key_str = parent_issue.key
-                                    parent_type_str = issue.parent_issue_type or parent_issue.issue_type
-                            
-                            # Step 5: Find worklogs for this issue
-                            issue_worklogs = [wl for wl in worklogs if wl.issue_key == issue.key]
-                            
-                            # Step 6: Process current node (base case - single node processing)
-                            if issue_worklogs:
-                                # Node has worklogs - add each worklog as a row
-                                for wl in issue_worklogs:
-                                    summary_with_indicator = f"{indentation}{issue_summary}{parent_indicator}" if parent_indicator else f"{indentation}{issue_summary}"
-                                    row = wl.to_excel_row(summary_with_indicator, issue_type, parent_key_str, parent_type_str, hierarchy_number)
-                                    data.append(row)
-                            else:
-                                # Node has no worklogs - add single row with zero time
-                                summary_with_indicator = f"{indentation}{issue_summary}{parent_indicator}" if parent_indicator else f"{indentation}{issue_summary}"
-                                issue_row = {
-                                    "Hierarchy Number": hierarchy_number,
-                                    "Worklog ID": "",
-                                    "Issue Key": issue.key,
-                                    "Summary": summary_with_indicator,
-                                    "Type": issue_type,
-                                    "Parent Issue Key": parent_key_str,
-                                    "Parent Issue Type": parent_type_str,
-                                    "Time Logged (hours)": "0",
-                                    "Original Time (hours)": "0",
-                                    "Date": "",
-                                    "Comment": "",
-                                    "Original Comment": "",
-                                    "Author": "",
-                                    "Status": "No Worklog"
-                                }
-                                data.append(issue_row)
-                            
-                            # Step 7: Recursive case - process children (if any)
-                            # Base case: If no children, recursion stops here (implicit return)
-                            # Get children from complete children_map (includes all children: tasks, subtasks, etc.)
-                            children = children_map.get(issue.key, [])
-                            
-                            if not children:
-                                # Base case: No children - recursion terminates naturally
-                                return
-                            
-                            # Recursive step: Process each child with increased depth and updated number prefix
-                            # Filesystem analogy: Traverse subdirectories recursively
-                            for child_index_num, child in enumerate(children):
-                                # Recursive call with:
-                                # - Increased depth (depth + 1)
-                                # - Updated number prefix (current hierarchy_number)
-                                # - Current issue as parent
-                                # - Child index for numbering
-                                # - Visited set (shared across recursion) for cycle detection
-                                dump_issue_tree_recursive(
-                                    issue=child,
-                                    depth=depth + 1,
-                                    number_prefix=hierarchy_number,
-                                    parent_issue=issue,
-                                    child_index=child_index_num,
-                                    visited=visited,  # Share visited set to detect cross-tree cycles
-                                    max_depth=max_depth
-                                )
-                        
                         # Wrapper: Process Epic root, then recursively dump its subtree
                         # Base case: If Epic doesn't exist, skip this group
                         if not group.epic:
                             continue
                         
                         # Step 1: Process Epic root node (depth 0)
-                        epic_summary, epic_type = issues_dict.get(group.epic.key, (group.epic.summary or group.epic.key, group.epic.issue_type))
-                        if not epic_summary or epic_summary.strip() == "":
-                            epic_summary = group.epic.key
+                        epic_summary, epic_type = summaries[group.epic.key]
                         epic_row = {
                             "Hierarchy Number": epic_number,
                             "Worklog ID": "",
@@ -566,41 +510,30 @@ class ExcelService:
                             "Author": "",
                             "Status": "Epic"
                         }
-                        data.append(epic_row)
+                        summary_rows.append(epic_row)
                         
-                        # Step 2: Recursively dump all children (Stories/Tasks) under Epic
-                        # Filesystem analogy: Traverse root directory contents
-                        for story_index, story_task in enumerate(group.stories_tasks):
-                            dump_issue_tree_recursive(
-                                issue=story_task,
-                                depth=1,  # Start at depth 1 (children of root)
-                                number_prefix=epic_number,
-                                parent_issue=group.epic,
-                                child_index=story_index,
-                                visited=set(),  # New visited set for each Epic subtree
-                                max_depth=20
-                            )
+                        # Step 2: Dump all children (Stories/Tasks) under Epic
+                        _dump_issue_tree(
+                            group.epic,
+                            group.stories_tasks,
+                            epic_number,
+                            children_map,
+                            wl_by_key,
+                            summaries,
+                            summary_rows
+                        )
                         
                         # No empty row between groups - removed to avoid empty lines
                 else:
                     # Export flat list (original behavior)
-                    # Create issue map from all_issues to get parent information
-                    issue_map = {}
-                    if all_issues:
+                    # Resolve parent information once per issue rather than per worklog;
+                    # skipped entirely when no issue has a parent (common flat shape)
+                    parent_info = {}
+                    if all_issues and any(issue.parent_epic_key or issue.parent_key for issue in all_issues):
                         issue_map = {issue.key: issue for issue in all_issues}
-                    
-                    for wl in worklogs:
-                        issue_key = wl.issue_key
-                        summary, issue_type = issues_dict.get(issue_key, ("", ""))
-                        # Use issue key as fallback if summary is empty
-                        if not summary or summary.strip() == "":
-                            summary = issue_key
-                        
-                        # Get parent information
-                        parent_key_str = ""
-                        parent_type_str = ""
-                        if issue_key in issue_map:
-                            issue = issue_map[issue_key]
+                        for issue in all_issues:
+                            parent_key_str = ""
+                            parent_type_str = ""
                             if issue.parent_epic_key:
                                 parent_key_str = issue.parent_epic_key
                                 parent_type_str = issue.parent_issue_type or "Epic"
@@ -609,183 +542,35 @@ class ExcelService:
                                 parent_type_str = issue.parent_issue_type or ""
                                 if not parent_type_str and parent_key_str in issue_map:
                                     parent_type_str = issue_map[parent_key_str].issue_type
-                        
-                        # Flat list doesn't have hierarchy numbers
-                        data.append(wl.to_excel_row(summary, issue_type, parent_key_str, parent_type_str, ""))
-                
-                df = pd.DataFrame(data)
-                
-                # Define column order for worklog summary
-                worklog_columns = [
-                    "Hierarchy Number",
-                    "Worklog ID",
-                    "Issue Key",
-                    "Summary",
-                    "Type",
-                    "Parent Issue Key",
-                    "Parent Issue Type",
-                    "Time Logged (hours)",
-                    "Original Time (hours)",
-                    "Date",
-                    "Comment",
-                    "Original Comment",
-                    "Author",
-                    "Status"
-                ]
-                
-                # Ensure all columns exist
-                for col in worklog_columns:
-                    if col not in df.columns:
-                        df[col] = ""
-                
-                # Reorder columns
-                df = df[worklog_columns]
+                            parent_info[issue.key] = (parent_key_str, parent_type_str)
+                    
+                    # Use issue key as fallback if summary is empty
+                    summary_map = {
+                        key: (summary if summary and summary.strip() else key, issue_type)
+                        for key, (summary, issue_type) in issues_dict.items()
+                    }
+                    
+                    # (summary, type, parent key, parent type, hierarchy number) per issue;
+                    # flat list doesn't have hierarchy numbers
+                    row_info = {
+                        key: (*summary_map.get(key, (key, "")), *parent_info.get(key, ("", "")), "")
+                        for key in {wl.issue_key for wl in worklogs}
+                    }
+                    summary_rows.extend(wl.to_excel_row(*row_info[wl.issue_key]) for wl in worklogs)
                 
                 progress.update(task, description="Writing Excel file...")
                 
-                # Write to Excel with formatting
-                output_path = Path(output_file)
-                output_path.parent.mkdir(parents=True, exist_ok=True)
+                # Add summary row at the end
+                summary_rows.append_total_row()
                 
-                # Create Excel writer
-                with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
-                    df.to_excel(writer, index=False, sheet_name='Worklog Summary')
-                    
-                    # Get workbook and worksheet for formatting
-                    workbook = writer.book
-                    worksheet = writer.sheets['Worklog Summary']
-                    
-                    # Format header row
-                    header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-                    header_font = Font(bold=True, color="FFFFFF")
-                    
-                    for cell in worksheet[1]:
-                        cell.fill = header_fill
-                        cell.font = header_font
-                        cell.alignment = Alignment(horizontal="center", vertical="center")
-                    
-                    # Format columns
-                    worksheet.column_dimensions['A'].width = 15  # Worklog ID
-                    worksheet.column_dimensions['B'].width = 15  # Issue Key
-                    worksheet.column_dimensions['C'].width = 50  # Summary
-                    worksheet.column_dimensions['D'].width = 15  # Type
-                    worksheet.column_dimensions['E'].width = 18  # Time Logged
-                    worksheet.column_dimensions['F'].width = 20  # Original Time
-                    worksheet.column_dimensions['G'].width = 15  # Date
-                    worksheet.column_dimensions['H'].width = 40  # Comment
-                    worksheet.column_dimensions['I'].width = 40  # Original Comment
-                    worksheet.column_dimensions['J'].width = 20  # Author
-                    worksheet.column_dimensions['K'].width = 15  # Status
-                    
-                    # Format data cells
-                    for row in range(2, len(df) + 2):
-                        # Worklog ID - read-only indicator
-                        wl_id_cell = worksheet[f'A{row}']
-                        if wl_id_cell.value:
-                            wl_id_cell.font = Font(color="808080")  # Gray for read-only
-                        
-                        # Issue Key - read-only indicator
-                        issue_key_cell = worksheet[f'B{row}']
-                        if issue_key_cell.value:
-                            issue_key_cell.font = Font(color="808080")  # Gray for read-only
-                        
-                        # Original Time - read-only indicator (gray background)
-                        orig_time_cell = worksheet[f'F{row}']
-                        if orig_time_cell.value:
-                            orig_time_cell.fill = PatternFill(start_color="F0F0F0", end_color="F0F0F0", fill_type="solid")
-                            orig_time_cell.font = Font(color="808080")
-                        
-                        # Original Comment - read-only indicator (gray background)
-                        orig_comment_cell = worksheet[f'I{row}']
-                        if orig_comment_cell.value:
-                            orig_comment_cell.fill = PatternFill(start_color="F0F0F0", end_color="F0F0F0", fill_type="solid")
-                            orig_comment_cell.font = Font(color="808080")
-                        
-                        # Time Logged - editable (decimal format)
-                        time_cell = worksheet[f'E{row}']
-                        time_cell.number_format = '0.00'
-                        
-                        # Date - date format
-                        date_cell = worksheet[f'G{row}']
-                        date_cell.number_format = 'YYYY-MM-DD'
-                    
-                    # Add summary row at the end
-                    summary_row = len(df) + 2
-                    worksheet[f'A{summary_row}'] = "TOTAL"
-                    worksheet[f'A{summary_row}'].font = Font(bold=True, color="FFFFFF")
-                    worksheet[f'A{summary_row}'].fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-                    worksheet[f'A{summary_row}'].alignment = Alignment(horizontal="right", vertical="center")
-                    
-                    # Sum formula for time logged
-                    worksheet[f'E{summary_row}'] = f"=SUM(E2:E{len(df) + 1})"
-                    worksheet[f'E{summary_row}'].number_format = '0.00'
-                    worksheet[f'E{summary_row}'].font = Font(bold=True, color="FFFFFF")
-                    worksheet[f'E{summary_row}'].fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-                    
-                    # Sum formula for original time
-                    worksheet[f'F{summary_row}'] = f"=SUM(F2:F{len(df) + 1})"
-                    worksheet[f'F{summary_row}'].number_format = '0.00'
-                    worksheet[f'F{summary_row}'].font = Font(bold=True, color="FFFFFF")
-                    worksheet[f'F{summary_row}'].fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-                    
-                    # Merge cells for total label if needed (optional)
-                    # worksheet.merge_cells(f'A{summary_row}:D{summary_row}')
-                    
-                    # Add instructions sheet
-                    instructions_df = pd.DataFrame({
-                        'Column': [
-                            'Worklog ID',
-                            'Issue Key',
-                            'Summary',
-                            'Type',
-                            'Time Logged (hours)',
-                            'Original Time (hours)',
-                            'Date',
-                            'Comment',
-                            'Original Comment',
-                            'Author',
-                            'Status'
-                        ],
-                        'Description': [
-                            'Jira worklog ID (read-only)',
-                            'Jira issue key (read-only)',
-                            'Issue summary (read-only)',
-                            'Issue type (read-only)',
-                            'Time logged in hours - EDIT THIS (decimal, e.g., 2.5)',
-                            'Original time logged (read-only, gray background)',
-                            'Work log date (YYYY-MM-DD)',
-                            'Work log comment - EDIT THIS',
-                            'Original comment (read-only, gray background)',
-                            'Work log author (read-only)',
-                            'Sync status (auto-populated)'
-                        ],
-                        'Editable': [
-                            'No',
-                            'No',
-                            'No',
-                            'No',
-                            'Yes',
-                            'No',
-                            'Yes',
-                            'Yes',
-                            'No',
-                            'No',
-                            'No'
-                        ]
-                    })
-                    
-                    instructions_df.to_excel(writer, index=False, sheet_name='Instructions')
-                    
-                    # Format instructions sheet
-                    inst_worksheet = writer.sheets['Instructions']
-                    for cell in inst_worksheet[1]:
-                        cell.fill = header_fill
-                        cell.font = header_font
-                        cell.alignment = Alignment(horizontal="center", vertical="center")
-                    
-                    inst_worksheet.column_dimensions['A'].width = 25
-                    inst_worksheet.column_dimensions['B'].width = 60
-                    inst_worksheet.column_dimensions['C'].width = 15
+                # Add instructions sheet
+                summary_rows.add_instructions(
+                    ('Column', 'Description', 'Editable'),
+                    SUMMARY_INSTRUCTION_ROWS,
+                    self._INSTRUCTION_COL_SPECS
+                )
+                
+                summary_rows.save(output_path)
                 
                 progress.update(task, description=f"[green]Worklog summary Excel created: {output_file}[/green]")
             
@@ -812,15 +597,11 @@ class ExcelService:
             if not input_path.exists():
                 raise FileNotFoundError(f"Excel file not found: {input_file}")
             
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=console
-            ) as progress:
+            with make_progress() as progress:
                 task = progress.add_task("Reading worklog summary Excel...", total=None)
                 
                 # Read Excel file
-                df = pd.read_excel(input_path, sheet_name='Worklog Summary')
+                df = _read_sheet_values(input_path, 'Worklog Summary')
                 
                 progress.update(task, description="Detecting changes...")
                 
@@ -830,66 +611,68 @@ class ExcelService:
                 if missing_columns:
                     raise ValueError(f"Missing required columns: {', '.join(missing_columns)}")
                 
-                # Parse and detect changes
-                updates = []
+                # Skip rows with empty required fields
+                df = df.dropna(subset=['Worklog ID', 'Issue Key', 'Time Logged (hours)', 'Original Time (hours)'])
+                worklog_ids = df['Worklog ID'].astype('string').str.strip()
+                issue_keys = df['Issue Key'].astype('string').str.strip()
+                time_raw = df['Time Logged (hours)'].astype('string').str.strip()
+                orig_time_raw = df['Original Time (hours)'].astype('string').str.strip()
+                df = df[(worklog_ids != "") & (issue_keys != "") & (time_raw != "") & (orig_time_raw != "")]
+                index = df.index
+                
+                # Validate and parse whole columns at once
+                key_ok = issue_keys[index].str.match(ISSUE_KEY_RE).fillna(False).astype(bool)
+                new_hours = _coerce_hours(df['Time Logged (hours)'])
+                orig_hours = _coerce_hours(df['Original Time (hours)'])
+                time_ok = new_hours.notna() & orig_hours.notna()
+                work_dates = _coerce_dates(df['Date'])
+                date_ok = work_dates.notna()
+                
+                def _text_column(name: str) -> pd.Series:
+                    if name in df.columns:
+                        return df[name].astype('string').str.strip().fillna("")
+                    return pd.Series("", index=index, dtype='string')
+                
+                comments = _text_column('Comment')
+                orig_comments = _text_column('Original Comment')
+                
+                # Collect errors, reporting only the first failure per row
                 errors = []
+                for idx in index[~key_ok]:
+                    errors.append((idx, f"Invalid issue key format: {issue_keys[idx]}"))
+                for idx in index[key_ok & ~time_ok]:
+                    bad_time = time_raw[idx] if pd.isna(new_hours[idx]) else orig_time_raw[idx]
+                    errors.append((idx, f"Invalid time format: {bad_time}"))
+                date_raw = _text_column('Date')
+                for idx in index[key_ok & time_ok & ~date_ok]:
+                    errors.append((idx, f"Invalid date format: {date_raw[idx]}. Expected YYYY-MM-DD"))
+                errors = [f"Row {idx + 2}: {msg}" for idx, msg in sorted(errors, key=lambda e: e[0])]
+                
+                # Only rows with a time or comment change become updates
+                changed = (new_hours != orig_hours) | (comments != orig_comments)
+                candidates = pd.DataFrame({
+                    'worklog_id': worklog_ids[index],
+                    'issue_key': issue_keys[index],
+                    'orig_hours': orig_hours,
+                    'new_hours': new_hours,
+                    'orig_comment': orig_comments,
+                    'comment': comments,
+                    'work_date': work_dates.dt.date,
+                })[key_ok & time_ok & date_ok & changed]
                 
-                for idx, row in df.iterrows():
+                updates = []
+                for idx, worklog_id, issue_key, orig_h, new_h, orig_comment, comment, work_date in candidates.itertuples(name=None):
                     try:
-                        # Get values
-                        worklog_id = str(row['Worklog ID']).strip() if pd.notna(row['Worklog ID']) else ""
-                        issue_key = str(row['Issue Key']).strip() if pd.notna(row['Issue Key']) else ""
-                        time_str = str(row['Time Logged (hours)']).strip() if pd.notna(row['Time Logged (hours)']) else ""
-                        orig_time_str = str(row['Original Time (hours)']).strip() if pd.notna(row['Original Time (hours)']) else ""
-                        date_str = str(row['Date']).strip() if pd.notna(row['Date']) else ""
-                        comment = str(row.get('Comment', '')).strip() if pd.notna(row.get('Comment', '')) else ""
-                        orig_comment = str(row.get('Original Comment', '')).strip() if pd.notna(row.get('Original Comment', '')) else ""
-                        
-                        # Skip rows with empty required fields
-                        if not worklog_id or not issue_key or not time_str or not orig_time_str:
-                            continue
-                        
-                        # Validate issue key
-                        if not validate_issue_key(issue_key):
-                            errors.append(f"Row {idx + 2}: Invalid issue key format: {issue_key}")
-                            continue
-                        
-                        # Parse times
-                        try:
-                            new_time_hours = parse_time_hours(time_str)
-                            original_time_hours = parse_time_hours(orig_time_str)
-                        except ValueError as e:
-                            errors.append(f"Row {idx + 2}: {str(e)}")
-                            continue
-                        
-                        # Parse date
-                        try:
-                            if isinstance(row['Date'], pd.Timestamp):
-                                work_date = row['Date'].date()
-                            elif isinstance(row['Date'], str):
-                                work_date = parse_date(date_str)
-                            else:
-                                work_date = parse_date(date_str)
-                        except ValueError as e:
-                            errors.append(f"Row {idx + 2}: {str(e)}")
-                            continue
-                        
-                        # Create work log update (even if no changes detected)
                         # Using alias 'date' for Excel column compatibility
-                        update = WorkLogUpdate(
+                        updates.append(WorkLogUpdate(
                             worklog_id=worklog_id,
                             issue_key=issue_key,
-                            original_time_hours=original_time_hours,
-                            new_time_hours=new_time_hours,
+                            original_time_hours=Decimal(str(orig_h)),
+                            new_time_hours=Decimal(str(new_h)),
                             original_comment=orig_comment if orig_comment else None,
                             new_comment=comment if comment else None,
                             date=work_date  # Using alias
-                        )
-                        
-                        # Only add if there are changes
-                        if update.has_changes():
-                            updates.append(update)
-                        
+                        ))
                     except ValidationError as e:
                         errors.append(f"Row {idx + 2}: Validation error - {str(e)}")
                     except Exception as e:
@@ -911,3 +694,389 @@ class ExcelService:
             console.print(f"[red]Error importing worklog summary diff:[/red] {str(e)}")
             return []
 
+
+def _add_template_styles(workbook: Workbook) -> None:
+    """Register the issue template's named cell styles on a workbook.
+    
+    Args:
+        workbook: Workbook the template sheets are written to
+    """
+    for style in (
+        NamedStyle(name=_READ_ONLY_STYLE, font=_GRAY_FONT),
+        NamedStyle(name=_TIME_STYLE, font=DEFAULT_FONT, number_format='0.00'),
+        NamedStyle(name=_DATE_STYLE, font=DEFAULT_FONT, number_format='YYYY-MM-DD'),
+    ):
+        if style.name not in workbook.named_styles:
+            workbook.add_named_style(style)
+
+
+def _read_excel(path, **kwargs) -> pd.DataFrame:
+    """Read an Excel sheet, preferring the calamine engine when available.
+    
+    python-calamine (optional, pandas >= 2.2) parses .xlsx much faster than
+    openpyxl; openpyxl is used when either requirement is missing.
+    
+    Args:
+        path: Excel file path
+        **kwargs: Arguments passed to pandas.read_excel
+        
+    Returns:
+        DataFrame with sheet contents
+    """
+    return pd.read_excel(path, engine=_EXCEL_READ_ENGINE, **kwargs)
+
+def _read_sheet_values(path, sheet_name: str) -> pd.DataFrame:
+    """Read a sheet's raw cell values into a DataFrame (first row is the header).
+    
+    Uses openpyxl read-only, values-only iteration and keeps cells as-is
+    (object dtype), so text cells such as worklog IDs are not re-typed.
+    
+    Args:
+        path: Excel file path
+        sheet_name: Worksheet name
+        
+    Returns:
+        DataFrame with sheet contents
+    """
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        rows = workbook[sheet_name].iter_rows(values_only=True)
+        header = next(rows, ())
+        width = len(header)
+        data = [row[:width] + (None,) * (width - len(row)) for row in rows]
+    finally:
+        workbook.close()
+    
+    columns = [str(h) if h is not None else f"Unnamed: {i}" for i, h in enumerate(header)]
+    return pd.DataFrame(data, columns=columns, dtype=object)
+
+def _coerce_hours(values: pd.Series) -> pd.Series:
+    """Convert a time column to float hours (NaN where invalid).
+    
+    Numeric cells convert natively; parse_time_hours() is only tried on the
+    few cells the vectorized conversion rejects. Boolean cells are invalid.
+    
+    Args:
+        values: Raw "Time Logged (hours)" style column
+        
+    Returns:
+        Float series aligned with values
+    """
+    # to_numeric would read True/False as 1/0 hours
+    values = values.mask(values.map(lambda value: isinstance(value, (bool, np.bool_))))
+    hours = pd.to_numeric(values, errors='coerce')
+    for idx in hours.index[hours.isna() & values.notna()]:
+        try:
+            parsed = float(parse_time_hours(str(values[idx]).strip()))
+        except ValueError:
+            continue
+        if math.isfinite(parsed):
+            hours[idx] = parsed
+    return hours
+
+
+def _coerce_dates(values: pd.Series) -> pd.Series:
+    """Convert a date column to timestamps (NaT where invalid).
+    
+    Date cells convert natively and text must be YYYY-MM-DD, as in
+    parse_date(), which is only tried on the few strings the vectorized
+    conversion rejects. Other cells (numbers, booleans) are invalid.
+    
+    Args:
+        values: Raw "Date" column
+        
+    Returns:
+        Datetime series aligned with values
+    """
+    if pd.api.types.is_datetime64_any_dtype(values):
+        # Only date cells in the column
+        return values
+    
+    dates = pd.Series(pd.NaT, index=values.index, dtype='datetime64[ns]')
+    is_date = values.map(lambda value: isinstance(value, date))
+    if is_date.any():
+        dates[is_date] = pd.to_datetime(values[is_date], errors='coerce')
+    
+    is_text = values.map(lambda value: isinstance(value, str))
+    if is_text.any():
+        # Strict format: partial dates ("2024", "2024-01") and times are rejected
+        text = values[is_text].str.strip()
+        dates[is_text] = pd.to_datetime(text, format='%Y-%m-%d', errors='coerce')
+        for idx in text.index[dates[is_text].isna()]:
+            try:
+                dates[idx] = pd.Timestamp(parse_date(text[idx]))
+            except ValueError:
+                continue
+    return dates
+
+
+def _save_workbook(workbook, output_path) -> None:
+    """Serialize a workbook in memory and write it to disk in one call.
+    
+    Saving straight to a path lets the zip writer issue many small writes,
+    which is slow on network and synced folders.
+    
+    Args:
+        workbook: openpyxl Workbook
+        output_path: Output Excel file path
+    """
+    buffer = io.BytesIO()
+    workbook.save(buffer)
+    Path(output_path).write_bytes(buffer.getvalue())
+
+
+def _header_cells(worksheet, titles: List[str]) -> List[WriteOnlyCell]:
+    """Build styled header cells for a write-only worksheet.
+    
+    Args:
+        worksheet: Write-only worksheet the cells belong to
+        titles: Header titles
+        
+    Returns:
+        List of styled WriteOnlyCell objects
+    """
+    cells = []
+    for title in titles:
+        cell = WriteOnlyCell(worksheet, value=title)
+        cell.fill = _HEADER_FILL
+        cell.font = _HEADER_FONT
+        cell.alignment = _HEADER_ALIGNMENT
+        cells.append(cell)
+    return cells
+
+
+# Summary columns with per-cell styling
+_GRAY_COLUMNS = ("Worklog ID", "Issue Key")  # gray font when set
+_READ_ONLY_COLUMNS = ("Original Time (hours)", "Original Comment")  # gray font + fill when set
+_TIME_COLUMNS = ("Time Logged (hours)", "Original Time (hours)")  # summed in the TOTAL row
+
+
+class _SummarySheetWriter:
+    """Streams worklog summary row dicts into a write-only openpyxl workbook.
+    
+    Writes the header and column widths on creation, styles read-only and
+    formatted columns per cell, and keeps track of how many rows were written
+    for the TOTAL row formulas.
+    """
+    
+    def __init__(self, columns: List[str], widths: Dict[str, int]):
+        """Initialize writer and emit the header row.
+        
+        Args:
+            columns: Column order
+            widths: Column widths keyed by column name
+        """
+        self.workbook = Workbook(write_only=True)
+        self.worksheet = self.workbook.create_sheet('Worklog Summary')
+        self.columns = columns
+        self.count = 0
+        # Per-column cell kind, resolved once instead of per cell
+        self._kinds = [
+            'gray' if column in _GRAY_COLUMNS
+            else 'read_only' if column in _READ_ONLY_COLUMNS
+            else 'time' if column == "Time Logged (hours)"
+            else 'date' if column == "Date"
+            else None
+            for column in columns
+        ]
+        
+        for index, column in enumerate(columns, start=1):
+            if column in widths:
+                self.worksheet.column_dimensions[get_column_letter(index)].width = widths[column]
+        self.worksheet.append(_header_cells(self.worksheet, columns))
+    
+    def append(self, row: dict) -> None:
+        """Append one row dict (missing columns are left empty).
+        
+        Args:
+            row: Mapping of column name to value
+        """
+        worksheet = self.worksheet
+        values = []
+        for column, kind in zip(self.columns, self._kinds):
+            value = row.get(column, "")
+            if value == "":
+                value = None
+            
+            if kind is None:
+                cell = value
+            elif kind == 'gray':
+                # Read-only indicator
+                cell = WriteOnlyCell(worksheet, value=value)
+                if value:
+                    cell.font = _GRAY_FONT
+            elif kind == 'read_only':
+                # Read-only indicator (gray background)
+                cell = WriteOnlyCell(worksheet, value=value)
+                if value:
+                    cell.fill = _READ_ONLY_FILL
+                    cell.font = _GRAY_FONT
+            elif kind == 'time':
+                # Editable (decimal format)
+                cell = WriteOnlyCell(worksheet, value=value)
+                cell.number_format = '0.00'
+            else:
+                cell = WriteOnlyCell(worksheet, value=value)
+                cell.number_format = 'YYYY-MM-DD'
+            values.append(cell)
+        
+        worksheet.append(values)
+        self.count += 1
+    
+    def extend(self, rows: Iterable[dict]) -> None:
+        """Append several row dicts.
+        
+        Args:
+            rows: Mappings of column name to value
+        """
+        for row in rows:
+            self.append(row)
+    
+    def append_total_row(self) -> None:
+        """Append the TOTAL row with SUM formulas for the time columns."""
+        worksheet = self.worksheet
+        last_row = self.count + 1
+        values = []
+        for index, column in enumerate(self.columns, start=1):
+            if index == 1:
+                cell = WriteOnlyCell(worksheet, value="TOTAL")
+                cell.alignment = _TOTAL_ALIGNMENT
+            elif column in _TIME_COLUMNS:
+                letter = get_column_letter(index)
+                cell = WriteOnlyCell(worksheet, value=f"=SUM({letter}2:{letter}{last_row})")
+                cell.number_format = '0.00'
+            else:
+                values.append(None)
+                continue
+            cell.font = _HEADER_FONT
+            cell.fill = _HEADER_FILL
+            values.append(cell)
+        worksheet.append(values)
+    
+    def add_instructions(self, header: Tuple[str, ...], rows: Sequence[Tuple[str, ...]], col_specs) -> None:
+        """Add the Instructions sheet.
+        
+        Args:
+            header: Header titles
+            rows: Instruction rows
+            col_specs: (column letter, width) pairs
+        """
+        inst_worksheet = self.workbook.create_sheet('Instructions')
+        for letter, width in col_specs:
+            inst_worksheet.column_dimensions[letter].width = width
+        inst_worksheet.append(_header_cells(inst_worksheet, header))
+        for row in rows:
+            inst_worksheet.append(row)
+    
+    def save(self, output_path: Path) -> None:
+        """Write the workbook to disk.
+        
+        Args:
+            output_path: Output Excel file path
+        """
+        _save_workbook(self.workbook, output_path)
+
+
+def _dump_issue_tree(
+    epic: Issue,
+    roots: List[Issue],
+    epic_number: str,
+    children_map: Dict[str, List[Issue]],
+    wl_by_key: Dict[str, List[ExistingWorkLog]],
+    summaries: Dict[str, Tuple[str, str]],
+    rows: list,
+    max_depth: int = 20
+) -> None:
+    """Dump an Epic's issue tree as worklog summary rows (depth-first, pre-order).
+    
+    Uses an explicit stack instead of recursion. Issues already visited in this
+    Epic's subtree are skipped (cycle detection) and nodes deeper than
+    max_depth are not emitted.
+    
+    Args:
+        epic: Epic issue at the root of the tree (parent of the roots)
+        roots: Stories/Tasks directly under the Epic
+        epic_number: Hierarchy number of the Epic (e.g., "1")
+        children_map: Mapping of parent issue key to child issues
+        wl_by_key: Mapping of issue key to its worklogs
+        summaries: Mapping of issue key to (non-empty summary, type) for every issue in the tree
+        rows: List receiving one row dict per worklog (or per issue without worklogs)
+        max_depth: Maximum depth to descend
+    """
+    visited = set()
+    # Stack entries: (issue, depth, number_prefix, parent_issue, child_index)
+    stack = [(root, 1, epic_number, epic, index) for index, root in enumerate(roots)]
+    stack.reverse()
+    
+    while stack:
+        issue, depth, number_prefix, parent_issue, child_index = stack.pop()
+        
+        # Cycle detection - skip issues already dumped in this subtree
+        if issue.key in visited:
+            continue
+        visited.add(issue.key)
+        
+        # Depth limit
+        if depth > max_depth:
+            continue
+        
+        # Children append their index+1 to parent's number (1.1, 1.2, 1.1.1, ...)
+        hierarchy_number = f"{number_prefix}.{child_index + 1}" if number_prefix else str(child_index + 1)
+        
+        issue_summary, issue_type = summaries[issue.key]
+        
+        # 2 spaces per level below the first
+        indentation = "  " * (depth - 1) + "└─ "
+        
+        # Determine parent information
+        parent_key_str = ""
+        parent_type_str = ""
+        parent_indicator = ""
+        
+        if issue.parent_epic_key and not issue.parent_key:
+            # Direct child of Epic (Story or Task directly under Epic)
+            parent_key_str = issue.parent_epic_key
+            parent_type_str = issue.parent_issue_type or "Epic"
+            if depth == 1:  # Only show indicator for direct Epic children
+                parent_indicator = f" ({parent_type_str})"
+        elif issue.parent_key and parent_issue:
+            # Child of Story/Task (e.g., Task under Story, Subtask under Task)
+            parent_key_str = parent_issue.key
+            parent_type_str = issue.parent_issue_type or parent_issue.issue_type
+        elif issue.parent_epic_key:
+            # Has Epic link but also has parent - parent is more specific
+            if parent_issue:
+                parent_key_str = parent_issue.key
+                parent_type_str = issue.parent_issue_type or parent_issue.issue_type
+        
+        summary_with_indicator = f"{indentation}{issue_summary}{parent_indicator}"
+        issue_worklogs = wl_by_key.get(issue.key, ())
+        
+        if issue_worklogs:
+            # Node has worklogs - add each worklog as a row
+            for wl in issue_worklogs:
+                rows.append(wl.to_excel_row(summary_with_indicator, issue_type, parent_key_str, parent_type_str, hierarchy_number))
+        else:
+            # Node has no worklogs - add single row with zero time
+            rows.append({
+                "Hierarchy Number": hierarchy_number,
+                "Worklog ID": "",
+                "Issue Key": issue.key,
+                "Summary": summary_with_indicator,
+                "Type": issue_type,
+                "Parent Issue Key": parent_key_str,
+                "Parent Issue Type": parent_type_str,
+                "Time Logged (hours)": "0",
+                "Original Time (hours)": "0",
+                "Date": "",
+                "Comment": "",
+                "Original Comment": "",
+                "Author": "",
+                "Status": "No Worklog"
+            })
+        
+        # Push children in reverse so they pop in their original order
+        children = children_map.get(issue.key)
+        if children:
+            for index in range(len(children) - 1, -1, -1):
+                stack.append((children[index], depth + 1, hierarchy_number, issue, index))
@@ -1,18 +1,28 @@
 """Jira filter and JQL query service using requests library."""
 
-from typing import List, Optional
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
 import requests
 from rich.console import Console
 from rich.table import Table
 
-from ..config.auth import JiraAuth, extract_jira_error_payload, safe_parse_response
+from ..config.auth import JiraAuth, extract_jira_error_payload, parse_json_response, safe_parse_response
 
 console = Console()
 
+# Trailing ORDER BY clause of a JQL query (case-insensitive)
+ORDER_BY_RE = re.compile(
+    r'\s+ORDER\s+BY\s+\S+(?:\s+[A-Z]+)?(?:\s*,\s*\S+(?:\s+[A-Z]+)?)*', re.IGNORECASE
+)
+
 
 class FilterService:
     """Service for managing Jira filters and JQL queries using requests library."""
     
+    FAVORITES_TTL = 60.0  # Seconds to reuse the favourite filters list
+    
     def __init__(self, auth: Optional[JiraAuth] = None):
         """Initialize filter service.
         
@@ -20,19 +30,36 @@ class FilterService:
             auth: Jira authentication handler (creates new if None)
         """
         self.auth = auth or JiraAuth()
+        self._favorites_cache: Optional[Tuple[float, List[dict]]] = None  # (fetched_at, filters)
+        self._filters_by_id: Dict[str, dict] = {}  # favourite filters keyed by id
+        self._jql_cache: Dict[str, str] = {}  # filter_id -> JQL
+    
+    def invalidate_cache(self):
+        """Drop cached favourite filters and resolved filter JQL."""
+        self._favorites_cache = None
+        self._filters_by_id = {}
+        self._jql_cache = {}
     
     def list_filters(self) -> List[dict]:
         """List all saved Jira filters.
         
+        The favourite filters list is cached for FAVORITES_TTL seconds.
+        
         Returns:
             List of filter dictionaries with id, name, jql keys
         """
+        if self._favorites_cache is not None:
+            fetched_at, filters = self._favorites_cache
+            if time.monotonic() - fetched_at < self.FAVORITES_TTL:
+                return filters
+        
         try:
-            # Get favorite filters
-            response = self.auth._make_request('GET', '/filter/favourite')
-            filters_data = response.json()
+            # Get favorite filters; ask for the JQL explicitly (Cloud only returns
+            # expandable properties on request), nothing else is expanded
+            response = self.auth._make_request('GET', '/filter/favourite', params={'expand': 'jql'})
+            filters_data = parse_json_response(response)
             
-            return [
+            filters = [
                 {
                     "id": str(f.get('id', '')),
                     "name": f.get('name', ''),
@@ -41,6 +68,9 @@ class FilterService:
                 }
                 for f in filters_data
             ]
+            self._favorites_cache = (time.monotonic(), filters)
+            self._filters_by_id = {f["id"]: f for f in filters}
+            return filters
         except requests.exceptions.RequestException as e:
             console.print(f"[red]Error listing filters:[/red] {str(e)}")
             if hasattr(e, 'response') and e.response is not None:
@@ -62,24 +92,22 @@ class FilterService:
         Returns:
             JQL query string or None if not found
         """
+        if filter_id in self._jql_cache:
+            return self._jql_cache[filter_id]
+        
         try:
-            # Try to get filter from favorites first
-            filters = self.list_filters()
-            for f in filters:
-                if f["id"] == filter_id:
-                    if f["jql"]:
-                        return f["jql"]
+            # Try to get filter from favorites first (list_filters() refreshes the id index)
+            self.list_filters()
+            f = self._filters_by_id.get(filter_id)
+            if f and f["jql"]:
+                self._jql_cache[filter_id] = f["jql"]
+                return f["jql"]
             
             # If not in favorites, fetch filter details directly
-            try:
-                response = self.auth._make_request('GET', f'/filter/{filter_id}')
-                filter_data = safe_parse_response(response)
-                if filter_data.get('is_html'):
-                    console.print(f"[yellow]Warning:[/yellow] Received HTML response from /filter/{filter_id} endpoint")
-                    return None
-                return filter_data.get('jql', None)
-            except requests.exceptions.RequestException:
-                return None
+            jql = self._fetch_filter_raw_jql(filter_id)
+            if jql:
+                self._jql_cache[filter_id] = jql
+            return jql
                 
         except requests.exceptions.RequestException as e:
             console.print(f"[red]Error getting filter JQL:[/red] {str(e)}")
@@ -93,6 +121,54 @@ class FilterService:
             console.print(f"[red]Unexpected error getting filter JQL:[/red] {str(e)}")
             return None
     
+    def _fetch_filter_raw_jql(self, filter_id: str) -> Optional[str]:
+        """Fetch a filter's JQL directly from /filter/{id}, bypassing caches.
+        
+        Args:
+            filter_id: Jira filter ID
+            
+        Returns:
+            JQL query string or None if the filter could not be fetched
+        """
+        try:
+            response = self.auth._make_request('GET', f'/filter/{filter_id}')
+            filter_data = safe_parse_response(response)
+            if filter_data.get('is_html'):
+                console.print(f"[yellow]Warning:[/yellow] Received HTML response from /filter/{filter_id} endpoint")
+                return None
+            return filter_data.get('jql', None)
+        except requests.exceptions.RequestException:
+            return None
+    
+    def get_filter_jqls(self, filter_ids: List[str]) -> Dict[str, str]:
+        """Resolve the JQL of several filters at once.
+        
+        Favourites and previously resolved filters come from the caches; the
+        remaining /filter/{id} lookups run concurrently.
+        
+        Args:
+            filter_ids: List of Jira filter IDs
+            
+        Returns:
+            Dictionary mapping filter ID to JQL (filters without JQL are omitted)
+        """
+        # Fetch favourites once; only ids missing from it need a direct lookup
+        self.list_filters()
+        known_jql = {fid: f["jql"] for fid, f in self._filters_by_id.items() if f["jql"]}
+        known_jql.update(self._jql_cache)
+        
+        # Fetch the remaining filters concurrently; they are independent requests
+        to_fetch = list(dict.fromkeys(fid for fid in filter_ids if fid not in known_jql))
+        if to_fetch:
+            with ThreadPoolExecutor(max_workers=min(8, len(to_fetch))) as executor:
+                fetched = dict(zip(to_fetch, executor.map(self._fetch_filter_raw_jql, to_fetch)))
+            for fid, jql in fetched.items():
+                if jql:
+                    self._jql_cache[fid] = jql
+                    known_jql[fid] = jql
+        
+        return {fid: known_jql[fid] for fid in filter_ids if fid in known_jql}
+    
     def combine_filters_jql(self, filter_ids: List[str]) -> Optional[str]:
         """Combine multiple filter JQL queries using OR operator.
         
@@ -102,18 +178,18 @@ class FilterService:
         Returns:
             Combined JQL query string or None if all filters failed
         """
-        import re
-        
         jql_queries = []
         order_by_clauses = []
         
+        known_jql = self.get_filter_jqls(filter_ids)
+        
         for filter_id in filter_ids:
-            jql = self.get_filter_jql(filter_id)
+            jql = known_jql.get(filter_id)
             if jql:
                 # Extract ORDER BY clause if present (case-insensitive)
                 # ORDER BY must come after all conditions, so we match it at the end
-                order_by_pattern = r'\s+ORDER\s+BY\s+[^\s]+(?:\s+[A-Z]+)?(?:\s*,\s*[^\s]+(?:\s+[A-Z]+)?)*'
-                order_by_match = re.search(order_by_pattern, jql, re.IGNORECASE)
+                # Cheap substring check first; most filters have no ORDER BY at all
+                order_by_match = ORDER_BY_RE.search(jql) if 'ORDER' in jql.upper() else None
                 
                 if order_by_match:
                     # Extract ORDER BY clause
@@ -1,7 +1,6 @@
 """Hierarchical grouping service for Jira issues by Epic > Story/Task > Subtask."""
 
-from typing import List, Dict, Optional, Tuple
-from collections import defaultdict
+from typing import Dict, Iterator, List, Optional, Tuple
 
 from ..models.issue import Issue
 from ..models.worklog import ExistingWorkLog
@@ -9,9 +8,16 @@ from ..models.worklog import ExistingWorkLog
 console = None  # Will be initialized if needed
 
 
+def _group_sort_key(group_key: str) -> Tuple[bool, str]:
+    """Sort key for hierarchical groups: by epic key, orphan groups last."""
+    return group_key.startswith("__orphan__"), group_key
+
+
 class HierarchicalGroup:
     """Represents a hierarchical group of issues."""
     
+    __slots__ = ('epic', 'stories_tasks', 'subtasks_map', '_worklogs', '_total_seconds')
+    
     def __init__(self, epic: Optional[Issue] = None):
         """Initialize hierarchical group.
         
@@ -20,8 +26,14 @@ class HierarchicalGroup:
         """
         self.epic = epic
         self.stories_tasks: List[Issue] = []
-        self.subtasks_map: Dict[str, List[Issue]] = defaultdict(list)  # parent_key -> subtasks
-        self.worklogs: List[ExistingWorkLog] = []
+        self.subtasks_map: Dict[str, List[Issue]] = {}  # parent_key -> subtasks
+        self._worklogs: List[ExistingWorkLog] = []
+        self._total_seconds: int = 0  # Running total maintained by add_worklog
+    
+    @property
+    def worklogs(self) -> List[ExistingWorkLog]:
+        """Worklogs of this group (use add_worklog to add more)."""
+        return self._worklogs
     
     def add_issue(self, issue: Issue):
         """Add issue to appropriate level in hierarchy.
@@ -35,24 +47,19 @@ class HierarchicalGroup:
         Args:
             issue: Issue to add
         """
-        if issue.issue_type.lower() == 'epic':
+        # Placement depends only on "is Epic" and "has parent_key"; a Subtask without a
+        # parent_key lands on the stories/tasks level like any other parentless issue
+        if issue.issue_type_lower == 'epic':
             self.epic = issue
-        elif issue.issue_type.lower() == 'subtask' or issue.parent_key:
-            # Subtask - add under parent (Story/Task)
-            # OR any issue with a parent_key (e.g., Task under Story)
-            parent_key = issue.parent_key
-            if parent_key:
-                self.subtasks_map[parent_key].append(issue)
-            else:
-                # Orphan subtask/issue with parent_key but no actual parent
-                # Add to stories/tasks level
-                self.stories_tasks.append(issue)
+        elif issue.parent_key:
+            # Subtask, or any issue with a parent_key (e.g., Task under Story) - add under parent
+            self.subtasks_map.setdefault(issue.parent_key, []).append(issue)
         else:
             # Story or Task - can be direct children of Epic
             # This includes:
             # - Stories linked to Epic via parent_epic_key
             # - Tasks linked to Epic via parent_epic_key (direct child of Epic)
-            # - Tasks that are children of Stories (will be handled via parent_key check above)
+            # - Orphan subtasks without a parent_key
             self.stories_tasks.append(issue)
     
     def add_worklog(self, worklog: ExistingWorkLog):
@@ -61,7 +68,17 @@ class HierarchicalGroup:
         Args:
             worklog: Worklog to add
         """
-        self.worklogs.append(worklog)
+        self._worklogs.append(worklog)
+        self._total_seconds += worklog.time_spent_seconds
+    
+    def add_worklogs(self, worklogs: List[ExistingWorkLog]):
+        """Add several worklogs to this group.
+        
+        Args:
+            worklogs: Worklogs to add
+        """
+        self._worklogs.extend(worklogs)
+        self._total_seconds += sum(wl.time_spent_seconds for wl in worklogs)
     
     def get_all_issues(self) -> List[Issue]:
         """Get all issues in this group in hierarchical order.
@@ -69,17 +86,21 @@ class HierarchicalGroup:
         Returns:
             List of issues: Epic, then Stories/Tasks, then Subtasks
         """
-        result = []
+        return list(self.iter_all_issues())
+    
+    def iter_all_issues(self) -> Iterator[Issue]:
+        """Iterate over all issues in this group in hierarchical order.
+        
+        Yields:
+            Epic, then each Story/Task followed by its Subtasks
+        """
         if self.epic:
-            result.append(self.epic)
+            yield self.epic
         
         for story_task in self.stories_tasks:
-            result.append(story_task)
+            yield story_task
             # Add subtasks for this parent
-            if story_task.key in self.subtasks_map:
-                result.extend(self.subtasks_map[story_task.key])
-        
-        return result
+            yield from self.subtasks_map.get(story_task.key, ())
     
     def get_total_time(self) -> float:
         """Get total time logged in this group.
@@ -87,18 +108,15 @@ class HierarchicalGroup:
         Returns:
             Total hours as float
         """
-        from decimal import Decimal
-        total = Decimal("0")
-        for wl in self.worklogs:
-            total += wl.time_spent_hours
-        return float(total)
+        return self._total_seconds / 3600
 
 
 class HierarchyService:
     """Service for organizing issues by hierarchical relationships."""
     
     @staticmethod
-    def _get_epic_path(issue: Issue, issue_map: Dict[str, Issue], visited: Optional[set] = None) -> List[str]:
+    def _get_epic_path(issue: Issue, issue_map: Dict[str, Issue], visited: Optional[set] = None,
+                       path_cache: Optional[Dict[str, List[str]]] = None) -> List[str]:
         """Get the filesystem-like path for an issue (Epic/Story/Task/Subtask).
         
         Filesystem analogy:
@@ -110,6 +128,7 @@ class HierarchyService:
             issue: Issue to get path for
             issue_map: Dictionary mapping issue keys to Issue objects
             visited: Set of visited issue keys to prevent infinite loops
+            path_cache: Optional issue key -> path memo shared across calls (paths must not be mutated)
             
         Returns:
             List of issue keys representing the path from Epic to this issue
@@ -117,50 +136,61 @@ class HierarchyService:
         """
         if visited is None:
             visited = set()
+        if issue_map.get(issue.key) is not issue:
+            # Duplicate-key entry: its own chain may differ from the mapped issue's,
+            # so it must neither read nor fill the per-key memo
+            path_cache = None
         
-        # Prevent infinite loops
-        if issue.key in visited:
-            return []
-        visited.add(issue.key)
-        
-        path = []
-        
-        # If this is an Epic, return [Epic]
-        if issue.issue_type.lower() == 'epic':
-            return [issue.key]
-        
-        # If issue has direct parent_epic_key, build path: [Epic, ..., this_issue]
-        if issue.parent_epic_key and issue.parent_epic_key in issue_map:
-            epic_issue = issue_map[issue.parent_epic_key]
-            if epic_issue.issue_type.lower() == 'epic':
-                # If this issue is directly under Epic (no parent_key), return [Epic, this_issue]
-                # This handles Stories and Tasks that are direct children of Epics
-                if not issue.parent_key:
-                    return [issue.parent_epic_key, issue.key]
-                # Otherwise, this issue has a parent (e.g., Task under Story, Subtask under Task)
-                # Need to traverse parent chain first to build full path
-                if issue.parent_key and issue.parent_key in issue_map:
-                    parent_path = HierarchyService._get_epic_path(issue_map[issue.parent_key], issue_map, visited.copy())
-                    if parent_path:
-                        parent_path.append(issue.key)
-                        return parent_path
-        
-        # If issue has parent_key, traverse up the parent chain
-        if issue.parent_key and issue.parent_key in issue_map:
-            parent_issue = issue_map[issue.parent_key]
-            parent_path = HierarchyService._get_epic_path(parent_issue, issue_map, visited)
-            if parent_path:
-                parent_path.append(issue.key)
-                return parent_path
+        # Walk up the parent_key chain until a node whose path is known directly
+        chain: List[Issue] = []
+        cut = False  # True when a parent cycle stopped the walk (result depends on the start)
+        current = issue
+        while True:
+            if current.key in visited:
+                # Prevent infinite loops
+                path = []
+                cut = True
+                break
+            if path_cache is not None and current.key in path_cache:
+                path = path_cache[current.key]
+                break
+            visited.add(current.key)
+            
+            if current.issue_type_lower == 'epic':
+                # An Epic is its own root: [Epic]
+                path = [current.key]
+            elif current.parent_key and current.parent_key in issue_map:
+                # Parent known: resolve it first, then append this issue
+                chain.append(current)
+                current = issue_map[current.parent_key]
+                continue
+            elif (not current.parent_key and current.parent_epic_key in issue_map
+                  and issue_map[current.parent_epic_key].issue_type_lower == 'epic'):
+                # Story/Task directly under an Epic: [Epic, this_issue]
+                path = [current.parent_epic_key, current.key]
+            elif current.parent_epic_key:
+                # Fallback: Epic known only by key
+                path = [current.parent_epic_key]
+            else:
+                path = []
+            if path_cache is not None:
+                path_cache[current.key] = path
+            break
         
-        # Fallback: if issue has parent_epic_key but we couldn't build path, return [Epic]
-        if issue.parent_epic_key:
-            return [issue.parent_epic_key]
+        # Unwind: [Epic, ..., parent, this_issue], or just [Epic] if the parent had no path
+        for child in reversed(chain):
+            if path:
+                path = path + [child.key]
+            elif child.parent_epic_key:
+                path = [child.parent_epic_key]
+            if path_cache is not None and not cut:
+                path_cache[child.key] = path
         
-        return []
+        return path
     
     @staticmethod
-    def _find_epic_for_issue(issue: Issue, issue_map: Dict[str, Issue], visited: Optional[set] = None) -> Optional[str]:
+    def _find_epic_for_issue(issue: Issue, issue_map: Dict[str, Issue], visited: Optional[set] = None,
+                             path_cache: Optional[Dict[str, List[str]]] = None) -> Optional[str]:
         """Find the Epic key for an issue by traversing the parent chain.
         
         Uses filesystem analogy: Epics are root directories (/), all other issues are nested inside.
@@ -169,18 +199,19 @@ class HierarchyService:
             issue: Issue to find Epic for
             issue_map: Dictionary mapping issue keys to Issue objects
             visited: Set of visited issue keys to prevent infinite loops
+            path_cache: Optional issue key -> path memo shared across calls
             
         Returns:
             Epic key if found, None otherwise
         """
         # Use path-based approach to ensure correct Epic assignment
-        path = HierarchyService._get_epic_path(issue, issue_map, visited)
+        path = HierarchyService._get_epic_path(issue, issue_map, visited, path_cache)
         if path:
             # First element in path is always the Epic
             epic_key = path[0]
             if epic_key in issue_map:
                 epic_issue = issue_map[epic_key]
-                if epic_issue.issue_type.lower() == 'epic':
+                if epic_issue.issue_type_lower == 'epic':
                     return epic_key
         
         return None
@@ -200,9 +231,9 @@ class HierarchyService:
             worklogs = []
         
         # Create worklog map by issue key
-        worklog_map = defaultdict(list)
+        worklog_map: Dict[str, List[ExistingWorkLog]] = {}
         for wl in worklogs:
-            worklog_map[wl.issue_key].append(wl)
+            worklog_map.setdefault(wl.issue_key, []).append(wl)
         
         # Create issue map for efficient lookups
         issue_map: Dict[str, Issue] = {issue.key: issue for issue in issues}
@@ -213,28 +244,28 @@ class HierarchyService:
         
         # First pass: Create groups for all Epics
         for issue in issues:
-            if issue.issue_type.lower() == 'epic':
-                if issue.key not in groups_by_epic:
-                    groups_by_epic[issue.key] = HierarchicalGroup(epic=issue)
+            if issue.issue_type_lower == 'epic' and issue.key not in groups_by_epic:
+                groups_by_epic[issue.key] = HierarchicalGroup(epic=issue)
         
         # Second pass: Assign issues to their Epic groups (filesystem analogy: place files in correct directories)
+        # Paths are memoized per issue key, so shared parent chains are walked once
+        path_cache: Dict[str, List[str]] = {}
         for issue in issues:
             # Skip Epic issues (already handled - these are root directories)
-            if issue.issue_type.lower() == 'epic':
+            if issue.issue_type_lower == 'epic':
                 continue
             
             # Find Epic for this issue by traversing parent chain
             # Filesystem analogy: Find which root directory (Epic) this file belongs to
-            epic_key = HierarchyService._find_epic_for_issue(issue, issue_map)
+            epic_key = HierarchyService._find_epic_for_issue(issue, issue_map, path_cache=path_cache)
             
             if epic_key and epic_key in groups_by_epic:
                 # Assign to Epic group (place file in correct directory)
-                groups_by_epic[epic_key].add_issue(issue)
+                group = groups_by_epic[epic_key]
+                group.add_issue(issue)
                 
                 # Add worklogs for this issue
-                if issue.key in worklog_map:
-                    for wl in worklog_map[issue.key]:
-                        groups_by_epic[epic_key].add_worklog(wl)
+                group.add_worklogs(worklog_map.get(issue.key, []))
             else:
                 # Orphan issue (file without a root directory - Epic)
                 orphan_issues.append(issue)
@@ -247,14 +278,30 @@ class HierarchyService:
                 if group_key not in groups_by_epic:
                     groups_by_epic[group_key] = HierarchicalGroup(epic=None)
                 
-                groups_by_epic[group_key].add_issue(issue)
-                
-                # Add worklogs
-                if issue.key in worklog_map:
-                    for wl in worklog_map[issue.key]:
-                        groups_by_epic[group_key].add_worklog(wl)
+                group = groups_by_epic[group_key]
+                group.add_issue(issue)
+                group.add_worklogs(worklog_map.get(issue.key, []))
+        
+        # Hand groups back already in hierarchical order, so iterating them needs no sort
+        return {key: groups_by_epic[key] for key in sorted(groups_by_epic, key=_group_sort_key)}
+    
+    @staticmethod
+    def build_parent_to_children(issues: List[Issue]) -> Dict[str, List[Issue]]:
+        """Build parent key -> child issues index (in issue order, deduplicated by key).
         
-        return groups_by_epic
+        Args:
+            issues: List of Issue objects
+            
+        Returns:
+            Dictionary mapping parent issue key to its child issues
+        """
+        parent_to_children: Dict[str, List[Issue]] = {}
+        seen = set()
+        for issue in issues:
+            if issue.parent_key and (issue.parent_key, issue.key) not in seen:
+                seen.add((issue.parent_key, issue.key))
+                parent_to_children.setdefault(issue.parent_key, []).append(issue)
+        return parent_to_children
     
     @staticmethod
     def get_hierarchical_list(groups: Dict[str, HierarchicalGroup]) -> List[Tuple[str, HierarchicalGroup]]:
@@ -266,13 +313,23 @@ class HierarchyService:
         Returns:
             List of (epic_key, group) tuples sorted by epic key
         """
-        # Sort by epic key (orphan groups last)
-        orphan_groups = [(k, g) for k, g in groups.items() if k.startswith("__orphan__")]
-        epic_groups = [(k, g) for k, g in groups.items() if not k.startswith("__orphan__")]
-        
-        # Sort epic groups by epic key
-        epic_groups.sort(key=lambda x: x[0])
-        orphan_groups.sort(key=lambda x: x[0])
+        return list(HierarchyService.iter_hierarchical(groups))
+    
+    @staticmethod
+    def iter_hierarchical(groups: Dict[str, HierarchicalGroup]) -> Iterator[Tuple[str, HierarchicalGroup]]:
+        """Iterate over hierarchical groups in sorted order.
         
-        return epic_groups + orphan_groups
+        Args:
+            groups: Dictionary of hierarchical groups
+            
+        Yields:
+            (epic_key, group) tuples sorted by epic key, orphan groups last
+        """
+        # Sort by epic key (orphan groups last); group_by_hierarchy() output is already
+        # in this order, which a linear check detects without sorting
+        sort_keys = [_group_sort_key(key) for key in groups]
+        if any(a > b for a, b in zip(sort_keys, sort_keys[1:])):
+            sort_keys.sort()
+        for _, key in sort_keys:
+            yield key, groups[key]
 
@@ -0,0 +1,97 @@
+"""Persistent SQLite cache of raw Jira issue payloads for repeat runs."""
+
+import json
+import sqlite3
+from typing import Any, Dict, Iterable
+
+try:
+    import orjson  # Optional: faster (de)serialization of cached payloads
+except ImportError:
+    orjson = None
+
+# SQLite's default limit on bound parameters per statement is 999
+_SELECT_CHUNK_SIZE = 500
+
+
+def _dumps(value: Any) -> str:
+    """Serialize a payload to JSON text, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(value).decode()
+    return json.dumps(value)
+
+
+def _loads(text: str) -> Any:
+    """Deserialize a cached JSON payload, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+class IssueCache:
+    """On-disk store of /search issue payloads keyed by issue key.
+    
+    Each row keeps the issue's `updated` timestamp and the field list it was
+    fetched with; a cached payload is only reused while both still match, so
+    any edit in Jira (which bumps `updated`) forces a re-fetch. Every store()
+    commits, so the connection can stay open until the process exits.
+    """
+    
+    def __init__(self, path: str):
+        """Open (or create) the cache database.
+        
+        Args:
+            path: SQLite database file path
+        
+        Raises:
+            sqlite3.Error: If the database cannot be opened
+        """
+        self.path = path
+        self._conn = sqlite3.connect(path)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS issues ("
+            "key TEXT PRIMARY KEY, updated TEXT, fields TEXT, payload TEXT)"
+        )
+    
+    def get_fresh(self, versions: Dict[str, str], fields: str) -> Dict[str, dict]:
+        """Get cached payloads that are still current.
+        
+        Args:
+            versions: Dictionary mapping issue key to its current `updated` value
+            fields: Comma-separated field list the payloads must have been fetched with
+        
+        Returns:
+            Dictionary mapping issue key to the cached issue dictionary
+        
+        Raises:
+            sqlite3.Error: If the lookup fails
+        """
+        keys = list(versions)
+        fresh: Dict[str, dict] = {}
+        for i in range(0, len(keys), _SELECT_CHUNK_SIZE):
+            chunk = keys[i:i + _SELECT_CHUNK_SIZE]
+            placeholders = ','.join('?' * len(chunk))
+            rows = self._conn.execute(
+                f"SELECT key, updated, payload FROM issues WHERE fields = ? AND key IN ({placeholders})",
+                [fields, *chunk]
+            )
+            for key, updated, payload in rows:
+                if updated == versions[key]:
+                    fresh[key] = _loads(payload)
+        return fresh
+    
+    def store(self, issues: Iterable[dict], fields: str) -> None:
+        """Insert or replace issue payloads.
+        
+        Args:
+            issues: Raw issue dictionaries from /search
+            fields: Comma-separated field list the payloads were fetched with
+        
+        Raises:
+            sqlite3.Error: If the write fails
+        """
+        rows = [
+            (issue['key'], (issue.get('fields') or {}).get('updated'), fields, _dumps(issue))
+            for issue in issues
+        ]
+        with self._conn:
+            self._conn.executemany("INSERT OR REPLACE INTO issues VALUES (?, ?, ?, ?)", rows)
@@ -1,21 +1,172 @@
 """Jira API service for issues and work logs using requests library."""
 
-from typing import List, Optional
-from datetime import datetime, date, timedelta
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+from datetime import datetime, date, timedelta, timezone
+from functools import lru_cache
 from calendar import monthrange
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import re
+import sqlite3
 import requests
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
+from rich.progress import Progress
 
-from ..config.auth import JiraAuth, extract_jira_error_payload, safe_parse_response
+from ..config.auth import HTTP_POOL_SIZE, JiraAuth, extract_jira_error_payload, parse_json_response, safe_parse_response
 from ..models.issue import Issue
 from ..models.worklog import WorkLog, WorkLogEntry, SyncResult, ExistingWorkLog, WorkLogUpdate
-from ..utils.formatters import format_time_hours
+from ..utils.progress import make_progress
+from .filter_service import ORDER_BY_RE
 from decimal import Decimal
 
 console = Console()
 
+# Issues requested per /search page, and pages fetched concurrently after the first.
+# Jira may cap the page lower (Cloud returns at most 100); paging follows the size
+# actually returned, so a large request only saves round trips where it is honoured.
+SEARCH_PAGE_SIZE = 500
+SEARCH_PAGE_WORKERS = 5
+
+_SECS_PER_HOUR = Decimal(3600)
+
+# Completed requests between progress description refreshes in fan-out loops
+PROGRESS_UPDATE_EVERY = 10
+
+# Worklog ID in an HTML response: "worklog...id: N", "id: N", "/worklog/N" or "worklogId=N"
+_WORKLOG_ID_RE = re.compile(
+    r'(?:worklog[^\s]*["\']?\s*id["\']?\s*[:=]|id["\']?\s*:|/worklog/|worklogId["\']?\s*[:=])\s*["\']?(\d+)',
+    re.IGNORECASE
+)
+
+# Shared read-only fallback for missing/null JSON objects; never mutate
+_EMPTY: dict = {}
+
+# Issue keys per `key in (...)` lookup search
+KEY_LOOKUP_CHUNK_SIZE = 100
+
+# Worklog IDs per POST /worklog/list request (Jira's limit)
+WORKLOG_LIST_CHUNK_SIZE = 1000
+
+# Slack applied to started-time bounds sent to Jira: the client-side range check
+# compares wall-clock times in each worklog's own offset (up to +/-14h)
+_STARTED_BOUND_SLACK = timedelta(days=1)
+
+# Common Epic Link field IDs, tried when the field cannot be discovered
+_EPIC_LINK_FALLBACK_FIELDS = ('customfield_10014', 'customfield_10010', 'customfield_10013', 'customfield_10015')
+
+
+@lru_cache(maxsize=None)
+def _utc_offset(sign: str, hours: int, minutes: int) -> timezone:
+    """Return a (shared) timezone for a +HHMM / -HHMM offset."""
+    offset = timedelta(hours=hours, minutes=minutes)
+    return timezone(-offset if sign == '-' else offset)
+
+
+def _parse_jira_dt(value: str) -> datetime:
+    """Parse a Jira timestamp such as 2024-01-31T09:30:00.000+0100.
+    
+    Jira always sends this fixed-width layout, so it is sliced directly;
+    anything else goes through datetime.fromisoformat, which accepts a
+    trailing Z as of Python 3.11.
+    
+    Args:
+        value: Timestamp string from the Jira API
+        
+    Returns:
+        Timezone-aware datetime
+        
+    Raises:
+        ValueError: If the string is not a valid ISO 8601 timestamp
+    """
+    if len(value) == 28 and value[10] == 'T' and value[19] == '.' and value[23] in '+-':
+        try:
+            return datetime(
+                int(value[0:4]), int(value[5:7]), int(value[8:10]),
+                int(value[11:13]), int(value[14:16]), int(value[17:19]),
+                int(value[20:23]) * 1000,
+                tzinfo=_utc_offset(value[23], int(value[24:26]), int(value[26:28]))
+            )
+        except ValueError:
+            pass
+    return datetime.fromisoformat(value)
+
+
+def _parse_optional_jira_dt(value: Optional[str]) -> Optional[datetime]:
+    """Parse a Jira timestamp field that may be missing or malformed.
+    
+    Args:
+        value: Timestamp string from the Jira API (or None)
+        
+    Returns:
+        Timezone-aware datetime, or None if the value is empty or unparseable
+    """
+    if not value:
+        return None
+    try:
+        return _parse_jira_dt(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _and_jql(jql: str, condition: str) -> str:
+    """AND an extra condition onto a JQL query, keeping any trailing ORDER BY.
+    
+    Args:
+        jql: JQL query string
+        condition: JQL condition to require in addition
+        
+    Returns:
+        Combined JQL query
+    """
+    # Leading space so a query that is only an ORDER BY still matches
+    padded = f" {jql}"
+    order_by_match = ORDER_BY_RE.search(padded) if 'ORDER' in jql.upper() else None
+    if order_by_match:
+        where, order_by = padded[:order_by_match.start()].strip(), padded[order_by_match.start():]
+    else:
+        where, order_by = jql.strip(), ''
+    if not where:
+        return f"{condition}{order_by}"
+    return f"({where}) AND {condition}{order_by}"
+
+
+def _format_jira_dt(value: datetime) -> str:
+    """Format a datetime as a Jira 'started' value (YYYY-MM-DDTHH:MM:SS.000+0000)."""
+    return (f"{value.year:04d}-{value.month:02d}-{value.day:02d}"
+            f"T{value.hour:02d}:{value.minute:02d}:{value.second:02d}.000+0000")
+
+
+@lru_cache(maxsize=4096)
+def _iso_midnight(day: date) -> str:
+    """Format the start of a day as a Jira 'started' value; batches reuse few dates."""
+    return f"{day.year:04d}-{day.month:02d}-{day.day:02d}T00:00:00.000+0000"
+
+
+
+def _format_jira_error(error: requests.exceptions.RequestException) -> Tuple[str, str]:
+    """Summarize a failed Jira request for a SyncResult message.
+    
+    Args:
+        error: Exception raised by JiraAuth._make_request
+        
+    Returns:
+        Tuple of (short message, message followed by the full error payload)
+    """
+    error_msg = str(error)
+    error_payload = None
+    if getattr(error, 'response', None) is not None:
+        error_payload = extract_jira_error_payload(error.response)
+        if error_payload['errorMessages']:
+            error_msg = ', '.join(error_payload['errorMessages'])
+        elif error_payload['errors']:
+            error_msg = ', '.join(f"{k}: {v}" for k, v in error_payload['errors'].items())
+        else:
+            error_msg = error_payload['formatted'] or error_msg
+    
+    # Include full error payload for detailed debugging
+    if error_payload and error_payload['json_pretty']:
+        return error_msg, f"{error_msg}\n\nFull error payload:\n{error_payload['json_pretty']}"
+    return error_msg, error_msg
+
 
 class JiraService:
     """Service for Jira API operations using requests library."""
@@ -28,8 +179,30 @@ class JiraService:
         """
         self.auth = auth or JiraAuth()
         self._current_user: Optional[dict] = None
-        self._epic_link_field_id: Optional[str] = None  # Cache discovered Epic Link field ID
-        self._epic_name_field_id: Optional[str] = None  # Cache discovered Epic Name field ID
+        # Epic field IDs: configured via settings, otherwise discovered from /field on first use
+        self._epic_link_field_id: Optional[str] = self.auth.settings.jira_epic_link_field_id or None
+        self._epic_name_field_id: Optional[str] = self.auth.settings.jira_epic_name_field_id or None
+        self._epic_fields_scanned = False  # Field list already searched for both epic fields
+        self._filter_service = None  # Created on first use, see filter_service
+        self._fields_cache: Optional[List[dict]] = None  # Cache /field response
+        self._issue_db = None  # Opened on first use when JIRA_ISSUE_CACHE is set
+        self._issue_cache: Dict[str, dict] = {}  # Cache get_issue_details responses by key
+        self._issue_exists_cache: Dict[str, bool] = {}  # Cache dry-run issue key checks, hits and misses
+    
+    @property
+    def filter_service(self):
+        """Filter service sharing this service's auth.
+        
+        Kept for the lifetime of the service so its favourite-filter and
+        filter JQL caches are reused across calls.
+        
+        Returns:
+            FilterService instance
+        """
+        if self._filter_service is None:
+            from .filter_service import FilterService
+            self._filter_service = FilterService(self.auth)
+        return self._filter_service
     
     def get_current_user(self) -> Optional[dict]:
         """Get current authenticated user information.
@@ -61,9 +234,7 @@ class JiraService:
             List of Issue objects
         """
         try:
-            from .filter_service import FilterService
-            filter_service = FilterService(self.auth)
-            jql = filter_service.get_filter_jql(filter_id)
+            jql = self.filter_service.get_filter_jql(filter_id)
             
             if not jql:
                 console.print(f"[red]Filter {filter_id} not found or has no JQL query.[/red]")
@@ -75,6 +246,66 @@ class JiraService:
             console.print(f"[red]Error getting issues from filter:[/red] {str(e)}")
             return []
     
+    def _get_all_fields(self) -> Optional[List[dict]]:
+        """Get the list of all Jira fields, fetching /field only once.
+        
+        Returns:
+            List of field dictionaries, or None if Jira answered with HTML
+            
+        Raises:
+            requests.exceptions.RequestException: If the request fails
+        """
+        if self._fields_cache is None:
+            response = self.auth._make_request('GET', '/field')
+            fields_data = safe_parse_response(response)
+            if isinstance(fields_data, dict):
+                # HTML or otherwise unexpected payload instead of the field list
+                return None
+            self._fields_cache = fields_data
+        return self._fields_cache
+    
+    def _discover_epic_fields(self) -> bool:
+        """Find the Epic Link and Epic Name field IDs in a single pass over /field.
+        
+        The first field whose name contains "epic" and "link" (resp. "name")
+        wins; the scan stops once both are known.
+        
+        Returns:
+            True if the field list was available, False on an HTML response
+            
+        Raises:
+            requests.exceptions.RequestException: If fetching /field fails
+        """
+        # Get all fields from Jira API (fetched once per service)
+        fields_data = self._get_all_fields()
+        if fields_data is None:
+            return False
+        
+        if self._epic_fields_scanned:
+            return True
+        
+        for field in fields_data:
+            if self._epic_link_field_id and self._epic_name_field_id:
+                break
+            
+            field_name = (field.get('name') or '').lower()
+            if 'epic' not in field_name:
+                continue
+            field_id = field.get('id', '')
+            
+            # Look for "Epic Link" and "Epic Name" fields
+            if not self._epic_link_field_id and 'link' in field_name:
+                self._epic_link_field_id = field_id
+                console.print(f"[green]Discovered Epic Link field ID:[/green] {field_id} "
+                              f"[dim](set JIRA_EPIC_LINK_FIELD_ID={field_id} to skip discovery)[/dim]")
+            if not self._epic_name_field_id and 'name' in field_name:
+                self._epic_name_field_id = field_id
+                console.print(f"[green]Discovered Epic Name field ID:[/green] {field_id} "
+                              f"[dim](set JIRA_EPIC_NAME_FIELD_ID={field_id} to skip discovery)[/dim]")
+        
+        self._epic_fields_scanned = True
+        return True
+    
     def discover_epic_link_field_id(self) -> Optional[str]:
         """Discover the Epic Link custom field ID from Jira API.
         
@@ -87,24 +318,12 @@ class JiraService:
             return self._epic_link_field_id
         
         try:
-            # Get all fields from Jira API
-            response = self.auth._make_request('GET', '/field')
-            fields_data = safe_parse_response(response)
-            
-            if fields_data.get('is_html'):
+            if not self._discover_epic_fields():
                 console.print("[yellow]Warning:[/yellow] Could not discover Epic Link field (HTML response)")
                 return None
             
-            # Search for Epic Link field
-            for field in fields_data:
-                field_name = field.get('name', '').lower()
-                field_id = field.get('id', '')
-                
-                # Look for "Epic Link" field
-                if 'epic' in field_name and 'link' in field_name:
-                    self._epic_link_field_id = field_id
-                    console.print(f"[green]Discovered Epic Link field ID:[/green] {field_id}")
-                    return field_id
+            if self._epic_link_field_id:
+                return self._epic_link_field_id
             
             console.print("[yellow]Warning:[/yellow] Epic Link field not found in field list")
             return None
@@ -125,24 +344,12 @@ class JiraService:
             return self._epic_name_field_id
         
         try:
-            # Get all fields from Jira API
-            response = self.auth._make_request('GET', '/field')
-            fields_data = safe_parse_response(response)
-            
-            if fields_data.get('is_html'):
+            if not self._discover_epic_fields():
                 console.print("[yellow]Warning:[/yellow] Could not discover Epic Name field (HTML response)")
                 return None
             
-            # Search for Epic Name field
-            for field in fields_data:
-                field_name = field.get('name', '').lower()
-                field_id = field.get('id', '')
-                
-                # Look for "Epic Name" field
-                if 'epic' in field_name and 'name' in field_name:
-                    self._epic_name_field_id = field_id
-                    console.print(f"[green]Discovered Epic Name field ID:[/green] {field_id}")
-                    return field_id
+            if self._epic_name_field_id:
+                return self._epic_name_field_id
             
             console.print("[yellow]Warning:[/yellow] Epic Name field not found in field list")
             return None
@@ -154,262 +361,423 @@ class JiraService:
     def get_issue_details(self, issue_key: str) -> Optional[dict]:
         """Get issue details by issue key.
         
+        Successful lookups are cached for the lifetime of the service.
+        
         Args:
             issue_key: Jira issue key
             
         Returns:
             Dictionary with issue details or None if not found
         """
+        cached = self._issue_cache.get(issue_key)
+        if cached is not None:
+            return cached
         try:
             response = self.auth._make_request('GET', f'/issue/{issue_key}')
-            return response.json()
+            issue_data = parse_json_response(response)
+            if issue_data:
+                self._issue_cache[issue_key] = issue_data
+            return issue_data
         except requests.exceptions.RequestException:
             return None
         except Exception:
             return None
     
-    def get_issues_from_jql(self, jql: str) -> List[Issue]:
-        """Get issues from JQL query.
+    def _fetch_search_page(self, body: dict, start_at: int) -> Optional[dict]:
+        """Fetch one page of /search results.
+        
+        The query is sent as a POST body so long JQL and field lists never
+        run into URL length limits.
+        
+        Args:
+            body: Search request body (without startAt)
+            start_at: Index of the first issue of the page
+            
+        Returns:
+            Parsed search response, or None if Jira answered with HTML
+        """
+        response = self.auth._make_request('POST', '/search', json={**body, 'startAt': start_at})
+        result = safe_parse_response(response)
+        if result.get('is_html'):
+            console.print("[yellow]Warning:[/yellow] Received HTML response from /search endpoint")
+            return None
+        return result
+    
+    def _iter_search_pages(self, jql: str, fields: List[str], expand: Optional[List[str]] = None) -> Iterator[dict]:
+        """Iterate over all issues matching a JQL query, one /search page at a time.
+        
+        The first page reports the total; the remaining pages are then
+        requested concurrently (up to SEARCH_PAGE_WORKERS at a time) and
+        yielded in order, so results are never silently capped.
         
         Args:
             jql: JQL query string
+            fields: Issue fields to return
+            expand: Optional expand options
+            
+        Yields:
+            Raw issue dictionaries in search order
+            
+        Raises:
+            requests.exceptions.RequestException: If a search request fails
+        """
+        body = {'jql': jql, 'fields': fields, 'maxResults': SEARCH_PAGE_SIZE}
+        if expand:
+            body['expand'] = expand
+        
+        first = self._fetch_search_page(body, 0)
+        if first is None:
+            return
+        page = first.get('issues', [])
+        yield from page
+        
+        # Step by the size Jira actually returned; it may cap maxResults lower
+        page_size = len(page)
+        total = first.get('total', page_size)
+        if not page or page_size >= total:
+            return
+        
+        offsets = range(page_size, total, page_size)
+        with ThreadPoolExecutor(max_workers=min(SEARCH_PAGE_WORKERS, len(offsets))) as executor:
+            for result in executor.map(lambda start_at: self._fetch_search_page(body, start_at), offsets):
+                if result is None:
+                    return
+                yield from result.get('issues', [])
+    
+    def get_issues_by_keys(self, issue_keys: List[str], fields: Optional[List[str]] = None) -> Dict[str, dict]:
+        """Get several issues by key with bulk `key in (...)` searches.
+        
+        Keys are sent KEY_LOOKUP_CHUNK_SIZE at a time via POST /search instead
+        of one GET /issue/{key} each. Unknown keys are simply absent from the
+        result; a chunk whose search fails is skipped with a warning.
+        
+        Args:
+            issue_keys: Jira issue keys
+            fields: Issue fields to return (Jira's default set if None)
             
         Returns:
-            List of Issue objects
+            Dictionary mapping issue key to the raw issue dictionary
+        """
+        unique_keys = list(dict.fromkeys(issue_keys))
+        issues: Dict[str, dict] = {}
+        
+        for i in range(0, len(unique_keys), KEY_LOOKUP_CHUNK_SIZE):
+            chunk = unique_keys[i:i + KEY_LOOKUP_CHUNK_SIZE]
+            quoted = ', '.join('"' + key.replace('\\', '\\\\').replace('"', '\\"') + '"' for key in chunk)
+            # validateQuery=warn: unknown keys are reported as warnings, not errors
+            body = {'jql': f'key in ({quoted})', 'maxResults': len(chunk), 'validateQuery': 'warn'}
+            if fields is not None:
+                body['fields'] = fields
+            
+            start_at = 0
+            try:
+                while True:
+                    response = self.auth._make_request('POST', '/search', json={**body, 'startAt': start_at})
+                    result = safe_parse_response(response)
+                    if result.get('is_html'):
+                        console.print("[yellow]Warning:[/yellow] Received HTML response from /search endpoint")
+                        break
+                    
+                    page = result.get('issues', [])
+                    for issue_data in page:
+                        issues[issue_data.get('key')] = issue_data
+                    start_at += len(page)
+                    if not page or start_at >= result.get('total', start_at):
+                        break
+            except requests.exceptions.RequestException as e:
+                console.print(f"[yellow]Warning:[/yellow] Issue lookup failed: {str(e)}")
+        
+        return issues
+    
+    def _get_issue_db(self):
+        """Open the persistent issue cache configured by JIRA_ISSUE_CACHE.
+        
+        Returns:
+            IssueCache instance, or None if no cache path is configured or the
+            database cannot be opened
+        """
+        if self._issue_db is None:
+            path = self.auth.settings.jira_issue_cache
+            if not path:
+                return None
+            from .issue_cache import IssueCache
+            try:
+                self._issue_db = IssueCache(path)
+            except sqlite3.Error as e:
+                console.print(f"[yellow]Warning:[/yellow] Issue cache disabled: {str(e)}")
+                return None
+        return self._issue_db
+    
+    def _search_issues_cached(self, jql: str, fields: List[str]) -> List[dict]:
+        """Get all issues matching a JQL query, reusing unchanged cached payloads.
+        
+        With a persistent cache configured, the query is first run for the
+        `updated` field only; just the issues that are new or changed since
+        they were cached are then fetched in full by key. Without a cache this
+        is a plain paged search.
+        
+        Args:
+            jql: JQL query string
+            fields: Issue fields to return (must include 'updated')
+            
+        Returns:
+            Raw issue dictionaries in search order
+            
+        Raises:
+            requests.exceptions.RequestException: If a search request fails
         """
+        issue_db = self._get_issue_db()
+        if issue_db is None:
+            return list(self._iter_search_pages(jql, fields))
+        
+        versions = {
+            issue_data.get('key'): (issue_data.get('fields') or _EMPTY).get('updated')
+            for issue_data in self._iter_search_pages(jql, ['updated'])
+        }
+        fields_key = ','.join(fields)
         try:
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=console
-            ) as progress:
-                task = progress.add_task("Fetching issues from Jira...", total=None)
-                
-                # Discover Epic Link and Epic Name field IDs dynamically
-                epic_link_field_id = self.discover_epic_link_field_id()
-                epic_name_field_id = self.discover_epic_name_field_id()
-                
-                # Build fields list for API request
-                # Include discovered field IDs and common fallback IDs
-                fields_list = [
-                    'summary', 'issuetype', 'status', 'project', 'assignee', 
-                    'created', 'updated', 'parent', 'subtasks'
-                ]
-                
-                # Add discovered Epic Link field ID
-                if epic_link_field_id:
-                    fields_list.append(epic_link_field_id)
-                else:
-                    # Fallback to common Epic Link field IDs
-                    fields_list.extend(['customfield_10014', 'customfield_10010', 'customfield_10013', 'customfield_10015'])
-                
-                # Add discovered Epic Name field ID
+            cached = issue_db.get_fresh(versions, fields_key)
+        except sqlite3.Error as e:
+            console.print(f"[yellow]Warning:[/yellow] Issue cache read failed: {str(e)}")
+            return list(self._iter_search_pages(jql, fields))
+        
+        stale_keys = [key for key in versions if key not in cached]
+        fetched = self.get_issues_by_keys(stale_keys, fields) if stale_keys else {}
+        if any(key not in fetched for key in stale_keys):
+            # A lookup chunk failed (or an issue moved or vanished in between); rather than
+            # return a silently truncated result, run the full search instead
+            return list(self._iter_search_pages(jql, fields))
+        if fetched:
+            try:
+                issue_db.store(fetched.values(), fields_key)
+            except sqlite3.Error as e:
+                console.print(f"[yellow]Warning:[/yellow] Issue cache write failed: {str(e)}")
+        
+        return [cached[key] if key in cached else fetched[key] for key in versions]
+    
+    def _issue_search_fields(self) -> Tuple[List[str], Tuple[str, ...], Optional[str]]:
+        """Build the /search field list needed to construct Issue objects.
+        
+        Returns:
+            Tuple of (fields to request, Epic Link candidate field IDs,
+            discovered Epic Name field ID or None)
+        """
+        # Discover Epic Link and Epic Name field IDs dynamically
+        epic_link_field_id = self.discover_epic_link_field_id()
+        epic_name_field_id = self.discover_epic_name_field_id()
+        
+        # Build fields list for API request
+        # Only the fields _build_issues reads: project comes from the issue key and
+        # subtasks are rebuilt from parent links, so neither is requested
+        fields_list = [
+            'summary', 'issuetype', 'status', 'assignee',
+            'created', 'updated', 'parent'
+        ]
+        
+        # Add discovered Epic Link field ID, or fall back to common IDs;
+        # only these candidates can be present in the response
+        epic_link_candidates = (epic_link_field_id,) if epic_link_field_id else _EPIC_LINK_FALLBACK_FIELDS
+        fields_list.extend(epic_link_candidates)
+        
+        # Add discovered Epic Name field ID
+        if epic_name_field_id:
+            fields_list.append(epic_name_field_id)
+        else:
+            # Fallback to common Epic Name field ID
+            fields_list.append('customfield_10011')
+        
+        return fields_list, epic_link_candidates, epic_name_field_id
+    
+    def _build_issues(
+        self,
+        issues_data: List[dict],
+        epic_link_candidates: Tuple[str, ...],
+        epic_name_field_id: Optional[str]
+    ) -> List[Issue]:
+        """Convert raw /search issues into Issue objects with resolved hierarchy.
+        
+        Args:
+            issues_data: Raw issue dictionaries from /search
+            epic_link_candidates: Field IDs that may hold the Epic Link
+            epic_name_field_id: Discovered Epic Name field ID (None if unknown)
+            
+        Returns:
+            List of Issue objects in search order
+        """
+        result = [None] * len(issues_data)
+        issue_map: Dict[str, Issue] = {}
+        for index, issue_data in enumerate(issues_data):
+            key = issue_data.get('key') or ''
+            fields = issue_data.get('fields') or _EMPTY
+            
+            issue_type_name = (fields.get('issuetype') or _EMPTY).get('name', 'Unknown')
+            issue_type_lower = issue_type_name.lower()
+            status_name = (fields.get('status') or _EMPTY).get('name', 'Unknown')
+            project_key = key.partition('-')[0] if '-' in key else None
+            
+            assignee_name = (fields.get('assignee') or _EMPTY).get('displayName')
+            
+            # Get Parent issue key (for Subtasks) - handle multiple data formats
+            parent_key = None
+            parent_data = fields.get('parent')
+            if parent_data:
+                if isinstance(parent_data, dict):
+                    parent_key = parent_data.get('key')
+                elif isinstance(parent_data, str):
+                    parent_key = parent_data
+                elif hasattr(parent_data, 'key'):
+                    parent_key = parent_data.key
+            
+            # Get Epic Link (for Stories/Tasks under Epics) from the first
+            # requested candidate field that is set, then alternative names
+            parent_epic_key = None
+            epic_link = (
+                next((fields[field_id] for field_id in epic_link_candidates if fields.get(field_id)), None)
+                or fields.get('epic') or fields.get('parentEpic')
+            )
+            
+            if epic_link:
+                # Epic Link can be a string (key), dict with 'key', or object with 'key' attribute
+                if isinstance(epic_link, str):
+                    parent_epic_key = epic_link
+                elif isinstance(epic_link, dict):
+                    parent_epic_key = epic_link.get('key') or epic_link.get('value') or epic_link.get('id')
+                elif hasattr(epic_link, 'key'):
+                    parent_epic_key = epic_link.key
+            
+            # Determine parent issue type
+            parent_issue_type = None
+            if parent_key:
+                # For Subtasks, parent is a Story/Task, find parent's type
+                # We'll resolve this after all issues are processed
+                parent_issue_type = None  # Will be resolved later
+            elif parent_epic_key:
+                # For Stories/Tasks under Epics, parent is Epic
+                parent_issue_type = "Epic"
+            
+            # Get Epic name/key if this is an Epic
+            epic_key = None
+            if issue_type_lower == 'epic':
+                # Try discovered field ID first, then fallback
+                epic_name = None
                 if epic_name_field_id:
-                    fields_list.append(epic_name_field_id)
-                else:
-                    # Fallback to common Epic Name field ID
-                    fields_list.append('customfield_10011')
+                    epic_name = fields.get(epic_name_field_id)
+                if not epic_name:
+                    epic_name = fields.get('customfield_10011')  # Fallback to common Epic Name field
+                if epic_name:
+                    epic_key = key
+            
+            # Determine hierarchy level
+            hierarchy_level = 0
+            if issue_type_lower == 'epic':
+                hierarchy_level = 0
+            elif issue_type_lower == 'subtask' or parent_key:
+                hierarchy_level = 2
+            else:
+                hierarchy_level = 1  # Story or Task
+            
+            # Parse created and updated dates (None if missing or malformed)
+            created = _parse_optional_jira_dt(fields.get('created'))
+            updated = _parse_optional_jira_dt(fields.get('updated'))
+            
+            # Create issue object first (parent_issue_type may be updated later)
+            issue_obj = Issue(
+                key=key,
+                summary=fields.get('summary', ''),
+                issue_type=issue_type_name,
+                status=status_name,
+                project=project_key,
+                assignee=assignee_name,
+                created=created,
+                updated=updated,
+                parent_key=parent_key,
+                parent_epic_key=parent_epic_key,
+                parent_issue_type=parent_issue_type,
+                epic_key=epic_key,
+                hierarchy_level=hierarchy_level
+            )
+            
+            result[index] = issue_obj
+            issue_map[key] = issue_obj
+        
+        # Resolve parent issue types and propagate parent_epic_key after all issues are processed
+        # epic_of memoizes the Epic each issue passes down to its children, so
+        # every parent chain is walked at most once across all issues
+        epic_of: Dict[str, Optional[str]] = {}
+        
+        def resolve_epic_key(issue_obj: Issue) -> Optional[str]:
+            """Find the Epic an issue passes to its children, memoizing the chain."""
+            chain = []
+            current = issue_obj
+            epic_key = None
+            while current is not None:
+                if current.key in epic_of:
+                    # Already resolved (or a cycle back into this chain)
+                    epic_key = epic_of[current.key]
+                    break
+                epic_of[current.key] = None
+                chain.append(current.key)
                 
-                # Search issues using JQL with expanded fields for hierarchy
-                # Include parent and epic link fields explicitly
-                response = self.auth._make_request('GET', '/search', params={
-                    'jql': jql,
-                    'maxResults': 1000,
-                    'expand': 'names,renderedFields,changelog',
-                    'fields': ','.join(fields_list)
-                })
+                # If this is an Epic, return it
+                if current.issue_type_lower == 'epic':
+                    epic_key = current.key
+                    break
                 
-                result_data = safe_parse_response(response)
-                if result_data.get('is_html'):
-                    console.print("[yellow]Warning:[/yellow] Received HTML response from /search endpoint")
-                    return []
+                # If has direct parent_epic_key pointing at a known Epic, use it
+                epic_issue = issue_map.get(current.parent_epic_key) if current.parent_epic_key else None
+                if epic_issue is not None and epic_issue.issue_type_lower == 'epic':
+                    epic_key = epic_issue.key
+                    break
                 
-                issues_data = result_data.get('issues', [])
+                # Move up parent chain
+                current = issue_map.get(current.parent_key) if current.parent_key else None
+            
+            for chain_key in chain:
+                epic_of[chain_key] = epic_key
+            return epic_key
+        
+        # Resolve parent types and propagate parent_epic_key
+        for issue in result:
+            parent_issue = issue_map.get(issue.parent_key) if issue.parent_key else None
+            if parent_issue is not None:
+                issue.parent_issue_type = parent_issue.issue_type
                 
-                progress.update(task, description="Processing issues with hierarchy...")
+                # Inherit the parent's Epic (e.g., Task under Story with Epic)
+                if not issue.parent_epic_key:
+                    epic_key = resolve_epic_key(parent_issue)
+                    if epic_key:
+                        issue.parent_epic_key = epic_key
+            elif issue.parent_epic_key:
+                # For Stories/Tasks under Epics, parent type is Epic
+                epic_issue = issue_map.get(issue.parent_epic_key)
+                if epic_issue is not None and epic_issue.issue_type_lower == 'epic':
+                    issue.parent_issue_type = "Epic"
+        
+        return result
+    
+    def get_issues_from_jql(self, jql: str, progress: Optional[Progress] = None) -> List[Issue]:
+        """Get issues from JQL query.
+        
+        Args:
+            jql: JQL query string
+            progress: Running progress display to report on (creates its own if None)
+            
+        Returns:
+            List of Issue objects
+        """
+        try:
+            with make_progress(shared=progress) as progress:
+                task = progress.add_task("Fetching issues from Jira...", total=None)
                 
-                result = []
-                for issue_data in issues_data:
-                    fields = issue_data.get('fields', {})
-                    
-                    issue_type_name = fields.get('issuetype', {}).get('name', 'Unknown')
-                    status_name = fields.get('status', {}).get('name', 'Unknown')
-                    project_key = issue_data.get('key', '').split('-')[0] if '-' in issue_data.get('key', '') else None
-                    
-                    assignee_data = fields.get('assignee')
-                    assignee_name = assignee_data.get('displayName') if assignee_data else None
-                    
-                    # Get Parent issue key (for Subtasks) - handle multiple data formats
-                    parent_key = None
-                    parent_data = fields.get('parent')
-                    if parent_data:
-                        if isinstance(parent_data, dict):
-                            parent_key = parent_data.get('key')
-                        elif isinstance(parent_data, str):
-                            parent_key = parent_data
-                        elif hasattr(parent_data, 'key'):
-                            parent_key = parent_data.key
-                    
-                    # Get Epic Link (for Stories/Tasks under Epics)
-                    # Use discovered field ID first, then fallback to common IDs
-                    parent_epic_key = None
-                    epic_link = None
-                    
-                    # Try discovered field ID first
-                    if epic_link_field_id:
-                        epic_link = fields.get(epic_link_field_id)
-                    
-                    # Try common Epic Link field IDs as fallback
-                    if not epic_link:
-                        for field_id in ['customfield_10014', 'customfield_10010', 'customfield_10013', 'customfield_10015']:
-                            epic_link = fields.get(field_id)
-                            if epic_link:
-                                break
-                    
-                    # Also try alternative field names
-                    if not epic_link:
-                        epic_link = fields.get('epic') or fields.get('parentEpic')
-                    
-                    if epic_link:
-                        # Epic Link can be a string (key), dict with 'key', or object with 'key' attribute
-                        if isinstance(epic_link, str):
-                            parent_epic_key = epic_link
-                        elif isinstance(epic_link, dict):
-                            parent_epic_key = epic_link.get('key') or epic_link.get('value') or epic_link.get('id')
-                        elif hasattr(epic_link, 'key'):
-                            parent_epic_key = epic_link.key
-                    
-                    # Determine parent issue type
-                    parent_issue_type = None
-                    if parent_key:
-                        # For Subtasks, parent is a Story/Task, find parent's type
-                        # We'll resolve this after all issues are processed
-                        parent_issue_type = None  # Will be resolved later
-                    elif parent_epic_key:
-                        # For Stories/Tasks under Epics, parent is Epic
-                        parent_issue_type = "Epic"
-                    
-                    # Get Epic name/key if this is an Epic
-                    epic_key = None
-                    if issue_type_name.lower() == 'epic':
-                        # Try discovered field ID first, then fallback
-                        epic_name = None
-                        if epic_name_field_id:
-                            epic_name = fields.get(epic_name_field_id)
-                        if not epic_name:
-                            epic_name = fields.get('customfield_10011')  # Fallback to common Epic Name field
-                        if epic_name:
-                            epic_key = issue_data.get('key')
-                    
-                    # Determine hierarchy level
-                    hierarchy_level = 0
-                    if issue_type_name.lower() == 'epic':
-                        hierarchy_level = 0
-                    elif issue_type_name.lower() == 'subtask' or parent_key:
-                        hierarchy_level = 2
-                    else:
-                        hierarchy_level = 1  # Story or Task
-                    
-                    # Parse created and updated dates
-                    created_str = fields.get('created')
-                    created = None
-                    if created_str:
-                        try:
-                            created = datetime.fromisoformat(created_str.replace('Z', '+00:00'))
-                        except:
-                            pass
-                    
-                    updated_str = fields.get('updated')
-                    updated = None
-                    if updated_str:
-                        try:
-                            updated = datetime.fromisoformat(updated_str.replace('Z', '+00:00'))
-                        except:
-                            pass
-                    
-                    # Create issue object first (parent_issue_type may be updated later)
-                    issue_obj = Issue(
-                        key=issue_data.get('key', ''),
-                        summary=fields.get('summary', ''),
-                        issue_type=issue_type_name,
-                        status=status_name,
-                        project=project_key,
-                        assignee=assignee_name,
-                        created=created,
-                        updated=updated,
-                        parent_key=parent_key,
-                        parent_epic_key=parent_epic_key,
-                        parent_issue_type=parent_issue_type,
-                        epic_key=epic_key,
-                        hierarchy_level=hierarchy_level
-                    )
-                    
-                    result.append(issue_obj)
+                fields_list, epic_link_candidates, epic_name_field_id = self._issue_search_fields()
                 
-                # Resolve parent issue types and propagate parent_epic_key after all issues are processed
-                issue_map = {issue.key: issue for issue in result}
+                # Search issues using JQL; no expand, nothing reads names,
+                # rendered fields or changelog
+                issues_data = self._search_issues_cached(jql, fields_list)
                 
-                # Helper function to find Epic for an issue
-                def find_epic_key(issue_obj: Issue) -> Optional[str]:
-                    """Find Epic key by traversing parent chain."""
-                    visited = set()
-                    current = issue_obj
-                    max_depth = 10  # Prevent infinite loops
-                    depth = 0
-                    
-                    while current and depth < max_depth:
-                        if current.key in visited:
-                            break
-                        visited.add(current.key)
-                        
-                        # If this is an Epic, return it
-                        if current.issue_type.lower() == 'epic':
-                            return current.key
-                        
-                        # If has direct parent_epic_key, use it
-                        if current.parent_epic_key:
-                            epic_key = current.parent_epic_key
-                            if epic_key in issue_map:
-                                epic_issue = issue_map[epic_key]
-                                if epic_issue.issue_type.lower() == 'epic':
-                                    return epic_key
-                        
-                        # Move up parent chain
-                        if current.parent_key and current.parent_key in issue_map:
-                            current = issue_map[current.parent_key]
-                            depth += 1
-                        else:
-                            break
-                    
-                    return None
+                progress.update(task, description="Processing issues with hierarchy...")
                 
-                # Resolve parent types and propagate parent_epic_key
-                for issue in result:
-                    if issue.parent_key and issue.parent_key in issue_map:
-                        parent_issue = issue_map[issue.parent_key]
-                        issue.parent_issue_type = parent_issue.issue_type
-                        
-                        # Propagate parent_epic_key: if parent has parent_epic_key, child should inherit it
-                        if not issue.parent_epic_key and parent_issue.parent_epic_key:
-                            # Verify the Epic exists
-                            epic_key = parent_issue.parent_epic_key
-                            if epic_key in issue_map:
-                                epic_issue = issue_map[epic_key]
-                                if epic_issue.issue_type.lower() == 'epic':
-                                    issue.parent_epic_key = epic_key
-                    elif issue.parent_epic_key and issue.parent_epic_key in issue_map:
-                        # For Stories/Tasks under Epics, parent type is Epic
-                        epic_issue = issue_map[issue.parent_epic_key]
-                        if epic_issue.issue_type.lower() == 'epic':
-                            issue.parent_issue_type = "Epic"
-                    
-                    # If issue doesn't have parent_epic_key but should (e.g., Task under Story with Epic)
-                    if not issue.parent_epic_key and issue.parent_key and issue.parent_key in issue_map:
-                        parent_issue = issue_map[issue.parent_key]
-                        # Find Epic for parent and propagate to this issue
-                        epic_key = find_epic_key(parent_issue)
-                        if epic_key:
-                            issue.parent_epic_key = epic_key
+                result = self._build_issues(issues_data, epic_link_candidates, epic_name_field_id)
                 
                 progress.update(task, description=f"[green]Found {len(result)} issue(s)[/green]")
             
@@ -443,11 +811,10 @@ class JiraService:
             # Format started datetime as ISO 8601 (JIRA format: YYYY-MM-DDTHH:MM:SS.000+0000)
             if worklog.started:
                 # Ensure UTC timezone format
-                started_str = worklog.started.strftime('%Y-%m-%dT%H:%M:%S.000+0000')
+                started_str = _format_jira_dt(worklog.started)
             else:
                 # Default to start of work_date at UTC
-                started = datetime.combine(worklog_entry.work_date, datetime.min.time())
-                started_str = started.strftime('%Y-%m-%dT%H:%M:%S.000+0000')
+                started_str = _iso_midnight(worklog_entry.work_date)
             
             # Prepare worklog data
             worklog_data = {
@@ -466,21 +833,10 @@ class JiraService:
             if worklog_result.get('is_html'):
                 # Try to extract worklog ID from HTML
                 html_text = worklog_result.get('text', '')
-                worklog_id = None
                 
-                # Look for worklog ID in HTML
-                id_patterns = [
-                    r'worklog[^\s]*["\']?\s*id["\']?\s*[:=]\s*["\']?(\d+)',
-                    r'id["\']?\s*:\s*["\']?(\d+)',
-                    r'/worklog/(\d+)',
-                    r'worklogId["\']?\s*[:=]\s*["\']?(\d+)',
-                ]
-                
-                for pattern in id_patterns:
-                    matches = re.findall(pattern, html_text, re.IGNORECASE)
-                    if matches:
-                        worklog_id = matches[0]
-                        break
+                # Look for worklog ID in HTML (single scan over all known layouts)
+                match = _WORKLOG_ID_RE.search(html_text)
+                worklog_id = match.group(1) if match else None
                 
                 # If we have a worklog_id, consider it successful
                 if worklog_id:
@@ -511,21 +867,7 @@ class JiraService:
             )
             
         except requests.exceptions.RequestException as e:
-            error_msg = str(e)
-            error_payload = None
-            if hasattr(e, 'response') and e.response is not None:
-                error_payload = extract_jira_error_payload(e.response)
-                if error_payload['errorMessages']:
-                    error_msg = ', '.join(error_payload['errorMessages'])
-                elif error_payload['errors']:
-                    error_msg = ', '.join([f"{k}: {v}" for k, v in error_payload['errors'].items()])
-                else:
-                    error_msg = error_payload['formatted'] or error_msg
-            
-            # Include full error payload in message for detailed debugging
-            full_error = f"{error_msg}"
-            if error_payload and error_payload['json_pretty']:
-                full_error += f"\n\nFull error payload:\n{error_payload['json_pretty']}"
+            error_msg, full_error = _format_jira_error(e)
             
             if "Worklog" in error_msg or "already" in error_msg.lower():
                 return SyncResult(
@@ -545,63 +887,177 @@ class JiraService:
                 message=f"Unexpected error: {str(e)}"
             )
     
-    def add_worklogs_batch(self, worklog_entries: List[WorkLogEntry], dry_run: bool = False) -> List[SyncResult]:
+    def _run_concurrently(self, func, items: list, progress: Optional[Progress], task, max_workers: int) -> list:
+        """Apply func to every item on a thread pool, advancing the progress task.
+        
+        Args:
+            func: Callable taking one item and returning its result
+            items: Items to process
+            progress: Progress display (None for no display)
+            task: Progress task ID advanced once per completed item
+            max_workers: Maximum number of concurrent requests
+            
+        Returns:
+            Results in the same order as items
+        """
+        results = [None] * len(items)
+        for index, result in self._iter_concurrently(func, items, progress, task, max_workers):
+            results[index] = result
+        return results
+    
+    def _iter_concurrently(
+        self, func, items: list, progress: Optional[Progress], task, max_workers: int
+    ) -> Iterator[Tuple[int, object]]:
+        """Apply func to every item on a thread pool, yielding results as they finish.
+        
+        Args:
+            func: Callable taking one item and returning its result
+            items: Items to process
+            progress: Progress display (None for no display)
+            task: Progress task ID advanced once per completed item
+            max_workers: Maximum number of concurrent requests
+            
+        Yields:
+            Tuples of (index in items, result) in completion order
+        """
+        if not items:
+            return
+        
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(items)))) as executor:
+            futures = {executor.submit(func, item): index for index, item in enumerate(items)}
+            for future in as_completed(futures):
+                if progress:
+                    progress.advance(task)
+                yield futures[future], future.result()
+    
+    def _issue_exists(self, issue_key: str) -> bool:
+        """Check whether an issue key can be read.
+        
+        Args:
+            issue_key: Jira issue key
+            
+        Returns:
+            True if GET /issue/{key} succeeds
+        """
+        try:
+            self.auth._make_request('GET', f'/issue/{issue_key}', params={'fields': 'key'})
+            return True
+        except requests.exceptions.RequestException:
+            return False
+    
+    def _find_existing_issue_keys(self, issue_keys: List[str], max_workers: int = HTTP_POOL_SIZE) -> set:
+        """Find which of the given issue keys exist.
+        
+        Keys are looked up in bulk with get_issues_by_keys; keys the search
+        does not return (moved issues, failed chunks) are then checked
+        individually. Outcomes are cached for the lifetime of the service,
+        so repeated dry runs only look up keys they have not seen.
+        
+        Args:
+            issue_keys: Jira issue keys
+            max_workers: Maximum number of concurrent individual checks
+            
+        Returns:
+            Set of the keys that exist
+        """
+        known = self._issue_exists_cache
+        known.update(dict.fromkeys(self._issue_cache.keys() - known.keys(), True))
+        unique_keys = [key for key in dict.fromkeys(issue_keys) if key not in known]
+        
+        if unique_keys:
+            found = set(self.get_issues_by_keys(unique_keys, fields=['key']))
+            missing = [key for key in unique_keys if key not in found]
+            if missing:
+                with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(missing)))) as executor:
+                    found.update(key for key, exists in zip(missing, executor.map(self._issue_exists, missing)) if exists)
+            known.update((key, key in found) for key in unique_keys)
+        
+        return {key for key in issue_keys if known[key]}
+    
+    def _entry_validation_result(self, entry: WorkLogEntry, issue_exists: bool) -> SyncResult:
+        """Build the dry-run result of a work log entry.
+        
+        Args:
+            entry: Work log entry being validated
+            issue_exists: Whether the entry's issue exists
+            
+        Returns:
+            SyncResult describing the validation outcome
+        """
+        if issue_exists:
+            return SyncResult(
+                issue_key=entry.issue_key,
+                success=True,
+                message=f"Validation passed ({entry.time_logged_hours}h on {entry.work_date})"
+            )
+        return SyncResult(
+            issue_key=entry.issue_key,
+            success=False,
+            message=f"Issue {entry.issue_key} not found"
+        )
+    
+    def add_worklogs_batch(
+        self,
+        worklog_entries: List[WorkLogEntry],
+        dry_run: bool = False,
+        max_workers: int = HTTP_POOL_SIZE,
+        progress: Optional[Progress] = None
+    ) -> List[SyncResult]:
         """Add multiple work logs in batch.
         
+        Entries are sent concurrently over the shared connection pool;
+        results keep the order of worklog_entries. A dry run checks all
+        issue keys with batched searches instead of one request per entry.
+        
         Args:
             worklog_entries: List of work log entries
             dry_run: If True, validate only without adding
+            max_workers: Maximum number of concurrent requests (default: 16)
+            progress: Running progress display to report on (creates its own if None)
             
         Returns:
             List of SyncResult objects
         """
-        results = []
-        
         if dry_run:
             console.print("[yellow]DRY RUN MODE:[/yellow] Validating work logs without adding to Jira...\n")
         
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console
-        ) as progress:
-            task = progress.add_task(
-                f"[cyan]Processing {len(worklog_entries)} work log(s)...[/cyan]",
-                total=len(worklog_entries)
-            )
+        description = f"[cyan]Processing {len(worklog_entries)} work log(s)...[/cyan]"
+        with make_progress(len(worklog_entries), progress) as progress:
+            task = progress.add_task(description, total=len(worklog_entries))
             
-            for entry in worklog_entries:
-                if dry_run:
-                    # Just validate
-                    try:
-                        # Validate issue key exists
-                        try:
-                            self.auth._make_request('GET', f'/issue/{entry.issue_key}')
-                            results.append(SyncResult(
-                                issue_key=entry.issue_key,
-                                success=True,
-                                message=f"Validation passed ({entry.time_logged_hours}h on {entry.work_date})"
-                            ))
-                        except requests.exceptions.RequestException:
-                            results.append(SyncResult(
-                                issue_key=entry.issue_key,
-                                success=False,
-                                message=f"Issue {entry.issue_key} not found"
-                            ))
-                    except Exception as e:
-                        results.append(SyncResult(
-                            issue_key=entry.issue_key,
-                            success=False,
-                            message=f"Validation error: {str(e)}"
-                        ))
-                else:
-                    # Actually add work log
-                    result = self.add_worklog(entry.issue_key, entry)
-                    results.append(result)
-                
-                progress.advance(task)
+            if dry_run:
+                existing_keys = self._find_existing_issue_keys([e.issue_key for e in worklog_entries], max_workers)
+                return [self._entry_validation_result(entry, entry.issue_key in existing_keys) for entry in worklog_entries]
+            
+            return self._run_concurrently(
+                lambda entry: self.add_worklog(entry.issue_key, entry),
+                worklog_entries, progress, task, max_workers
+            )
+    
+    def iter_sync_results(
+        self,
+        worklog_entries: List[WorkLogEntry],
+        max_workers: int = HTTP_POOL_SIZE
+    ) -> Iterator[Tuple[WorkLogEntry, SyncResult]]:
+        """Add multiple work logs, yielding each result as soon as it is known.
         
-        return results
+        Like add_worklogs_batch without dry run, but results arrive in
+        completion order paired with their entry, so callers can report
+        progress per entry instead of waiting for the whole batch (several
+        entries often share an issue key, one per day).
+        
+        Args:
+            worklog_entries: List of work log entries
+            max_workers: Maximum number of concurrent requests (default: 16)
+            
+        Yields:
+            Tuples of (entry, SyncResult) in completion order
+        """
+        for index, result in self._iter_concurrently(
+            lambda entry: self.add_worklog(entry.issue_key, entry),
+            worklog_entries, None, None, max_workers
+        ):
+            yield worklog_entries[index], result
     
     def get_worklogs_from_filter(
         self, 
@@ -622,9 +1078,7 @@ class JiraService:
             List of ExistingWorkLog objects (includes empty worklogs for issues with no worklogs if include_all_issues=True)
         """
         try:
-            from .filter_service import FilterService
-            filter_service = FilterService(self.auth)
-            jql = filter_service.get_filter_jql(filter_id)
+            jql = self.filter_service.get_filter_jql(filter_id)
             
             if not jql:
                 console.print(f"[red]Filter {filter_id} not found or has no JQL query.[/red]")
@@ -641,12 +1095,276 @@ class JiraService:
             console.print(f"[red]Error getting worklogs from filter:[/red] {str(e)}")
             return []
     
+    def _fetch_issue_worklogs(self, issue_key: str, params: Optional[dict] = None) -> Optional[List[dict]]:
+        """Fetch the raw worklogs of a single issue.
+        
+        Args:
+            issue_key: Jira issue key
+            params: Optional query parameters (e.g. startedAfter/startedBefore)
+            
+        Returns:
+            List of worklog dictionaries, or None if the issue could not be read
+        """
+        try:
+            response = self.auth._make_request('GET', f'/issue/{issue_key}/worklog', params=params)
+            result = safe_parse_response(response)
+            if result.get('is_html'):
+                return None
+            return result.get('worklogs', [])
+        except requests.exceptions.RequestException:
+            return None
+    
+    def _fetch_worklogs_for_issues(
+        self,
+        issue_keys: List[str],
+        progress: Optional[Progress],
+        task,
+        params: Optional[dict] = None,
+        max_workers: int = HTTP_POOL_SIZE
+    ) -> Dict[str, Optional[List[dict]]]:
+        """Fetch worklogs of several issues concurrently.
+        
+        The requests share the session's keep-alive pool, so at most
+        max_workers of them are in flight at a time.
+        
+        Args:
+            issue_keys: Jira issue keys
+            progress: Progress display to update as issues complete (None for no display)
+            task: Progress task ID
+            params: Optional query parameters sent with every worklog request
+            max_workers: Maximum number of concurrent requests (default: 16)
+            
+        Returns:
+            Dictionary mapping issue key to its raw worklogs (None if unreadable)
+        """
+        worklogs_by_issue: Dict[str, Optional[List[dict]]] = {}
+        if not issue_keys:
+            return worklogs_by_issue
+        
+        unique_keys = list(dict.fromkeys(issue_keys))
+        total = len(unique_keys)
+        with ThreadPoolExecutor(max_workers=min(max_workers, total)) as executor:
+            futures = {executor.submit(self._fetch_issue_worklogs, key, params): key for key in unique_keys}
+            for done, future in enumerate(as_completed(futures), 1):
+                worklogs_by_issue[futures[future]] = future.result()
+                if progress and (done % PROGRESS_UPDATE_EVERY == 0 or done == total):
+                    progress.update(task, description=f"Fetching worklogs ({done}/{total})...")
+        
+        return worklogs_by_issue
+    
+    def iter_worklogs_from_jql(
+        self,
+        jql: str,
+        include_all_issues: bool = True,
+        filter_by_current_user: bool = True,
+        time_range: Optional[str] = None,  # 'previous' or 'current' month
+        max_workers: int = HTTP_POOL_SIZE,
+        progress: Optional[Progress] = None,
+        issues_data: Optional[List[dict]] = None
+    ) -> Iterator[ExistingWorkLog]:
+        """Yield existing work logs from issues in a JQL query, one at a time.
+        
+        Worklogs are built as they are consumed instead of being collected
+        into a list first; unlike get_worklogs_from_jql, errors are raised
+        rather than reported. See get_worklogs_from_jql for the other arguments.
+        
+        Args:
+            issues_data: Raw /search issues (with the worklog field) already
+                fetched for jql; searched here if None
+        
+        Yields:
+            ExistingWorkLog objects in issue order
+            
+        Raises:
+            requests.exceptions.RequestException: If a Jira request fails
+        """
+        # Get current user if filtering by user
+        current_user_account_id = None
+        current_user_name = None
+        if filter_by_current_user:
+            user_info = self.get_current_user()
+            if user_info:
+                current_user_account_id = user_info.get('accountId')
+                current_user_name = user_info.get('name') or user_info.get('key')
+                if not current_user_account_id and current_user_name:
+                    # Fallback to name if accountId not available
+                    console.print(f"[dim]Using username '{current_user_name}' for worklog filtering[/dim]")
+            else:
+                console.print("[yellow]Warning:[/yellow] Could not get current user info, filtering by user disabled")
+                filter_by_current_user = False
+        
+        # Calculate time range if specified
+        time_start = None
+        time_end = None
+        if time_range in ['previous', 'current']:
+            now = datetime.now()
+            if time_range == 'current':
+                # Current month: first day of current month to last day of current month
+                time_start = datetime(now.year, now.month, 1)
+                last_day = monthrange(now.year, now.month)[1]
+                time_end = datetime(now.year, now.month, last_day, 23, 59, 59)
+            elif time_range == 'previous':
+                # Previous month: first day of previous month to last day of previous month
+                if now.month == 1:
+                    prev_month = 12
+                    prev_year = now.year - 1
+                else:
+                    prev_month = now.month - 1
+                    prev_year = now.year
+                time_start = datetime(prev_year, prev_month, 1)
+                last_day = monthrange(prev_year, prev_month)[1]
+                time_end = datetime(prev_year, prev_month, last_day, 23, 59, 59)
+            
+            console.print(f"[dim]Filtering worklogs by time range: {time_start.date()} to {time_end.date()}[/dim]")
+        
+        # Range bounds in Jira's wall-clock layout (YYYY-MM-DDTHH:MM:SS.sss), so
+        # fixed-width 'started' values can be range-checked as text before parsing
+        range_start = time_start.isoformat(timespec='milliseconds') if time_start else None
+        range_end = time_end.isoformat(timespec='milliseconds') if time_end else None
+        
+        # Issues without matching worklogs are not reported, so let Jira skip
+        # them; the filters below still apply (worklogDate follows the Jira
+        # user's timezone, hence the one-day margin)
+        search_jql = jql
+        if issues_data is None and not include_all_issues:
+            if filter_by_current_user:
+                search_jql = _and_jql(search_jql, 'worklogAuthor = currentUser()')
+            if time_start and time_end:
+                search_jql = _and_jql(
+                    search_jql,
+                    f'worklogDate >= "{(time_start - _STARTED_BOUND_SLACK).date()}" '
+                    f'AND worklogDate <= "{(time_end + _STARTED_BOUND_SLACK).date()}"'
+                )
+        
+        with make_progress(shared=progress) as progress:
+            task = progress.add_task("Fetching issues from Jira...", total=None)
+            
+            # Search issues using JQL with worklogs inlined; with the issue cache
+            # enabled only issues updated since the last run are fetched again
+            # (adding, editing or deleting a worklog bumps the issue's `updated`)
+            if issues_data is None:
+                issues_data = self._search_issues_cached(search_jql, ['worklog', 'updated'])
+            
+            progress.update(task, description=f"Processing {len(issues_data)} issue(s)...")
+            
+            # Jira inlines only the first worklogs of each issue; fetch the
+            # complete list separately for issues that exceed that cap
+            issue_keys = []
+            worklogs_by_issue = {}
+            truncated_keys = []
+            for issue_data in issues_data:
+                issue_key = issue_data.get('key', '')
+                issue_keys.append(issue_key)
+                worklog_field = (issue_data.get('fields') or {}).get('worklog')
+                if worklog_field is None:
+                    truncated_keys.append(issue_key)
+                    continue
+                inline_worklogs = worklog_field.get('worklogs', [])
+                if worklog_field.get('total', 0) > len(inline_worklogs):
+                    truncated_keys.append(issue_key)
+                else:
+                    worklogs_by_issue[issue_key] = inline_worklogs
+            
+            # With a time range, let Jira drop worklogs that are clearly outside it
+            # (Cloud honours startedAfter/startedBefore; older servers ignore them)
+            worklog_params = None
+            if time_start and time_end:
+                worklog_params = {
+                    'startedAfter': int((time_start - _STARTED_BOUND_SLACK).timestamp() * 1000),
+                    'startedBefore': int((time_end + _STARTED_BOUND_SLACK).timestamp() * 1000),
+                }
+            worklogs_by_issue.update(self._fetch_worklogs_for_issues(
+                truncated_keys, progress, task, worklog_params, max_workers
+            ))
+            
+            found = 0
+            
+            # Pick the author check once: match by accountId first, fallback to name
+            if not filter_by_current_user:
+                matches_user = None
+            elif current_user_account_id:
+                matches_user = lambda author: author.get('accountId') == current_user_account_id
+            elif current_user_name:
+                matches_user = lambda author: (author.get('name') or author.get('key')) == current_user_name
+            else:
+                matches_user = lambda author: False
+            check_range = bool(time_range and (time_start or time_end))
+            
+            for issue_key in issue_keys:
+                issue_has_worklogs = False
+                
+                issue_worklogs = worklogs_by_issue.get(issue_key)
+                if issue_worklogs is None:
+                    # HTML response, no worklog access or issue doesn't exist
+                    if include_all_issues:
+                        found += 1
+                        yield ExistingWorkLog.create_empty(issue_key)
+                    continue
+                
+                for wl in issue_worklogs:
+                    # Filter by current user if enabled
+                    author_data = wl.get('author') or _EMPTY
+                    if matches_user is not None and not matches_user(author_data):
+                        continue
+                    
+                    # Filter by time range if specified, comparing the worklog's own
+                    # wall-clock time; out-of-range worklogs are never parsed
+                    started_str = wl.get('started')
+                    if check_range and started_str:
+                        if len(started_str) == 28 and started_str[10] == 'T':
+                            wall_clock = started_str[:23]
+                            if (range_start and wall_clock < range_start) or (range_end and wall_clock > range_end):
+                                continue
+                            started = _parse_optional_jira_dt(started_str)
+                        else:
+                            started = _parse_optional_jira_dt(started_str)
+                            if started is not None:
+                                started_naive = started.replace(tzinfo=None)
+                                if (time_start and started_naive < time_start) or (time_end and started_naive > time_end):
+                                    continue
+                        
+                        if started is None:
+                            # If we can't parse the date, skip this worklog
+                            continue
+                    else:
+                        started = _parse_optional_jira_dt(started_str)
+                    
+                    if started is None:
+                        started = datetime.now()
+                    
+                    time_spent_seconds = wl.get('timeSpentSeconds', 0)
+                    time_spent_hours = Decimal(time_spent_seconds) / _SECS_PER_HOUR
+                    
+                    comment = wl.get('comment', '')
+                    author = author_data.get('displayName') if author_data else None
+                    
+                    found += 1
+                    yield ExistingWorkLog(
+                        worklog_id=str(wl.get('id', '')),
+                        issue_key=issue_key,
+                        time_spent_seconds=time_spent_seconds,
+                        time_spent_hours=time_spent_hours,
+                        comment=comment or "",
+                        started=started,
+                        author=author
+                    )
+                    issue_has_worklogs = True
+                
+                # If include_all_issues and this issue has no matching worklogs, add empty entry
+                if include_all_issues and not issue_has_worklogs:
+                    found += 1
+                    yield ExistingWorkLog.create_empty(issue_key)
+            
+            progress.update(task, description=f"[green]Found {found} work log entry(ies)[/green]")
+    
     def get_worklogs_from_jql(
         self, 
         jql: str,
         include_all_issues: bool = True,
         filter_by_current_user: bool = True,
-        time_range: Optional[str] = None  # 'previous' or 'current' month
+        time_range: Optional[str] = None,  # 'previous' or 'current' month
+        max_workers: int = HTTP_POOL_SIZE,
+        progress: Optional[Progress] = None
     ) -> List[ExistingWorkLog]:
         """Get existing work logs from issues in JQL query.
         
@@ -655,170 +1373,68 @@ class JiraService:
             include_all_issues: If True, include all issues even if they have no worklogs (default: True)
             filter_by_current_user: If True, only include worklogs from current user (default: True)
             time_range: Time range filter - 'previous' for previous month, 'current' for current month, None for all
+            max_workers: Maximum number of concurrent worklog requests (default: 16)
+            progress: Running progress display to report on (creates its own if None)
             
         Returns:
             List of ExistingWorkLog objects (includes empty worklogs for issues with no worklogs if include_all_issues=True)
         """
         try:
-            # Get current user if filtering by user
-            current_user_account_id = None
-            current_user_name = None
-            if filter_by_current_user:
-                user_info = self.get_current_user()
-                if user_info:
-                    current_user_account_id = user_info.get('accountId')
-                    current_user_name = user_info.get('name') or user_info.get('key')
-                    if not current_user_account_id and current_user_name:
-                        # Fallback to name if accountId not available
-                        console.print(f"[dim]Using username '{current_user_name}' for worklog filtering[/dim]")
-                else:
-                    console.print("[yellow]Warning:[/yellow] Could not get current user info, filtering by user disabled")
-                    filter_by_current_user = False
-            
-            # Calculate time range if specified
-            time_start = None
-            time_end = None
-            if time_range in ['previous', 'current']:
-                now = datetime.now()
-                if time_range == 'current':
-                    # Current month: first day of current month to last day of current month
-                    time_start = datetime(now.year, now.month, 1)
-                    last_day = monthrange(now.year, now.month)[1]
-                    time_end = datetime(now.year, now.month, last_day, 23, 59, 59)
-                elif time_range == 'previous':
-                    # Previous month: first day of previous month to last day of previous month
-                    if now.month == 1:
-                        prev_month = 12
-                        prev_year = now.year - 1
-                    else:
-                        prev_month = now.month - 1
-                        prev_year = now.year
-                    time_start = datetime(prev_year, prev_month, 1)
-                    last_day = monthrange(prev_year, prev_month)[1]
-                    time_end = datetime(prev_year, prev_month, last_day, 23, 59, 59)
-                
-                console.print(f"[dim]Filtering worklogs by time range: {time_start.date()} to {time_end.date()}[/dim]")
+            return list(self.iter_worklogs_from_jql(
+                jql, include_all_issues, filter_by_current_user, time_range, max_workers, progress
+            ))
+            
+        except requests.exceptions.RequestException as e:
+            console.print(f"[red]Jira API error:[/red] {str(e)}")
+            if hasattr(e, 'response') and e.response is not None:
+                error_payload = extract_jira_error_payload(e.response)
+                if error_payload['formatted']:
+                    console.print(f"[yellow]Error details:[/yellow]\n{error_payload['formatted']}")
+            return []
+        except Exception as e:
+            console.print(f"[red]Error getting worklogs from JQL:[/red] {str(e)}")
+            return []
+    
+    def get_issues_and_worklogs_from_jql(
+        self,
+        jql: str,
+        include_all_issues: bool = True,
+        filter_by_current_user: bool = True,
+        time_range: Optional[str] = None,  # 'previous' or 'current' month
+        max_workers: int = HTTP_POOL_SIZE
+    ) -> Tuple[List[Issue], List[ExistingWorkLog]]:
+        """Get issues and their existing work logs from a single JQL search.
+        
+        Same results as get_issues_from_jql plus get_worklogs_from_jql for the
+        same query, but the issue fields and the inlined worklogs are requested
+        together, so the query is only paginated once.
+        
+        Args:
+            jql: JQL query string
+            include_all_issues: If True, include all issues even if they have no worklogs (default: True)
+            filter_by_current_user: If True, only include worklogs from current user (default: True)
+            time_range: Time range filter - 'previous' for previous month, 'current' for current month, None for all
+            max_workers: Maximum number of concurrent worklog requests (default: 16)
             
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=console
-            ) as progress:
+        Returns:
+            Tuple of (Issue objects, ExistingWorkLog objects); both empty on error
+        """
+        try:
+            with make_progress() as progress:
                 task = progress.add_task("Fetching issues from Jira...", total=None)
                 
-                # Search issues using JQL
-                response = self.auth._make_request('GET', '/search', params={
-                    'jql': jql,
-                    'maxResults': 1000,
-                    'expand': 'names'
-                })
-                
-                result = safe_parse_response(response)
-                if result.get('is_html'):
-                    console.print("[yellow]Warning:[/yellow] Received HTML response from /search endpoint")
-                    return []
-                
-                issues_data = result.get('issues', [])
-                
-                progress.update(task, description=f"Processing {len(issues_data)} issue(s)...")
+                fields_list, epic_link_candidates, epic_name_field_id = self._issue_search_fields()
+                issues_data = self._search_issues_cached(jql, fields_list + ['worklog'])
                 
-                worklogs = []
-                issues_with_worklogs = set()
-                
-                for issue_data in issues_data:
-                    issue_key = issue_data.get('key', '')
-                    issue_has_worklogs = False
-                    
-                    try:
-                        # Get worklogs for this issue
-                        worklog_response = self.auth._make_request('GET', f'/issue/{issue_key}/worklog')
-                        worklog_result = safe_parse_response(worklog_response)
-                        
-                        if worklog_result.get('is_html'):
-                            # HTML response - skip this issue
-                            if include_all_issues:
-                                worklogs.append(ExistingWorkLog.create_empty(issue_key))
-                            continue
-                        
-                        issue_worklogs = worklog_result.get('worklogs', [])
-                        
-                        for wl in issue_worklogs:
-                            # Filter by current user if enabled
-                            if filter_by_current_user:
-                                author_data = wl.get('author', {})
-                                wl_account_id = author_data.get('accountId')
-                                wl_name = author_data.get('name') or author_data.get('key')
-                                
-                                # Match by accountId first, fallback to name
-                                if current_user_account_id:
-                                    if wl_account_id != current_user_account_id:
-                                        continue
-                                elif current_user_name:
-                                    if wl_name != current_user_name:
-                                        continue
-                                else:
-                                    continue
-                            
-                            # Filter by time range if specified
-                            if time_range and (time_start or time_end):
-                                started_str = wl.get('started')
-                                if started_str:
-                                    try:
-                                        started = datetime.fromisoformat(started_str.replace('Z', '+00:00'))
-                                        # Convert to local time for comparison
-                                        if started.tzinfo:
-                                            started = started.replace(tzinfo=None)
-                                        
-                                        # Check if worklog is within time range
-                                        if time_start and started < time_start:
-                                            continue
-                                        if time_end and started > time_end:
-                                            continue
-                                    except:
-                                        # If we can't parse the date, skip this worklog
-                                        continue
-                            
-                            time_spent_seconds = wl.get('timeSpentSeconds', 0)
-                            time_spent_hours = Decimal(str(time_spent_seconds)) / Decimal("3600")
-                            
-                            started_str = wl.get('started')
-                            started = None
-                            if started_str:
-                                try:
-                                    started = datetime.fromisoformat(started_str.replace('Z', '+00:00'))
-                                except:
-                                    started = datetime.now()
-                            else:
-                                started = datetime.now()
-                            
-                            comment = wl.get('comment', '')
-                            author_data = wl.get('author', {})
-                            author = author_data.get('displayName') if author_data else None
-                            
-                            worklogs.append(ExistingWorkLog(
-                                worklog_id=str(wl.get('id', '')),
-                                issue_key=issue_key,
-                                time_spent_seconds=time_spent_seconds,
-                                time_spent_hours=time_spent_hours,
-                                comment=comment or "",
-                                started=started,
-                                author=author
-                            ))
-                            issue_has_worklogs = True
-                            issues_with_worklogs.add(issue_key)
-                    except requests.exceptions.RequestException:
-                        # Issue doesn't have worklog access or doesn't exist
-                        if include_all_issues:
-                            worklogs.append(ExistingWorkLog.create_empty(issue_key))
-                        continue
-                    
-                    # If include_all_issues and this issue has no matching worklogs, add empty entry
-                    if include_all_issues and not issue_has_worklogs and issue_key not in issues_with_worklogs:
-                        worklogs.append(ExistingWorkLog.create_empty(issue_key))
+                progress.update(task, description="Processing issues with hierarchy...")
+                issues = self._build_issues(issues_data, epic_link_candidates, epic_name_field_id)
+                progress.update(task, description=f"[green]Found {len(issues)} issue(s)[/green]")
                 
-                progress.update(task, description=f"[green]Found {len(worklogs)} work log entry(ies)[/green]")
+                worklogs = list(self.iter_worklogs_from_jql(
+                    jql, include_all_issues, filter_by_current_user, time_range, max_workers, progress, issues_data
+                ))
             
-            return worklogs
+            return issues, worklogs
             
         except requests.exceptions.RequestException as e:
             console.print(f"[red]Jira API error:[/red] {str(e)}")
@@ -826,10 +1442,10 @@ class JiraService:
                 error_payload = extract_jira_error_payload(e.response)
                 if error_payload['formatted']:
                     console.print(f"[yellow]Error details:[/yellow]\n{error_payload['formatted']}")
-            return []
+            return [], []
         except Exception as e:
-            console.print(f"[red]Error getting worklogs from JQL:[/red] {str(e)}")
-            return []
+            console.print(f"[red]Error getting issues and worklogs from JQL:[/red] {str(e)}")
+            return [], []
     
     def update_worklog(self, worklog_update: WorkLogUpdate) -> SyncResult:
         """Update an existing work log in Jira.
@@ -842,11 +1458,10 @@ class JiraService:
         """
         try:
             # Convert new time to seconds
-            new_time_seconds = int(float(worklog_update.new_time_hours) * 3600)
+            new_time_seconds = int(worklog_update.new_time_hours * _SECS_PER_HOUR)
             
-            # Convert date to datetime
-            started = datetime.combine(worklog_update.work_date, datetime.min.time())
-            started_str = started.strftime('%Y-%m-%dT%H:%M:%S.000+0000')
+            # Start of work_date at UTC
+            started_str = _iso_midnight(worklog_update.work_date)
             
             # Prepare update data
             worklog_data = {
@@ -867,21 +1482,7 @@ class JiraService:
             )
             
         except requests.exceptions.RequestException as e:
-            error_msg = str(e)
-            error_payload = None
-            if hasattr(e, 'response') and e.response is not None:
-                error_payload = extract_jira_error_payload(e.response)
-                if error_payload['errorMessages']:
-                    error_msg = ', '.join(error_payload['errorMessages'])
-                elif error_payload['errors']:
-                    error_msg = ', '.join([f"{k}: {v}" for k, v in error_payload['errors'].items()])
-                else:
-                    error_msg = error_payload['formatted'] or error_msg
-            
-            # Include full error payload in message for detailed debugging
-            full_error = f"{error_msg}"
-            if error_payload and error_payload['json_pretty']:
-                full_error += f"\n\nFull error payload:\n{error_payload['json_pretty']}"
+            _, full_error = _format_jira_error(e)
             
             return SyncResult(
                 issue_key=worklog_update.issue_key,
@@ -899,18 +1500,134 @@ class JiraService:
                 operation="update"
             )
     
-    def update_worklogs_from_diff(self, worklog_updates: List[WorkLogUpdate], dry_run: bool = False) -> List[SyncResult]:
+    def _find_existing_worklogs(
+        self,
+        updates: List[WorkLogUpdate],
+        progress: Optional[Progress],
+        task,
+        max_workers: int = HTTP_POOL_SIZE
+    ) -> Set[Tuple[str, str]]:
+        """Check which work logs targeted by updates exist.
+        
+        Worklog IDs are looked up in bulk with POST /worklog/list and their
+        issue IDs resolved with one key search. Updates whose issue key the
+        search does not return (moved or renamed issues, failed chunks), or
+        all updates if the bulk endpoint is unavailable, are checked by
+        reading that issue's worklogs instead.
+        
+        Args:
+            updates: Work log updates to check
+            progress: Progress display to update while reading worklogs (None for no display)
+            task: Progress task ID
+            max_workers: Maximum number of concurrent worklog reads
+            
+        Returns:
+            Set of (issue_key, worklog_id) pairs that exist
+        """
+        issue_key_by_id = {
+            str(issue_data.get('id')): key
+            for key, issue_data in self.get_issues_by_keys([u.issue_key for u in updates], fields=['key']).items()
+        }
+        resolved_keys = set(issue_key_by_id.values())
+        fallback_keys = [u.issue_key for u in updates if u.issue_key not in resolved_keys]
+        
+        existing = self._list_existing_worklogs(
+            [u for u in updates if u.issue_key in resolved_keys], issue_key_by_id
+        )
+        if existing is None:
+            # Bulk lookup unavailable: read every affected issue's worklogs
+            existing = set()
+            fallback_keys = [u.issue_key for u in updates]
+        
+        if fallback_keys:
+            worklogs_by_issue = self._fetch_worklogs_for_issues(fallback_keys, progress, task, max_workers=max_workers)
+            existing.update(
+                (key, str(wl.get('id', '')))
+                for key, issue_worklogs in worklogs_by_issue.items()
+                if issue_worklogs is not None
+                for wl in issue_worklogs
+            )
+        return existing
+    
+    def _list_existing_worklogs(
+        self, updates: List[WorkLogUpdate], issue_key_by_id: Dict[str, str]
+    ) -> Optional[Set[Tuple[str, str]]]:
+        """Look the worklog IDs of updates up with POST /worklog/list.
+        
+        Args:
+            updates: Work log updates whose issue IDs are in issue_key_by_id
+            issue_key_by_id: Dictionary mapping issue ID to issue key
+            
+        Returns:
+            Set of (issue_key, worklog_id) pairs that exist, or None if the
+            bulk endpoint is unavailable
+        """
+        worklog_ids = list(dict.fromkeys(int(u.worklog_id) for u in updates if u.worklog_id.isdigit()))
+        existing = set()
+        try:
+            for i in range(0, len(worklog_ids), WORKLOG_LIST_CHUNK_SIZE):
+                response = self.auth._make_request(
+                    'POST', '/worklog/list', json={'ids': worklog_ids[i:i + WORKLOG_LIST_CHUNK_SIZE]}
+                )
+                result = safe_parse_response(response)
+                if isinstance(result, dict):
+                    # HTML or otherwise unexpected payload
+                    return None
+                for wl in result:
+                    issue_key = issue_key_by_id.get(str(wl.get('issueId')))
+                    if issue_key:
+                        existing.add((issue_key, str(wl.get('id', ''))))
+        except requests.exceptions.RequestException:
+            return None
+        return existing
+    
+    def _update_validation_result(self, update: WorkLogUpdate, worklog_exists: bool) -> SyncResult:
+        """Build the dry-run result of a work log update.
+        
+        Args:
+            update: Work log update being validated
+            worklog_exists: Whether the targeted work log exists
+            
+        Returns:
+            SyncResult describing the validation outcome
+        """
+        if worklog_exists:
+            return SyncResult(
+                issue_key=update.issue_key,
+                worklog_id=update.worklog_id,
+                success=True,
+                message=f"Validation passed ({update.original_time_hours}h -> {update.new_time_hours}h)",
+                operation="update"
+            )
+        return SyncResult(
+            issue_key=update.issue_key,
+            worklog_id=update.worklog_id,
+            success=False,
+            message=f"Work log {update.worklog_id} not found",
+            operation="update"
+        )
+    
+    def update_worklogs_from_diff(
+        self,
+        worklog_updates: List[WorkLogUpdate],
+        dry_run: bool = False,
+        max_workers: int = HTTP_POOL_SIZE
+    ) -> List[SyncResult]:
         """Update multiple work logs from diff comparison.
         
+        Updates are sent concurrently over the shared connection pool;
+        results keep the order of worklog_updates. A dry run checks the
+        worklog IDs in bulk, reading an issue's worklogs only when the bulk
+        lookup cannot vouch for it.
+        
         Args:
             worklog_updates: List of work log updates
             dry_run: If True, validate only without updating
+            max_workers: Maximum number of concurrent requests (default: 16)
             
         Returns:
             List of SyncResult objects
         """
-        results = []
-        
         # Filter only entries with changes
         updates_with_changes = [u for u in worklog_updates if u.has_changes()]
         
@@ -921,51 +1638,15 @@ class JiraService:
         if dry_run:
             console.print("[yellow]DRY RUN MODE:[/yellow] Validating work log updates without applying...\n")
         
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console
-        ) as progress:
-            task = progress.add_task(
-                f"[cyan]Processing {len(updates_with_changes)} work log update(s)...[/cyan]",
-                total=len(updates_with_changes)
-            )
+        description = f"[cyan]Processing {len(updates_with_changes)} work log update(s)...[/cyan]"
+        with make_progress(len(updates_with_changes)) as progress:
+            task = progress.add_task(description, total=len(updates_with_changes))
             
-            for update in updates_with_changes:
-                if dry_run:
-                    # Just validate
-                    try:
-                        # Validate worklog exists
-                        try:
-                            self.auth._make_request('GET', f'/issue/{update.issue_key}/worklog/{update.worklog_id}')
-                            results.append(SyncResult(
-                                issue_key=update.issue_key,
-                                worklog_id=update.worklog_id,
-                                success=True,
-                                message=f"Validation passed ({update.original_time_hours}h -> {update.new_time_hours}h)",
-                                operation="update"
-                            ))
-                        except requests.exceptions.RequestException:
-                            results.append(SyncResult(
-                                issue_key=update.issue_key,
-                                worklog_id=update.worklog_id,
-                                success=False,
-                                message=f"Work log {update.worklog_id} not found",
-                                operation="update"
-                            ))
-                    except Exception as e:
-                        results.append(SyncResult(
-                            issue_key=update.issue_key,
-                            worklog_id=update.worklog_id,
-                            success=False,
-                            message=f"Validation error: {str(e)}",
-                            operation="update"
-                        ))
-                else:
-                    # Actually update work log
-                    result = self.update_worklog(update)
-                    results.append(result)
-                
-                progress.advance(task)
-        
-        return results
+            if dry_run:
+                existing = self._find_existing_worklogs(updates_with_changes, progress, task, max_workers)
+                return [
+                    self._update_validation_result(update, (update.issue_key, update.worklog_id) in existing)
+                    for update in updates_with_changes
+                ]
+            
+            return self._run_concurrently(self.update_worklog, updates_with_changes, progress, task, max_workers)
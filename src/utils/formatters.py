@@ -1,10 +1,19 @@
 """Data formatting utilities."""
 
+import re
 from datetime import datetime, date
 from typing import Optional
 from decimal import Decimal
 
 
+# Zero-padded YYYY-MM-DD, parsed without strptime; other layouts fall back to it
+_DATE_RE = re.compile(r'([0-9]{4})-([0-9]{2})-([0-9]{2})')
+
+# Plain decimal number as float() accepts it (sign, exponent, surrounding whitespace).
+# Shared with validate_time_hours() so both screen input the same way.
+NUMBER_RE = re.compile(r'\s*([+-]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][+-]?\d+)?)\s*')
+
+
 def format_date(d: Optional[date]) -> str:
     """Format date to YYYY-MM-DD string.
     
@@ -55,6 +64,9 @@ def parse_time_hours(time_str: str) -> Decimal:
     Returns:
         Decimal hours
     """
+    if isinstance(time_str, str) and NUMBER_RE.fullmatch(time_str) is None:
+        # Screen out non-numeric text without raising inside float()
+        raise ValueError(f"Invalid time format: {time_str}")
     try:
         return Decimal(str(float(time_str)))
     except (ValueError, TypeError):
@@ -71,6 +83,9 @@ def parse_date(date_str: str) -> date:
         Date object
     """
     try:
+        match = _DATE_RE.fullmatch(date_str)
+        if match:
+            return date(int(match[1]), int(match[2]), int(match[3]))
         return datetime.strptime(date_str, "%Y-%m-%d").date()
     except (ValueError, TypeError) as e:
         raise ValueError(f"Invalid date format: {date_str}. Expected YYYY-MM-DD") from e
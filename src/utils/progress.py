@@ -0,0 +1,77 @@
+"""Progress display shared by the services."""
+
+import os
+from contextlib import nullcontext
+from typing import Optional
+
+from rich.console import Console
+from rich.progress import Progress, SpinnerColumn, TextColumn
+
+console = Console()
+
+# Batches smaller than this are processed without a live progress display
+PROGRESS_MIN_ITEMS = 4
+
+
+class NullProgress:
+    """Stand-in for rich Progress that prints instead of rendering live.
+    
+    Supports the Progress calls the services make (add_task, update,
+    advance), so callers never need to branch on whether a display is shown.
+    The first task description is printed when the task is added and the
+    last one on exit if it changed.
+    """
+    
+    def __init__(self):
+        self.description = None
+        self._printed = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None and self.description and self.description != self._printed:
+            console.print(self.description)
+        return False
+    
+    def add_task(self, description: str, **kwargs) -> int:
+        self.description = self._printed = description
+        console.print(description)
+        return 0
+    
+    def update(self, task_id: int, description: Optional[str] = None, **kwargs) -> None:
+        if description is not None:
+            self.description = description
+    
+    def advance(self, task_id: int, advance: float = 1) -> None:
+        pass
+
+
+def make_progress(item_count: Optional[int] = None, shared=None):
+    """Create the spinner progress display used by the service methods.
+    
+    A live Rich spinner is only started for interactive runs; when output is
+    not a terminal, CI is set or the batch is small, a NullProgress is used.
+    
+    Args:
+        item_count: Number of items the display will track; batches smaller
+            than PROGRESS_MIN_ITEMS get no live display
+        shared: Caller-owned display to add tasks to instead of starting a new one
+    
+    Returns:
+        Context manager yielding a Progress or NullProgress
+    """
+    if shared is not None:
+        # The caller starts and stops the display
+        return nullcontext(shared)
+    if (
+        (item_count is not None and item_count < PROGRESS_MIN_ITEMS)
+        or not console.is_terminal
+        or os.environ.get('CI')
+    ):
+        return NullProgress()
+    return Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        console=console
+    )
@@ -1,7 +1,14 @@
 """Input validation utilities."""
 
+import re
 from typing import Optional
-from datetime import datetime
+
+from .formatters import NUMBER_RE, parse_date
+
+
+# Jira issue key: exactly one hyphen with non-empty project and number parts.
+# Mirrors validate_issue_key() so it can be used with pandas ``str.match``.
+ISSUE_KEY_RE = re.compile(r'^[^-]+-[^-]+$')
 
 
 def validate_date(date_str: str) -> bool:
@@ -14,9 +21,9 @@ def validate_date(date_str: str) -> bool:
         True if valid, False otherwise
     """
     try:
-        datetime.strptime(date_str, "%Y-%m-%d")
+        parse_date(date_str)
         return True
-    except (ValueError, TypeError):
+    except ValueError:
         return False
 
 
@@ -29,6 +36,9 @@ def validate_time_hours(time_str: str) -> bool:
     Returns:
         True if valid, False otherwise
     """
+    # Screen out non-numeric text without raising, which dominates on noisy sheets
+    if isinstance(time_str, str) and NUMBER_RE.fullmatch(time_str) is None:
+        return False
     try:
         hours = float(time_str)
         return 0 < hours <= 24
@@ -48,12 +58,4 @@ def validate_issue_key(issue_key: str) -> bool:
     if not issue_key or not isinstance(issue_key, str):
         return False
     
-    if '-' not in issue_key:
-        return False
-    
-    parts = issue_key.split('-')
-    if len(parts) != 2:
-        return False
-    
-    return bool(parts[0] and parts[1])
-
+    return ISSUE_KEY_RE.match(issue_key) is not None
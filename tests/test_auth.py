@@ -0,0 +1,62 @@
+"""Tests for the Jira authentication helpers."""
+
+import unittest
+from unittest import mock
+
+import requests
+
+from src.config.auth import RATE_LIMIT_LOW_REMAINING, RateLimiter
+
+
+def _response(status=200, **headers):
+    response = requests.Response()
+    response.status_code = status
+    response.headers.update(headers)
+    return response
+
+
+class TestRateLimiterObserve(unittest.TestCase):
+    """Throttling responses pause every later wait() call."""
+    
+    def setUp(self):
+        self.limiter = RateLimiter(rate=1000.0)
+    
+    def _pause(self, response, now=100.0):
+        with mock.patch('src.config.auth.time.time', return_value=now):
+            self.limiter.observe(response)
+        return self.limiter.paused_until - now if self.limiter.paused_until else 0.0
+    
+    def test_429_without_retry_after(self):
+        self.assertEqual(self._pause(_response(429)), 1.0)
+    
+    def test_429_with_retry_after(self):
+        self.assertEqual(self._pause(_response(429, **{'Retry-After': '3'})), 3.0)
+    
+    def test_low_remaining(self):
+        low = str(RATE_LIMIT_LOW_REMAINING - 1)
+        self.assertEqual(self._pause(_response(**{'X-RateLimit-Remaining': low, 'Retry-After': '2'})), 2.0)
+    
+    def test_low_remaining_without_retry_after(self):
+        # A successful response without Retry-After gives no delay to honour
+        low = str(RATE_LIMIT_LOW_REMAINING - 1)
+        self.assertEqual(self._pause(_response(**{'X-RateLimit-Remaining': low})), 0.0)
+    
+    def test_not_throttled(self):
+        self.assertEqual(self._pause(_response(**{'X-RateLimit-Remaining': str(RATE_LIMIT_LOW_REMAINING)})), 0.0)
+        self.assertEqual(self._pause(_response(**{'X-RateLimit-Remaining': 'many', 'Retry-After': '5'})), 0.0)
+        self.assertEqual(self._pause(_response(200, **{'Retry-After': '5'})), 0.0)
+    
+    def test_pause_only_extends(self):
+        self._pause(_response(429, **{'Retry-After': '10'}))
+        self.assertEqual(self._pause(_response(429, **{'Retry-After': '1'})), 10.0)
+    
+    def test_wait_sleeps_until_pause_ends(self):
+        self.limiter.paused_until = 105.0
+        with mock.patch('src.config.auth.time.time', return_value=100.0), \
+                mock.patch('src.config.auth.time.sleep') as sleep:
+            self.limiter.wait()
+        self.assertEqual(sleep.call_args_list[0], mock.call(5.0))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,110 @@
+"""Tests for the Excel template round trip."""
+
+import tempfile
+import unittest
+from datetime import date, datetime
+from decimal import Decimal
+from pathlib import Path
+
+import pandas as pd
+from openpyxl import load_workbook
+
+from src.models.issue import Issue
+from src.models.worklog import SyncResult
+from src.services.excel_service import ExcelService, _coerce_dates, _coerce_hours
+
+
+class TestExcelRoundTrip(unittest.TestCase):
+    """Export a template, fill it in, import it, write the status back and re-read it."""
+    
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.path = str(Path(self._tmp.name) / 'worklogs.xlsx')
+        self.service = ExcelService()
+        self.issues = [
+            Issue(key='PROJ-1', summary='Epic', type='Epic', project='PROJ'),
+            Issue(key='PROJ-2', summary='Story', type='Story', project='PROJ', parent_epic_key='PROJ-1'),
+            Issue(key='PROJ-3', summary='Sub-task', type='Sub-task', project='PROJ', parent_key='PROJ-2'),
+        ]
+    
+    def _fill_template(self):
+        """Fill in time and date the way a user would, and freeze the header row."""
+        wb = load_workbook(self.path)
+        ws = wb['Work Logs']
+        header = [cell.value for cell in ws[1]]
+        time_col = header.index('Time Logged (hours)') + 1
+        date_col = header.index('Date') + 1
+        comment_col = header.index('Comment') + 1
+        ws.cell(row=3, column=time_col, value=1.5)
+        ws.cell(row=3, column=date_col, value='2026-10-01')
+        ws.cell(row=3, column=comment_col, value='Review')
+        ws.cell(row=4, column=time_col, value=2)
+        ws.cell(row=4, column=date_col, value=date(2026, 10, 2))
+        ws.freeze_panes = 'B2'
+        wb.save(self.path)
+        return header
+    
+    def test_import_status_reread(self):
+        self.assertTrue(self.service.export_issues_to_excel(self.issues, self.path))
+        header = self._fill_template()
+        
+        entries = self.service.import_worklogs_from_excel(self.path)
+        self.assertEqual(
+            [(e.issue_key, e.time_logged_hours, e.work_date, e.comment) for e in entries],
+            [
+                ('PROJ-2', Decimal('1.5'), date(2026, 10, 1), 'Review'),
+                ('PROJ-3', Decimal('2'), date(2026, 10, 2), None),
+            ],
+        )
+        
+        results = [
+            SyncResult(issue_key='PROJ-2', worklog_id='100', success=True, message='Added'),
+            SyncResult(issue_key='PROJ-3', success=False, message='Issue does not exist'),
+        ]
+        self.assertTrue(self.service.update_excel_status(self.path, results))
+        
+        synced_path = self.path.replace('.xlsx', '_synced.xlsx')
+        wb = load_workbook(synced_path)
+        ws = wb['Work Logs']
+        status_col = header.index('Status')
+        self.assertEqual([cell.value for cell in ws[1]], header)
+        self.assertEqual(
+            [row[status_col] for row in ws.iter_rows(min_row=2, values_only=True)],
+            ['Pending', '✓ Synced', '✗ Issue does not exist'],
+        )
+        self.assertEqual(ws.freeze_panes, 'B2')
+        self.assertEqual(ws.column_dimensions['C'].width, dict(ExcelService._COL_SPECS)['C'])
+        self.assertIn('Instructions', wb.sheetnames)
+        
+        # The synced file is still a valid import source with the same entries
+        self.assertEqual(self.service.import_worklogs_from_excel(synced_path), entries)
+
+
+
+class TestCoerceColumns(unittest.TestCase):
+    """Cell conversion accepts what parse_date()/parse_time_hours() accept, nothing more."""
+    
+    def test_dates_reject_partial_and_timed_strings(self):
+        values = pd.Series(['2024', '2024-01', '2024-01-05 10:30', '2024-13-01', 45000, True], dtype=object)
+        self.assertTrue(_coerce_dates(values).isna().all())
+    
+    def test_dates_accept_iso_strings_and_date_cells(self):
+        values = pd.Series([' 2024-01-05 ', '2024-1-6', datetime(2024, 1, 7, 9, 30), date(2024, 1, 8), None],
+                           dtype=object)
+        self.assertEqual(
+            list(_coerce_dates(values).dt.date[:4]),
+            [date(2024, 1, 5), date(2024, 1, 6), date(2024, 1, 7), date(2024, 1, 8)],
+        )
+        self.assertTrue(pd.isna(_coerce_dates(values)[4]))
+    
+    def test_hours_reject_booleans(self):
+        values = pd.Series([True, False, 1.5, '2', ' 0.25 ', 'abc'], dtype=object)
+        hours = _coerce_hours(values)
+        self.assertTrue(hours[[0, 1, 5]].isna().all())
+        self.assertEqual(list(hours[[2, 3, 4]]), [1.5, 2.0, 0.25])
+        self.assertTrue(_coerce_hours(pd.Series([True, False])).isna().all())
+
+
+if __name__ == '__main__':
+    unittest.main()
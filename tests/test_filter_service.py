@@ -0,0 +1,110 @@
+"""Tests for FilterService against a fake Jira REST API."""
+
+import json
+import unittest
+
+import requests
+
+from src.services.filter_service import FilterService
+
+FAVOURITES = [
+    {'id': 1, 'name': 'Mine', 'jql': 'assignee = currentUser()'},
+    {'id': 2, 'name': 'Empty', 'jql': ''},
+]
+FILTERS = {
+    '2': 'project = EMPTY',
+    '3': 'project = OTHER',
+    '5': 'project = A order by created DESC',
+    '6': 'summary ~ "ORDER" ORDER BY priority DESC, key ASC',
+}
+
+
+def _response(body, status=200):
+    response = requests.Response()
+    response.status_code = status
+    response._content = json.dumps(body).encode()
+    response.headers['Content-Type'] = 'application/json'
+    response.encoding = 'utf-8'
+    return response
+
+
+class FakeAuth:
+    """Stands in for JiraAuth: serves favourite and single filters, recording requests."""
+    
+    def __init__(self):
+        self.requests = []
+    
+    def _make_request(self, method, endpoint, **kwargs):
+        self.requests.append(endpoint)
+        if endpoint == '/filter/favourite':
+            return _response(FAVOURITES)
+        filter_id = endpoint.rsplit('/', 1)[1]
+        if filter_id in FILTERS:
+            return _response({'id': filter_id, 'jql': FILTERS[filter_id]})
+        raise requests.exceptions.HTTPError('404', response=_response({'errorMessages': ['Not found']}, 404))
+
+
+class TestFilterCaches(unittest.TestCase):
+    """Favourites and resolved filter JQL are fetched once and reused."""
+    
+    def setUp(self):
+        self.auth = FakeAuth()
+        self.service = FilterService(self.auth)
+    
+    def test_favourites_reused_within_ttl(self):
+        first = self.service.list_filters()
+        self.assertEqual(self.service.list_filters(), first)
+        self.assertEqual(self.auth.requests, ['/filter/favourite'])
+        
+        self.service.FAVORITES_TTL = 0
+        self.service.list_filters()
+        self.assertEqual(self.auth.requests, ['/filter/favourite'] * 2)
+    
+    def test_filter_jql_cached(self):
+        self.assertEqual(self.service.get_filter_jql('1'), 'assignee = currentUser()')
+        self.assertEqual(self.service.get_filter_jql('3'), 'project = OTHER')
+        self.assertEqual(self.service.get_filter_jql('3'), 'project = OTHER')
+        self.assertEqual(self.auth.requests, ['/filter/favourite', '/filter/3'])
+    
+    def test_filter_jqls_fetches_each_missing_filter_once(self):
+        jqls = self.service.get_filter_jqls(['1', '2', '3', '3', '4'])
+        self.assertEqual(jqls, {'1': 'assignee = currentUser()', '2': 'project = EMPTY', '3': 'project = OTHER'})
+        self.assertEqual(sorted(self.auth.requests), ['/filter/2', '/filter/3', '/filter/4', '/filter/favourite'])
+        
+        self.auth.requests.clear()
+        self.assertEqual(self.service.get_filter_jqls(['2', '3']), {'2': 'project = EMPTY', '3': 'project = OTHER'})
+        self.assertEqual(self.auth.requests, [])
+    
+    def test_invalidate_cache(self):
+        self.service.get_filter_jql('3')
+        self.service.invalidate_cache()
+        self.service.get_filter_jql('3')
+        self.assertEqual(self.auth.requests, ['/filter/favourite', '/filter/3'] * 2)
+
+
+
+class TestCombineFiltersJql(unittest.TestCase):
+    """ORDER BY clauses are moved behind the OR-combined conditions."""
+    
+    def setUp(self):
+        self.service = FilterService(FakeAuth())
+    
+    def test_without_order_by(self):
+        self.assertEqual(
+            self.service.combine_filters_jql(['1', '3']),
+            '(assignee = currentUser()) OR (project = OTHER)',
+        )
+    
+    def test_first_order_by_kept(self):
+        self.assertEqual(
+            self.service.combine_filters_jql(['3', '6', '5']),
+            '(project = OTHER) OR (summary ~ "ORDER") OR (project = A) ORDER BY priority DESC, key ASC',
+        )
+    
+    def test_unknown_filters_skipped(self):
+        self.assertEqual(self.service.combine_filters_jql(['4', '5']), '(project = A) order by created DESC')
+        self.assertIsNone(self.service.combine_filters_jql(['4']))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+"""Tests for the parsing and formatting helpers."""
+
+import unittest
+from datetime import date, datetime
+from decimal import Decimal
+
+from src.utils.formatters import parse_date, parse_time_hours
+from src.utils.validators import validate_date
+
+
+class TestParseTimeHours(unittest.TestCase):
+    """parse_time_hours keeps the float-normalized representation for valid input."""
+    
+    def test_normalized_representation(self):
+        cases = {'1.50': '1.5', '1e1': '10.0', ' 2 ': '2.0', '.5': '0.5', '0.25': '0.25'}
+        for text, expected in cases.items():
+            self.assertEqual(str(parse_time_hours(text)), expected, text)
+    
+    def test_numbers(self):
+        self.assertEqual(parse_time_hours(2.5), Decimal('2.5'))
+        self.assertEqual(str(parse_time_hours(3)), '3.0')
+    
+    def test_rejects_non_numeric_text(self):
+        for text in ['', 'abc', '1,5', '1_0', 'inf', 'nan', '2h']:
+            with self.assertRaises(ValueError, msg=text):
+                parse_time_hours(text)
+        with self.assertRaises(ValueError):
+            parse_time_hours(None)
+
+
+
+class TestParseDate(unittest.TestCase):
+    """The zero-padded fast path accepts exactly what strptime('%Y-%m-%d') accepts."""
+    
+    def test_matches_strptime(self):
+        for text in ['2024-01-05', '2024-02-29', '2023-02-29', '2024-13-01', '2024-1-5', '2024-01-5',
+                     ' 2024-01-05', '2024-01-05 ', '2024-01', '2024', '20240105', '2024/01/05',
+                     '\u0662\u0660\u0662\u0664-01-05', '2024-01-05T10:00', '']:
+            try:
+                expected = datetime.strptime(text, '%Y-%m-%d').date()
+            except ValueError:
+                expected = None
+            if expected is None:
+                with self.assertRaises(ValueError, msg=text):
+                    parse_date(text)
+            else:
+                self.assertEqual(parse_date(text), expected, text)
+            self.assertEqual(validate_date(text), expected is not None, text)
+    
+    def test_fast_path(self):
+        self.assertEqual(parse_date('0999-12-31'), date(999, 12, 31))
+    
+    def test_rejects_non_strings(self):
+        with self.assertRaises(ValueError):
+            parse_date(None)
+
+
+if __name__ == '__main__':
+    unittest.main()
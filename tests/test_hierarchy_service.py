@@ -0,0 +1,150 @@
+"""Tests for hierarchical grouping of issues."""
+
+import random
+import unittest
+from typing import Dict, List, Optional
+
+from src.models.issue import Issue
+from src.services.hierarchy_service import HierarchyService
+
+ISSUE_TYPES = ['Epic', 'Story', 'Task', 'Bug', 'Sub-task']
+
+
+def _reference_epic_path(issue: Issue, issue_map: Dict[str, Issue], visited: Optional[set] = None) -> List[str]:
+    """Original recursive path walk, kept as the reference for group_by_hierarchy."""
+    if visited is None:
+        visited = set()
+    if issue.key in visited:
+        return []
+    visited.add(issue.key)
+    
+    if issue.issue_type.lower() == 'epic':
+        return [issue.key]
+    
+    if issue.parent_epic_key and issue.parent_epic_key in issue_map:
+        if issue_map[issue.parent_epic_key].issue_type.lower() == 'epic':
+            if not issue.parent_key:
+                return [issue.parent_epic_key, issue.key]
+            if issue.parent_key in issue_map:
+                parent_path = _reference_epic_path(issue_map[issue.parent_key], issue_map, visited.copy())
+                if parent_path:
+                    return parent_path + [issue.key]
+    
+    if issue.parent_key and issue.parent_key in issue_map:
+        parent_path = _reference_epic_path(issue_map[issue.parent_key], issue_map, visited)
+        if parent_path:
+            return parent_path + [issue.key]
+    
+    if issue.parent_epic_key:
+        return [issue.parent_epic_key]
+    
+    return []
+
+
+def _reference_groups(issues: List[Issue]) -> Dict[str, List[int]]:
+    """Group issue positions the way the original two-pass implementation did."""
+    issue_map = {issue.key: issue for issue in issues}
+    groups: Dict[str, List[int]] = {}
+    for pos, issue in enumerate(issues):
+        if issue.issue_type.lower() == 'epic':
+            groups.setdefault(issue.key, [pos])
+    for pos, issue in enumerate(issues):
+        if issue.issue_type.lower() == 'epic':
+            continue
+        path = _reference_epic_path(issue, issue_map)
+        epic_key = path[0] if path else None
+        if not (epic_key in issue_map and issue_map[epic_key].issue_type.lower() == 'epic'):
+            epic_key = f"__orphan__{issue.project or 'unknown'}"
+        groups.setdefault(epic_key, []).append(pos)
+    return {key: sorted(positions) for key, positions in groups.items()}
+
+
+def _groups(issues: List[Issue]) -> Dict[str, List[int]]:
+    """Group issue positions with HierarchyService.group_by_hierarchy."""
+    positions = {id(issue): pos for pos, issue in enumerate(issues)}
+    groups = HierarchyService.group_by_hierarchy(issues)
+    result = {}
+    for key, group in groups.items():
+        # get_all_issues() skips subtasks whose parent is not in the group, so collect all levels
+        members = [group.epic] if group.epic else []
+        members += group.stories_tasks
+        for subtasks in group.subtasks_map.values():
+            members += subtasks
+        result[key] = sorted(positions[id(issue)] for issue in members)
+    return result
+
+
+def _issue(key: str, issue_type: str, parent_key: Optional[str] = None,
+           parent_epic_key: Optional[str] = None) -> Issue:
+    return Issue(key=key, summary=f"{issue_type} {key}", type=issue_type,
+                 parent_key=parent_key, parent_epic_key=parent_epic_key)
+
+
+def _random_issues(rnd: random.Random, pool: List[str], count: int) -> List[Issue]:
+    return [
+        _issue(
+            rnd.choice(pool),
+            rnd.choice(ISSUE_TYPES),
+            rnd.choice(pool) if rnd.random() < 0.5 else None,
+            rnd.choice(pool) if rnd.random() < 0.4 else None,
+        )
+        for _ in range(count)
+    ]
+
+
+class TestGroupByHierarchy(unittest.TestCase):
+    """group_by_hierarchy must place every issue where the original implementation did."""
+    
+    def test_epic_story_subtask(self):
+        issues = [
+            _issue('PROJ-3', 'Sub-task', parent_key='PROJ-2'),
+            _issue('PROJ-2', 'Story', parent_epic_key='PROJ-1'),
+            _issue('PROJ-1', 'Epic'),
+            _issue('PROJ-4', 'Task'),
+        ]
+        groups = HierarchyService.group_by_hierarchy(issues)
+        
+        self.assertEqual(list(groups), ['PROJ-1', '__orphan__unknown'])
+        self.assertEqual([i.key for i in groups['PROJ-1'].get_all_issues()], ['PROJ-1', 'PROJ-2', 'PROJ-3'])
+        self.assertEqual([i.key for i in groups['__orphan__unknown'].get_all_issues()], ['PROJ-4'])
+    
+    def test_parent_cycle(self):
+        issues = [
+            _issue('PROJ-1', 'Task', parent_key='PROJ-2', parent_epic_key='PROJ-9'),
+            _issue('PROJ-2', 'Task', parent_key='PROJ-1'),
+            _issue('PROJ-9', 'Epic'),
+        ]
+        self.assertEqual(_groups(issues), _reference_groups(issues))
+    
+    def test_duplicate_keys(self):
+        # The Task shares its key with an Epic, so it must not reuse the Bug's resolved path
+        issues = [
+            _issue('P-1', 'Bug', parent_key='P-3'),
+            _issue('P-3', 'Epic'),
+            _issue('P-1', 'Task', parent_epic_key='P-2'),
+            _issue('P-1', 'Epic'),
+        ]
+        groups = _groups(issues)
+        
+        self.assertEqual(groups, _reference_groups(issues))
+        self.assertEqual(groups['__orphan__unknown'], [2])
+    
+    def test_random_hierarchies_unique_keys(self):
+        rnd = random.Random(13)
+        for _ in range(2000):
+            count = rnd.randint(1, 12)
+            pool = [f'P-{n}' for n in range(count + 2)]
+            issues = list({issue.key: issue for issue in _random_issues(rnd, pool, count)}.values())
+            self.assertEqual(_groups(issues), _reference_groups(issues), issues)
+    
+    def test_random_hierarchies_repeated_keys(self):
+        rnd = random.Random(7)
+        for _ in range(2000):
+            count = rnd.randint(1, 8)
+            pool = [f'P-{n}' for n in range(count // 2 + 1)]
+            issues = _random_issues(rnd, pool, count)
+            self.assertEqual(_groups(issues), _reference_groups(issues), issues)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,49 @@
+"""Tests for the persistent issue cache."""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.services.issue_cache import IssueCache
+
+
+def _issue(key, updated, summary='s'):
+    return {'key': key, 'fields': {'updated': updated, 'summary': summary}}
+
+
+class TestIssueCache(unittest.TestCase):
+    """Cached payloads are only returned while `updated` and the field list match."""
+    
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = str(Path(tmp.name) / 'issues.sqlite')
+        self.cache = IssueCache(self.path)
+        self.cache.store([_issue('P-1', 'u1'), _issue('P-2', 'u2')], 'summary,updated')
+    
+    def test_fresh_payloads(self):
+        self.assertEqual(
+            self.cache.get_fresh({'P-1': 'u1', 'P-2': 'u2', 'P-3': 'u3'}, 'summary,updated'),
+            {'P-1': _issue('P-1', 'u1'), 'P-2': _issue('P-2', 'u2')},
+        )
+    
+    def test_updated_or_fields_mismatch(self):
+        self.assertEqual(self.cache.get_fresh({'P-1': 'u1-new', 'P-2': 'u2'}, 'summary,updated'),
+                         {'P-2': _issue('P-2', 'u2')})
+        self.assertEqual(self.cache.get_fresh({'P-1': 'u1'}, 'worklog,updated'), {})
+    
+    def test_store_replaces_and_persists(self):
+        self.cache.store([_issue('P-1', 'u1b', 'changed')], 'summary,updated')
+        reopened = IssueCache(self.path)
+        self.assertEqual(reopened.get_fresh({'P-1': 'u1b'}, 'summary,updated'),
+                         {'P-1': _issue('P-1', 'u1b', 'changed')})
+    
+    def test_many_keys(self):
+        # More keys than SQLite binds in one statement
+        self.cache.store([_issue(f'M-{n}', 'u') for n in range(1500)], 'summary,updated')
+        fresh = self.cache.get_fresh({f'M-{n}': 'u' for n in range(1500)}, 'summary,updated')
+        self.assertEqual(len(fresh), 1500)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,366 @@
+"""Tests for JiraService against a fake Jira REST API."""
+
+import json
+import re
+import tempfile
+import types
+import unittest
+from calendar import monthrange
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from pathlib import Path
+from unittest import mock
+
+import requests
+
+from src.models.worklog import WorkLogUpdate
+from src.services import jira_service
+from src.services.jira_service import JiraService, _and_jql, _parse_jira_dt
+
+
+def _response(body, status=200):
+    response = requests.Response()
+    response.status_code = status
+    response._content = json.dumps(body).encode()
+    response.headers['Content-Type'] = 'application/json'
+    response.encoding = 'utf-8'
+    return response
+
+
+def _html_response():
+    response = requests.Response()
+    response.status_code = 200
+    response._content = b'<html><body>Login</body></html>'
+    response.headers['Content-Type'] = 'text/html'
+    response.encoding = 'utf-8'
+    return response
+
+
+def _issues(count):
+    return [{'key': f'P-{n}', 'fields': {'updated': '2024-01-01T00:00:00.000+0000'}} for n in range(1, count + 1)]
+
+
+def _worklog(worklog_id, started='2024-01-05T10:00:00.000+0000', seconds=3600):
+    return {'id': str(worklog_id), 'started': started, 'timeSpentSeconds': seconds,
+            'author': {'accountId': 'me', 'displayName': 'Me'}}
+
+
+class FakeJira:
+    """Stands in for JiraAuth, serving /search from a list of raw issues.
+    
+    Pages are capped at page_cap issues like Jira Cloud caps maxResults, and
+    `key in (...)` searches return only the listed issues. Other endpoints are
+    answered from the `worklogs` and `routes` dictionaries.
+    """
+    
+    def __init__(self, issues=(), page_cap=1000, issue_cache=None):
+        self.issues = list(issues)
+        self.page_cap = page_cap
+        self.worklogs = {}  # issue key -> complete worklog list for GET /issue/{key}/worklog
+        self.routes = {}  # (method, endpoint) -> callable(kwargs) returning a response
+        self.requests = []
+        self.settings = types.SimpleNamespace(
+            jira_issue_cache=issue_cache, jira_epic_link_field_id=None, jira_epic_name_field_id=None
+        )
+    
+    def _make_request(self, method, endpoint, **kwargs):
+        self.requests.append((method, endpoint, kwargs))
+        if (method, endpoint) in self.routes:
+            return self.routes[(method, endpoint)](kwargs)
+        if endpoint == '/search':
+            return _response(self._search(kwargs['json']))
+        match = re.fullmatch(r'/issue/([^/]+)/worklog', endpoint)
+        if match and match[1] in self.worklogs:
+            worklogs = self.worklogs[match[1]]
+            return _response({'worklogs': worklogs, 'total': len(worklogs)})
+        raise requests.exceptions.HTTPError('404', response=_response({'errorMessages': ['Not found']}, 404))
+    
+    def _search(self, body):
+        issues = self.issues
+        if body['jql'].startswith('key in ('):
+            keys = {re.sub(r'\\(.)', r'\1', key) for key in re.findall(r'"((?:[^"\\]|\\.)*)"', body['jql'])}
+            issues = [issue for issue in issues if issue['key'] in keys]
+        start_at = body.get('startAt', 0)
+        size = min(body.get('maxResults', 50), self.page_cap)
+        return {'issues': issues[start_at:start_at + size], 'total': len(issues), 'startAt': start_at}
+    
+    def searches(self):
+        """Bodies of the /search requests made so far."""
+        return [kwargs['json'] for method, endpoint, kwargs in self.requests if endpoint == '/search']
+
+
+class TestInlineWorklogs(unittest.TestCase):
+    """Worklogs come from the search results unless Jira truncated the inline list."""
+    
+    def setUp(self):
+        complete = {'worklogs': [_worklog(1), _worklog(2)], 'total': 2}
+        truncated = {'worklogs': [_worklog(3), _worklog(4)], 'total': 3}
+        self.jira = FakeJira([
+            {'key': 'P-1', 'fields': {'worklog': complete}},
+            {'key': 'P-2', 'fields': {'worklog': truncated}},
+            {'key': 'P-3', 'fields': {}},
+            {'key': 'P-4', 'fields': {'worklog': {'worklogs': [], 'total': 0}}},
+        ])
+        self.jira.worklogs = {'P-2': [_worklog(3), _worklog(4), _worklog(5)], 'P-3': [_worklog(6)]}
+        self.service = JiraService(self.jira)
+    
+    def _worklog_ids(self, **kwargs):
+        worklogs = self.service.iter_worklogs_from_jql('project = P', filter_by_current_user=False, **kwargs)
+        return [(wl.issue_key, wl.worklog_id) for wl in worklogs]
+    
+    def test_only_truncated_issues_refetched(self):
+        self.assertEqual(
+            self._worklog_ids(include_all_issues=False),
+            [('P-1', '1'), ('P-1', '2'), ('P-2', '3'), ('P-2', '4'), ('P-2', '5'), ('P-3', '6')],
+        )
+        fetched = sorted(endpoint for method, endpoint, kwargs in self.jira.requests if endpoint != '/search')
+        self.assertEqual(fetched, ['/issue/P-2/worklog', '/issue/P-3/worklog'])
+    
+    def test_unreadable_and_empty_issues_reported(self):
+        del self.jira.worklogs['P-3']
+        self.assertEqual(
+            self._worklog_ids(include_all_issues=True),
+            [('P-1', '1'), ('P-1', '2'), ('P-2', '3'), ('P-2', '4'), ('P-2', '5'), ('P-3', ''), ('P-4', '')],
+        )
+
+
+
+class TestParseJiraDt(unittest.TestCase):
+    """The fixed-width fast path agrees with datetime.fromisoformat."""
+    
+    def test_fixed_width(self):
+        self.assertEqual(
+            _parse_jira_dt('2024-01-31T09:30:15.123+0130'),
+            datetime(2024, 1, 31, 9, 30, 15, 123000, tzinfo=timezone(timedelta(hours=1, minutes=30))),
+        )
+        self.assertEqual(
+            _parse_jira_dt('2024-01-31T09:30:15.000-0500').utcoffset(),
+            timedelta(hours=-5),
+        )
+    
+    def test_matches_fromisoformat(self):
+        for value in ['2024-02-29T23:59:59.999+0000', '1999-12-31T00:00:00.001-1200',
+                      '2024-01-31T09:30:00Z', '2024-01-31T09:30:00+01:00', '2024-01-31T09:30:00.5+01:00']:
+            self.assertEqual(_parse_jira_dt(value), datetime.fromisoformat(value), value)
+    
+    def test_invalid(self):
+        for value in ['2024-02-30T09:30:00.000+0000', '2024-01-31T25:00:00.000+0000', 'garbage', '']:
+            with self.assertRaises(ValueError, msg=value):
+                _parse_jira_dt(value)
+
+
+
+class TestIterSearchPages(unittest.TestCase):
+    """Paging follows the page size Jira actually returns."""
+    
+    def test_all_pages_in_order(self):
+        jira = FakeJira(_issues(7), page_cap=2)
+        keys = [issue['key'] for issue in JiraService(jira)._iter_search_pages('project = P', ['updated'])]
+        
+        self.assertEqual(keys, [f'P-{n}' for n in range(1, 8)])
+        self.assertEqual(sorted(body['startAt'] for body in jira.searches()), [0, 2, 4, 6])
+        self.assertEqual({body['jql'] for body in jira.searches()}, {'project = P'})
+    
+    def test_single_page(self):
+        jira = FakeJira(_issues(3))
+        self.assertEqual(len(list(JiraService(jira)._iter_search_pages('project = P', ['updated']))), 3)
+        self.assertEqual(len(jira.searches()), 1)
+    
+    def test_html_page_stops(self):
+        jira = FakeJira(_issues(7), page_cap=2)
+        jira.routes[('POST', '/search')] = lambda kwargs: (
+            _html_response() if kwargs['json']['startAt'] == 4 else _response(jira._search(kwargs['json']))
+        )
+        keys = [issue['key'] for issue in JiraService(jira)._iter_search_pages('project = P', ['updated'])]
+        self.assertEqual(keys, ['P-1', 'P-2', 'P-3', 'P-4'])
+
+
+
+class TestGetIssuesByKeys(unittest.TestCase):
+    """Keys are looked up in chunks of `key in (...)` searches."""
+    
+    def setUp(self):
+        self.jira = FakeJira(_issues(5) + [{'key': 'Q-"1', 'fields': {}}], page_cap=2)
+        self.service = JiraService(self.jira)
+    
+    @mock.patch.object(jira_service, 'KEY_LOOKUP_CHUNK_SIZE', 3)
+    def test_chunked_and_deduplicated(self):
+        issues = self.service.get_issues_by_keys(['P-1', 'P-2', 'P-1', 'P-3', 'P-4', 'NOPE-1'], fields=['key'])
+        
+        self.assertEqual(sorted(issues), ['P-1', 'P-2', 'P-3', 'P-4'])
+        # Two chunks; the first one needs a second page because Jira caps pages at 2
+        self.assertEqual(
+            [(body['jql'], body['startAt']) for body in self.jira.searches()],
+            [('key in ("P-1", "P-2", "P-3")', 0), ('key in ("P-1", "P-2", "P-3")', 2),
+             ('key in ("P-4", "NOPE-1")', 0)],
+        )
+        self.assertTrue(all(body['fields'] == ['key'] for body in self.jira.searches()))
+    
+    def test_quotes_escaped(self):
+        self.assertEqual(list(self.service.get_issues_by_keys(['Q-"1'])), ['Q-"1'])
+        self.assertEqual(self.jira.searches()[0]['jql'], 'key in ("Q-\\"1")')
+        self.assertNotIn('fields', self.jira.searches()[0])
+    
+    @mock.patch.object(jira_service, 'KEY_LOOKUP_CHUNK_SIZE', 2)
+    def test_failed_chunk_skipped(self):
+        def search(kwargs):
+            if 'P-3' in kwargs['json']['jql']:
+                raise requests.exceptions.ConnectionError('reset')
+            return _response(self.jira._search(kwargs['json']))
+        self.jira.routes[('POST', '/search')] = search
+        
+        self.assertEqual(sorted(self.service.get_issues_by_keys(['P-1', 'P-2', 'P-3', 'P-4', 'P-5'])),
+                         ['P-1', 'P-2', 'P-5'])
+
+
+
+class TestSearchIssuesCached(unittest.TestCase):
+    """With JIRA_ISSUE_CACHE set, only new or changed issues are fetched in full."""
+    
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.cache_path = str(Path(tmp.name) / 'issues.sqlite')
+        self.issues = _issues(5)
+    
+    def _search(self, fail_lookup=False):
+        jira = FakeJira(self.issues, issue_cache=self.cache_path)
+        if fail_lookup:
+            def search(kwargs):
+                if kwargs['json']['jql'].startswith('key in ('):
+                    raise requests.exceptions.ConnectionError('reset')
+                return _response(jira._search(kwargs['json']))
+            jira.routes[('POST', '/search')] = search
+        return JiraService(jira)._search_issues_cached('project = P', ['summary', 'updated']), jira
+    
+    def test_only_changed_issues_fetched(self):
+        first, jira = self._search()
+        self.assertEqual(first, self.issues)
+        self.assertEqual([body['fields'] for body in jira.searches()], [['updated'], ['summary', 'updated']])
+        
+        self.issues[1] = {'key': 'P-2', 'fields': {'updated': '2024-02-01T00:00:00.000+0000'}}
+        second, jira = self._search()
+        self.assertEqual(second, self.issues)
+        self.assertEqual([body['jql'] for body in jira.searches()], ['project = P', 'key in ("P-2")'])
+    
+    def test_failed_lookup_falls_back_to_full_search(self):
+        self._search()
+        self.issues.append({'key': 'P-6', 'fields': {'updated': '2024-02-01T00:00:00.000+0000'}})
+        result, jira = self._search(fail_lookup=True)
+        
+        self.assertEqual(result, self.issues)
+        self.assertEqual([body['fields'] for body in jira.searches()][-1], ['summary', 'updated'])
+    
+    def test_without_cache(self):
+        self.cache_path = None
+        result, jira = self._search()
+        self.assertEqual(result, self.issues)
+        self.assertEqual(len(jira.searches()), 1)
+
+
+
+class TestWorklogTimeRange(unittest.TestCase):
+    """Worklogs are range-checked on their own wall-clock time, as text when fixed-width."""
+    
+    def test_current_month(self):
+        now = datetime.now()
+        month = f'{now.year:04d}-{now.month:02d}'
+        last_day = monthrange(now.year, now.month)[1]
+        before = datetime(now.year, now.month, 1) - timedelta(days=1)
+        after = datetime(now.year, now.month, last_day) + timedelta(days=1)
+        worklogs = [
+            _worklog(1, f'{month}-01T00:30:00.000+0500'),  # previous month in UTC, inside in its own offset
+            _worklog(2, f'{month}-{last_day:02d}T23:30:00.000-0800'),
+            _worklog(3, f'{before:%Y-%m-%d}T23:59:59.999+0000'),
+            _worklog(4, f'{after:%Y-%m-%d}T00:00:00.000+0000'),
+            _worklog(5, f'{month}-02T10:00:00+01:00'),  # not fixed-width: parsed, then checked
+            _worklog(6, f'{before:%Y-%m-%d}T10:00:00Z'),
+            _worklog(7, 'garbage'),
+            _worklog(8, f'{month}-{last_day:02d}T23:59:59.000+0000'),
+        ]
+        jira = FakeJira([{'key': 'P-1', 'fields': {'worklog': {'worklogs': worklogs, 'total': len(worklogs)}}}])
+        
+        found = JiraService(jira).iter_worklogs_from_jql(
+            'project = P', include_all_issues=False, filter_by_current_user=False, time_range='current'
+        )
+        self.assertEqual([wl.worklog_id for wl in found], ['1', '2', '5', '8'])
+
+
+
+class TestAndJql(unittest.TestCase):
+    """Extra conditions go before a trailing ORDER BY."""
+    
+    def test_and_jql(self):
+        cases = [
+            ('project = P', '(project = P) AND x = 1'),
+            ('project = P ORDER BY created DESC', '(project = P) AND x = 1 ORDER BY created DESC'),
+            ('project = P order by rank', '(project = P) AND x = 1 order by rank'),
+            ('a = 1 OR b = 2 ORDER BY priority DESC, key', '(a = 1 OR b = 2) AND x = 1 ORDER BY priority DESC, key'),
+            ('ORDER BY created', 'x = 1 ORDER BY created'),
+            ('summary ~ "ORDER"', '(summary ~ "ORDER") AND x = 1'),
+            ('  ', 'x = 1'),
+        ]
+        for jql, expected in cases:
+            self.assertEqual(_and_jql(jql, 'x = 1'), expected, jql)
+    
+    def test_worklog_search_narrowed_only_without_empty_issues(self):
+        jira = FakeJira()
+        jira.routes[('GET', '/myself')] = lambda kwargs: _response({'accountId': 'me', 'name': 'me'})
+        service = JiraService(jira)
+        
+        list(service.iter_worklogs_from_jql('project = P ORDER BY key', include_all_issues=True))
+        list(service.iter_worklogs_from_jql('project = P ORDER BY key', include_all_issues=False))
+        list(service.iter_worklogs_from_jql('project = P', include_all_issues=False, filter_by_current_user=False))
+        self.assertEqual(
+            [body['jql'] for body in jira.searches()],
+            ['project = P ORDER BY key', '(project = P) AND worklogAuthor = currentUser() ORDER BY key', 'project = P'],
+        )
+        
+        list(service.iter_worklogs_from_jql('project = P', include_all_issues=False, filter_by_current_user=False,
+                                            time_range='current'))
+        self.assertRegex(
+            jira.searches()[-1]['jql'],
+            r'^\(project = P\) AND worklogDate >= "\d{4}-\d{2}-\d{2}" AND worklogDate <= "\d{4}-\d{2}-\d{2}"$',
+        )
+
+
+
+def _update(issue_key, worklog_id):
+    return WorkLogUpdate(worklog_id=worklog_id, issue_key=issue_key, original_time_hours=Decimal('1'),
+                         new_time_hours=Decimal('2'), work_date=date(2024, 1, 5))
+
+
+class TestFindExistingWorklogs(unittest.TestCase):
+    """Worklog IDs are checked in bulk, with per-issue reads where that cannot answer."""
+    
+    def setUp(self):
+        self.jira = FakeJira([{'key': 'P-1', 'id': '101', 'fields': {}}, {'key': 'P-2', 'id': '102', 'fields': {}}])
+        self.jira.worklogs = {'P-1': [_worklog(5)], 'P-2': [_worklog(7)], 'OLD-1': [_worklog(9)]}
+        self.listed = []
+        
+        def worklog_list(kwargs):
+            self.listed.append(kwargs['json']['ids'])
+            return _response([{'id': 5, 'issueId': 101}, {'id': 7, 'issueId': 102}, {'id': 9, 'issueId': 103}])
+        self.jira.routes[('POST', '/worklog/list')] = worklog_list
+        self.updates = [_update('P-1', '5'), _update('P-1', '6'), _update('P-2', '7'), _update('OLD-1', '9')]
+    
+    def _existing(self):
+        return JiraService(self.jira)._find_existing_worklogs(self.updates, None, None)
+    
+    def _worklog_reads(self):
+        return sorted(endpoint for method, endpoint, kwargs in self.jira.requests if endpoint.endswith('/worklog'))
+    
+    def test_bulk_lookup_with_fallback_for_unresolved_keys(self):
+        # OLD-1 was moved: the key search does not return it, so its worklogs are read directly
+        self.assertEqual(self._existing(), {('P-1', '5'), ('P-2', '7'), ('OLD-1', '9')})
+        self.assertEqual(self.listed, [[5, 6, 7]])
+        self.assertEqual(self._worklog_reads(), ['/issue/OLD-1/worklog'])
+    
+    def test_bulk_endpoint_unavailable(self):
+        del self.jira.routes[('POST', '/worklog/list')]
+        self.assertEqual(self._existing(), {('P-1', '5'), ('P-2', '7'), ('OLD-1', '9')})
+        self.assertEqual(self._worklog_reads(), ['/issue/OLD-1/worklog', '/issue/P-1/worklog', '/issue/P-2/worklog'])
+
+
+if __name__ == '__main__':
+    unittest.main()
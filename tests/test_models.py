@@ -0,0 +1,20 @@
+"""Tests for the Jira data models."""
+
+import unittest
+
+from src.models.issue import Issue
+
+
+class TestIssue(unittest.TestCase):
+    
+    def test_issue_type_lower_follows_copies(self):
+        epic = Issue(key='PROJ-1', summary='Epic', type='Epic')
+        self.assertEqual(epic.issue_type_lower, 'epic')
+        
+        story = epic.model_copy(update={'issue_type': 'Story'})
+        self.assertEqual(story.issue_type_lower, 'story')
+        self.assertEqual(epic.issue_type_lower, 'epic')
+
+
+if __name__ == '__main__':
+    unittest.main()